@@ -1,10 +1,18 @@
 from importlib.metadata import version, PackageNotFoundError
 
-from .exceptions import ArrException, ConnectionFailure, Excluded, Exists, Invalid, NotFound, Unauthorized
+from .exceptions import ArrException, CircuitOpen, ConnectionFailure, DeadlineExceeded, Excluded, Exists, Invalid, LazyLoadWarning, NotFound, TooManyLazyLoads, Unauthorized
 from .objs.simple import MetadataProfile, RemotePathMapping, RootFolder, UnmappedFolder, Season
 from .objs.reload import QualityProfile, LanguageProfile, SystemStatus, Tag, Movie, Series
-from .apis.sonarr import SonarrAPI
-from .apis.radarr import RadarrAPI
+from .raws.breaker import CircuitBreaker
+from .profiling import LazyLoads, Profile
+from .raws.capabilities import CapabilityCache
+from .raws.deadline import Deadline
+from .raws.limits import ConcurrencyLimiter, RateLimiter
+from .raws.metrics import Metrics
+from .raws.retry import RetryPolicy
+from .raws.transport import RecordingTransport, ReplayTransport, Transport
+from .apis.sonarr import SonarrAPI, AsyncSonarrAPI
+from .apis.radarr import RadarrAPI, AsyncRadarrAPI
 from .apis.lidarr import LidarrAPI
 from .apis.readarr import ReadarrAPI
 
@@ -23,6 +31,8 @@ __license__ = 'MIT License'
 __all__ = [
     "RadarrAPI",
     "SonarrAPI",
+    "AsyncRadarrAPI",
+    "AsyncSonarrAPI",
     "QualityProfile",
     "LanguageProfile",
     "MetadataProfile",
@@ -34,11 +44,27 @@ __all__ = [
     "Movie",
     "Series",
     "Season",
+    "RetryPolicy",
+    "RateLimiter",
+    "ConcurrencyLimiter",
+    "CapabilityCache",
+    "CircuitBreaker",
+    "Deadline",
+    "Metrics",
+    "Profile",
+    "LazyLoads",
+    "Transport",
+    "RecordingTransport",
+    "ReplayTransport",
     "ArrException",
+    "CircuitOpen",
     "ConnectionFailure",
+    "DeadlineExceeded",
     "Excluded",
     "Exists",
     "Invalid",
+    "LazyLoadWarning",
     "NotFound",
+    "TooManyLazyLoads",
     "Unauthorized"
 ]
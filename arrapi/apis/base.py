@@ -1,16 +1,121 @@
+import asyncio
+
 from abc import ABC, abstractmethod
-from arrapi import Invalid, SystemStatus, QualityProfile, MetadataProfile, RootFolder, Tag, RemotePathMapping
-from typing import List
+from arrapi import Invalid, SystemStatus, QualityProfile, LanguageProfile, MetadataProfile, RootFolder, Tag, RemotePathMapping
+from typing import List, Optional, Union
+
+from arrapi.objs.reload import Command, ReloadObj
+from arrapi.profiling import LazyLoads, Profile, profile_methods
+from arrapi.raws.breaker import CircuitBreaker
+from arrapi.raws.metrics import Metrics
+from arrapi.raws.pool import ConnectionStats
 
-from arrapi.objs.reload import Command
+_resolvable = {
+    "tags": (Tag, "get_tag"),
+    "qualityProfile": (QualityProfile, "get_qualityProfile"),
+    "profile": (QualityProfile, "get_qualityProfile"),
+    "languageProfile": (LanguageProfile, "get_languageProfile")
+}
 
 
 class BaseAPI(ABC):
     @abstractmethod
     def __init__(self, raw):
         self._raw = raw
+        self._references = {}
+        self.raw_results = False
         self.apply_tags_options = ["add", "remove", "replace"]
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        profile_methods(cls)
+
+    @staticmethod
+    def profile() -> Profile:
+        """ Returns a :class:`~arrapi.profiling.Profile` recording the time every API method called while it's entered
+            spends on the network, decoding JSON, and building objects.
+
+            .. code-block:: python
+
+                with radarr.profile() as profile:
+                    radarr.all_movies()
+                print(profile.report())
+        """
+        return Profile()
+
+    @staticmethod
+    def lazy_loads(threshold: Optional[int] = None, action: str = "warn") -> LazyLoads:
+        """ Returns a :class:`~arrapi.profiling.LazyLoads` counting the partial objects reloaded because one of their
+            fields was read while it's entered, warning or raising once more than ``threshold`` are.
+
+            .. code-block:: python
+
+                with radarr.lazy_loads(threshold=100, action="raise"):
+                    for movie in radarr.all_movies():
+                        print([tag.label for tag in movie.tags])
+
+            Parameters:
+                threshold (Optional[int]): Number of lazy loads allowed, ``None`` only counts them.
+                action (str): What to do when the threshold is crossed. Valid options are warn or raise.
+        """
+        return LazyLoads(threshold=threshold, action=action)
+
+    @property
+    def connection_stats(self) -> ConnectionStats:
+        """ :class:`~arrapi.raws.pool.ConnectionStats` of the requests sent and connections opened. """
+        return self._raw.connection_stats
+
+    @property
+    def metrics(self) -> Optional[Metrics]:
+        """ :class:`~arrapi.raws.metrics.Metrics` of the requests sent or ``None`` when disabled. """
+        return self._raw.metrics
+
+    @property
+    def circuit_breaker(self) -> Optional[CircuitBreaker]:
+        """ :class:`~arrapi.raws.breaker.CircuitBreaker` of the Arr instance or ``None`` when not used. """
+        return self._raw.breaker
+
+    @property
+    def circuit_state(self) -> str:
+        """ State of the circuit breaker: ``closed``, ``open``, or ``half-open``. Always ``closed`` without one. """
+        return "closed" if self._raw.breaker is None else self._raw.breaker.state
+
+    def _reference(self, cls, obj_id):
+        """ Returns the partial object of the class and ID shared by every object referencing it (i.e. every Movie with
+            the Tag) so it's only loaded once. """
+        key = (cls, obj_id)
+        obj = self._references.get(key)
+        if obj is None:
+            obj = self._references.setdefault(key, cls(self, {"id": obj_id}))
+        return obj
+
+    def _forget(self, cls, obj_id):
+        """ Removes the shared object of the class and ID so objects loaded afterwards reference a new one. """
+        self._references.pop((cls, obj_id), None)
+
+    def _resolvers(self, fields):
+        """ Returns the class and raw API method listing the objects of each field given. """
+        loaders = {}
+        for field in fields or []:
+            if field not in _resolvable or not hasattr(self._raw, _resolvable[field][1]):
+                options = [f for f, (_, loader) in _resolvable.items() if hasattr(self._raw, loader)]
+                raise Invalid(f"Invalid field to resolve: '{field}' Options: {options}")
+            cls, loader = _resolvable[field]
+            loaders[cls] = loader
+        return loaders
+
+    def _fill_references(self, cls, items):
+        """ Loads the shared objects of the class from the list of them, creating the ones not referenced yet. """
+        for data in items:
+            obj = self._references.get((cls, data["id"]))
+            if obj is None:
+                obj = self._references.setdefault((cls, data["id"]), cls(self, data))
+            obj._reloaded(data)
+
+    def _is_raw(self, raw):
+        """ Returns if results should be the decoded items instead of objects, :attr:`raw_results` when raw is ``None``. """
+        return self.raw_results if raw is None else raw
+
     def _validate_options(self, title: str, value: str, options: List[str]):
         """ Validate the value given from the options given.
 
@@ -33,11 +138,12 @@ class BaseAPI(ABC):
         """ Checks to see if tags are valid and if create=True will create any tags not found. """
         if not isinstance(tags, list):
             tags = [tags]
+        tags = [tag["id"] if isinstance(tag, dict) else tag for tag in tags]
 
         if create is True:
             all_tag_labels = []
             all_tag_ids = []
-            for tag in self.all_tags():
+            for tag in self.all_tags(raw=False):
                 all_tag_labels.append(tag.label)
                 all_tag_ids.append(tag.id)
             for tag in tags:
@@ -47,7 +153,7 @@ class BaseAPI(ABC):
         all_tag_labels = {}
         all_tag_ids = []
         valid_tag_ids = []
-        for tag in self.all_tags():
+        for tag in self.all_tags(raw=False):
             all_tag_labels[tag.label] = tag.id
             all_tag_ids.append(tag.id)
         for tag in tags:
@@ -64,6 +170,34 @@ class BaseAPI(ABC):
         """ Validate Apply Tags options. """
         return self._validate_options("Apply Tags", apply_tags, self.apply_tags_options)
 
+    def _resolve(self, objs, loaders):
+        if objs:
+            for cls, loader in loaders.items():
+                self._fill_references(cls, getattr(self._raw, loader)())
+        return objs
+
+    def resolve(self, objs: List[ReloadObj], *fields: str) -> List[ReloadObj]:
+        """ Loads every :class:`~arrapi.objs.reload.Tag`, :class:`~arrapi.objs.reload.QualityProfile`, or
+            :class:`~arrapi.objs.reload.LanguageProfile` the objects reference with one request for each field instead of
+            one request for each partial object read.
+
+            .. code-block:: python
+
+                movies = radarr.resolve(radarr.all_movies(), "tags", "qualityProfile")
+                print({tag.label for movie in movies for tag in movie.tags})
+
+            Parameters:
+                objs (List[ReloadObj]): Objects to resolve the references of i.e. from :meth:`~arrapi.apis.radarr.RadarrAPI.all_movies`.
+                *fields (str): Fields to resolve. Valid options are tags, qualityProfile, profile (v2 Only), and languageProfile (Sonarr Only).
+
+            Returns:
+                List[ReloadObj]: The objects given.
+
+            Raises:
+                :class:`~arrapi.exceptions.Invalid`: When one of the fields given is invalid.
+        """
+        return self._resolve(objs, self._resolvers(fields))
+
     def get_tag(self, tag_id: int, detail: bool = False) -> Tag:
         """ Get a :class:`~arrapi.objs.reload.Tag` by its ID.
 
@@ -79,16 +213,18 @@ class BaseAPI(ABC):
         """
         return Tag(self, self._raw.get_tag_id(tag_id, detail=detail))
 
-    def all_tags(self, detail: bool = False) -> List[Tag]:
+    def all_tags(self, detail: bool = False, raw: Optional[bool] = None) -> List[Union[Tag, dict]]:
         """ Gets every :class:`~arrapi.objs.reload.Tag`.
 
             Parameters:
                 detail (bool): Get Tags with details.
+                raw (Optional[bool]): Return the decoded dictionaries instead of Tags. Defaults to :attr:`raw_results`.
 
             Returns:
-                List[:class:`~arrapi.objs.reload.Tag`]: List of all Tags.
+                List[Union[:class:`~arrapi.objs.reload.Tag`, dict]]: List of all Tags.
         """
-        return [Tag(self, data) for data in self._raw.get_tag(detail=detail)]
+        items = self._raw.get_tag(detail=detail)
+        return items if self._is_raw(raw) else [Tag(self, data) for data in items]
 
     def create_tag(self, label: str) -> Tag:
         """ Create a new :class:`~arrapi.objs.reload.Tag`.
@@ -99,7 +235,9 @@ class BaseAPI(ABC):
             Returns:
                 :class:`~arrapi.objs.reload.Tag`: Tag just created.
         """
-        return Tag(self, self._raw.post_tag(label))
+        tag = Tag(self, self._raw.post_tag(label))
+        self._forget(Tag, tag.id)
+        return tag
 
     def edit_tag(self, tag_id: int, label: str) -> Tag:
         """ Edit a :class:`~arrapi.objs.reload.Tag` by its ID.
@@ -114,6 +252,7 @@ class BaseAPI(ABC):
             Raises:
                 :class:`~arrapi.exceptions.NotFound`: When there's no tag with that ID.
         """
+        self._forget(Tag, tag_id)
         return Tag(self, self._raw.put_tag_id(tag_id, label))
 
     def delete_tag(self, tag_id: int) -> None:
@@ -125,6 +264,7 @@ class BaseAPI(ABC):
             Raises:
                 :class:`~arrapi.exceptions.NotFound`: When there's no tag with that ID.
         """
+        self._forget(Tag, tag_id)
         self._raw.delete_tag_id(tag_id)
 
     def all_commands(self) -> List[Command]:
@@ -166,8 +306,10 @@ class BaseAPI(ABC):
 
     def _validate_quality_profile(self, quality_profile):
         """ Validate Quality Profile options. """
+        if isinstance(quality_profile, dict):
+            quality_profile = quality_profile["id"]
         options = []
-        for profile in self.quality_profile():
+        for profile in self.quality_profile(raw=False):
             options.append(profile)
             if (isinstance(quality_profile, QualityProfile) and profile.id == quality_profile.id) \
                     or (isinstance(quality_profile, int) and profile.id == quality_profile) \
@@ -175,18 +317,24 @@ class BaseAPI(ABC):
                 return profile.id
         raise Invalid(f"Invalid Quality Profile: '{quality_profile}' Options: {options}")
 
-    def quality_profile(self) -> List[QualityProfile]:
+    def quality_profile(self, raw: Optional[bool] = None) -> List[Union[QualityProfile, dict]]:
         """ Gets every :class:`~arrapi.objs.simple.QualityProfile`.
 
+            Parameters:
+                raw (Optional[bool]): Return the decoded dictionaries instead of Quality Profiles. Defaults to :attr:`raw_results`.
+
             Returns:
-                List[:class:`~arrapi.objs.simple.QualityProfile`]: List of all Quality Profiles
+                List[Union[:class:`~arrapi.objs.simple.QualityProfile`, dict]]: List of all Quality Profiles
         """
-        return [QualityProfile(self, data) for data in self._raw.get_qualityProfile()]
+        items = self._raw.get_qualityProfile()
+        return items if self._is_raw(raw) else [QualityProfile(self, data) for data in items]
 
     def _validate_root_folder(self, root_folder):
         """ Validate Root Folder options. """
+        if isinstance(root_folder, dict):
+            root_folder = root_folder["id"]
         options = []
-        for folder in self.root_folder():
+        for folder in self.root_folder(raw=False):
             options.append(folder)
             if (isinstance(root_folder, RootFolder) and folder.id == root_folder.id) \
                     or (isinstance(root_folder, int) and folder.id == root_folder) \
@@ -194,13 +342,17 @@ class BaseAPI(ABC):
                 return folder.path
         raise Invalid(f"Invalid Root Folder: '{root_folder}' Options: {options}")
 
-    def root_folder(self) -> List[RootFolder]:
+    def root_folder(self, raw: Optional[bool] = None) -> List[Union[RootFolder, dict]]:
         """ Gets every :class:`~arrapi.objs.simple.RootFolder`.
 
+            Parameters:
+                raw (Optional[bool]): Return the decoded dictionaries instead of Root Folders. Defaults to :attr:`raw_results`.
+
             Returns:
-                List[:class:`~arrapi.objs.simple.RootFolder`]: List of all Root Folders.
+                List[Union[:class:`~arrapi.objs.simple.RootFolder`, dict]]: List of all Root Folders.
         """
-        return [RootFolder(self, data) for data in self._raw.get_rootFolder()]
+        items = self._raw.get_rootFolder()
+        return items if self._is_raw(raw) else [RootFolder(self, data) for data in items]
 
     def add_root_folder(self, path):
         """ Adds the path given as a root folder
@@ -256,3 +408,254 @@ class BaseV1API(BaseAPI):
                 List[:class:`~arrapi.objs.MetadataProfile`]: List of all Metadata Profiles
         """
         return [MetadataProfile(self, data) for data in self._raw.get_metadataProfile()]
+
+
+class AsyncBaseAPI(ABC):
+    """ Base class for :class:`~arrapi.apis.radarr.AsyncRadarrAPI` and :class:`~arrapi.apis.sonarr.AsyncSonarrAPI`
+    containing the asyncio versions of the API calls that are identical between Sonarr and Radarr.
+
+    Objects returned are the same objects used by the blocking APIs but their methods that talk to the Arr instance
+    (``reload``, ``add``, ``edit``, ``delete``) must be awaited and attributes of partially loaded objects are not
+    reloaded automatically, use ``await obj.reload()`` instead. """
+
+    @abstractmethod
+    def __init__(self, raw):
+        self._raw = raw
+        self._references = {}
+        self.raw_results = False
+        self.apply_tags_options = ["add", "remove", "replace"]
+
+    async def __aenter__(self):
+        try:
+            await self.connect()
+        except BaseException:
+            await self.close()
+            raise
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def connect(self) -> None:
+        """ Connects to the Arr instance and checks its version. Called automatically when used with ``async with``.
+
+            Raises:
+                :class:`~arrapi.exceptions.ConnectionFailure`: When the connection fails.
+        """
+        await self._raw.connect()
+
+    async def close(self) -> None:
+        """ Closes the underlying session if it was created by ArrAPI. """
+        await self._raw.close()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        profile_methods(cls)
+
+    @staticmethod
+    def profile() -> Profile:
+        """ Returns a :class:`~arrapi.profiling.Profile` recording the time every API method called while it's entered
+            spends on the network, decoding JSON, and building objects.
+
+            .. code-block:: python
+
+                with radarr.profile() as profile:
+                    radarr.all_movies()
+                print(profile.report())
+        """
+        return Profile()
+
+    @property
+    def connection_stats(self) -> ConnectionStats:
+        """ :class:`~arrapi.raws.pool.ConnectionStats` of the requests sent and connections opened. """
+        return self._raw.connection_stats
+
+    @property
+    def metrics(self) -> Optional[Metrics]:
+        """ :class:`~arrapi.raws.metrics.Metrics` of the requests sent or ``None`` when disabled. """
+        return self._raw.metrics
+
+    @property
+    def circuit_breaker(self) -> Optional[CircuitBreaker]:
+        """ :class:`~arrapi.raws.breaker.CircuitBreaker` of the Arr instance or ``None`` when not used. """
+        return self._raw.breaker
+
+    @property
+    def circuit_state(self) -> str:
+        """ State of the circuit breaker: ``closed``, ``open``, or ``half-open``. Always ``closed`` without one. """
+        return "closed" if self._raw.breaker is None else self._raw.breaker.state
+
+    def _reference(self, cls, obj_id):
+        """ Returns the partial object of the class and ID shared by every object referencing it (i.e. every Movie with
+            the Tag) so it's only loaded once. """
+        key = (cls, obj_id)
+        obj = self._references.get(key)
+        if obj is None:
+            obj = self._references.setdefault(key, cls(self, {"id": obj_id}))
+        return obj
+
+    def _forget(self, cls, obj_id):
+        """ Removes the shared object of the class and ID so objects loaded afterwards reference a new one. """
+        self._references.pop((cls, obj_id), None)
+
+    def _resolvers(self, fields):
+        """ Returns the class and raw API method listing the objects of each field given. """
+        loaders = {}
+        for field in fields or []:
+            if field not in _resolvable or not hasattr(self._raw, _resolvable[field][1]):
+                options = [f for f, (_, loader) in _resolvable.items() if hasattr(self._raw, loader)]
+                raise Invalid(f"Invalid field to resolve: '{field}' Options: {options}")
+            cls, loader = _resolvable[field]
+            loaders[cls] = loader
+        return loaders
+
+    def _fill_references(self, cls, items):
+        """ Loads the shared objects of the class from the list of them, creating the ones not referenced yet. """
+        for data in items:
+            obj = self._references.get((cls, data["id"]))
+            if obj is None:
+                obj = self._references.setdefault((cls, data["id"]), cls(self, data))
+            obj._reloaded(data)
+
+    def _is_raw(self, raw):
+        """ Returns if results should be the decoded items instead of objects, :attr:`raw_results` when raw is ``None``. """
+        return self.raw_results if raw is None else raw
+
+    def _validate_options(self, title: str, value: str, options: List[str]):
+        """ Validate the value given from the options given. """
+        if value in options:
+            return value
+        raise Invalid(f"Invalid {title}: '{value}' Options: {options}")
+
+    async def _validate_tags(self, tags, create=True):
+        """ Checks to see if tags are valid and if create=True will create any tags not found. """
+        if not isinstance(tags, list):
+            tags = [tags]
+        tags = [tag["id"] if isinstance(tag, dict) else tag for tag in tags]
+
+        if create is True:
+            all_tag_labels = [tag.label for tag in await self.all_tags(raw=False)]
+            for tag in tags:
+                if not isinstance(tag, (Tag, int)) and str(tag).lower() not in all_tag_labels:
+                    await self._raw.post_tag(str(tag).lower())
+
+        all_tag_labels = {}
+        all_tag_ids = []
+        valid_tag_ids = []
+        for tag in await self.all_tags(raw=False):
+            all_tag_labels[tag.label] = tag.id
+            all_tag_ids.append(tag.id)
+        for tag in tags:
+            if isinstance(tag, Tag) and tag.id in all_tag_ids:
+                valid_tag_ids.append(tag.id)
+            elif isinstance(tag, int) and tag in all_tag_ids:
+                valid_tag_ids.append(tag)
+            elif str(tag).lower() in all_tag_labels:
+                valid_tag_ids.append(all_tag_labels[str(tag).lower()])
+
+        return valid_tag_ids
+
+    def _validate_apply_tags(self, apply_tags):
+        """ Validate Apply Tags options. """
+        return self._validate_options("Apply Tags", apply_tags, self.apply_tags_options)
+
+    async def _resolve(self, objs, loaders):
+        if objs and loaders:
+            results = await asyncio.gather(*[getattr(self._raw, loader)() for loader in loaders.values()])
+            for cls, items in zip(loaders, results):
+                self._fill_references(cls, items)
+        return objs
+
+    async def resolve(self, objs: List[ReloadObj], *fields: str) -> List[ReloadObj]:
+        """ Loads every referenced :class:`~arrapi.objs.reload.Tag`, :class:`~arrapi.objs.reload.QualityProfile`, or
+            :class:`~arrapi.objs.reload.LanguageProfile` with one request for each field, sent concurrently. See :meth:`~arrapi.apis.base.BaseAPI.resolve`. """
+        return await self._resolve(objs, self._resolvers(fields))
+
+    async def get_tag(self, tag_id: int, detail: bool = False) -> Tag:
+        """ Get a :class:`~arrapi.objs.reload.Tag` by its ID. See :meth:`~arrapi.apis.base.BaseAPI.get_tag`. """
+        return Tag(self, await self._raw.get_tag_id(tag_id, detail=detail))
+
+    async def all_tags(self, detail: bool = False, raw: Optional[bool] = None) -> List[Union[Tag, dict]]:
+        """ Gets every :class:`~arrapi.objs.reload.Tag`. See :meth:`~arrapi.apis.base.BaseAPI.all_tags`. """
+        items = await self._raw.get_tag(detail=detail)
+        return items if self._is_raw(raw) else [Tag(self, data) for data in items]
+
+    async def create_tag(self, label: str) -> Tag:
+        """ Create a new :class:`~arrapi.objs.reload.Tag`. See :meth:`~arrapi.apis.base.BaseAPI.create_tag`. """
+        tag = Tag(self, await self._raw.post_tag(label))
+        self._forget(Tag, tag.id)
+        return tag
+
+    async def edit_tag(self, tag_id: int, label: str) -> Tag:
+        """ Edit a :class:`~arrapi.objs.reload.Tag` by its ID. See :meth:`~arrapi.apis.base.BaseAPI.edit_tag`. """
+        self._forget(Tag, tag_id)
+        return Tag(self, await self._raw.put_tag_id(tag_id, label))
+
+    async def delete_tag(self, tag_id: int) -> None:
+        """ Delete a :class:`~arrapi.objs.reload.Tag` by its ID. See :meth:`~arrapi.apis.base.BaseAPI.delete_tag`. """
+        self._forget(Tag, tag_id)
+        await self._raw.delete_tag_id(tag_id)
+
+    async def all_commands(self) -> List[Command]:
+        """ Gets a list of :class:`~arrapi.objs.reload.Command`. See :meth:`~arrapi.apis.base.BaseAPI.all_commands`. """
+        return [Command(self, data) for data in await self._raw.get_command()]
+
+    async def get_command(self, command_id: int) -> Command:
+        """ Get a :class:`~arrapi.objs.reload.Command` by its ID. See :meth:`~arrapi.apis.base.BaseAPI.get_command`. """
+        return Command(self, await self._raw.get_command_id(command_id))
+
+    async def send_command(self, command: str, **kwargs) -> Command:
+        """ Sends a command. See :meth:`~arrapi.apis.base.BaseAPI.send_command`. """
+        return Command(self, await self._raw.post_command(command, **kwargs))
+
+    async def _validate_quality_profile(self, quality_profile):
+        """ Validate Quality Profile options. """
+        if isinstance(quality_profile, dict):
+            quality_profile = quality_profile["id"]
+        options = []
+        for profile in await self.quality_profile(raw=False):
+            options.append(profile)
+            if (isinstance(quality_profile, QualityProfile) and profile.id == quality_profile.id) \
+                    or (isinstance(quality_profile, int) and profile.id == quality_profile) \
+                    or profile.name == quality_profile:
+                return profile.id
+        raise Invalid(f"Invalid Quality Profile: '{quality_profile}' Options: {options}")
+
+    async def quality_profile(self, raw: Optional[bool] = None) -> List[Union[QualityProfile, dict]]:
+        """ Gets every :class:`~arrapi.objs.reload.QualityProfile`. See :meth:`~arrapi.apis.base.BaseAPI.quality_profile`. """
+        items = await self._raw.get_qualityProfile()
+        return items if self._is_raw(raw) else [QualityProfile(self, data) for data in items]
+
+    async def _validate_root_folder(self, root_folder):
+        """ Validate Root Folder options. """
+        if isinstance(root_folder, dict):
+            root_folder = root_folder["id"]
+        options = []
+        for folder in await self.root_folder(raw=False):
+            options.append(folder)
+            if (isinstance(root_folder, RootFolder) and folder.id == root_folder.id) \
+                    or (isinstance(root_folder, int) and folder.id == root_folder) \
+                    or folder.path == root_folder:
+                return folder.path
+        raise Invalid(f"Invalid Root Folder: '{root_folder}' Options: {options}")
+
+    async def root_folder(self, raw: Optional[bool] = None) -> List[Union[RootFolder, dict]]:
+        """ Gets every :class:`~arrapi.objs.simple.RootFolder`. See :meth:`~arrapi.apis.base.BaseAPI.root_folder`. """
+        items = await self._raw.get_rootFolder()
+        return items if self._is_raw(raw) else [RootFolder(self, data) for data in items]
+
+    async def add_root_folder(self, path):
+        """ Adds the path given as a root folder. See :meth:`~arrapi.apis.base.BaseAPI.add_root_folder`. """
+        await self._raw.add_rootFolder(path)
+
+    async def remote_path_mapping(self) -> List[RemotePathMapping]:
+        """ Gets every :class:`~arrapi.objs.simple.RemotePathMapping`. See :meth:`~arrapi.apis.base.BaseAPI.remote_path_mapping`. """
+        return [RemotePathMapping(self, data) for data in await self._raw.get_remotePathMapping()]
+
+    async def system_status(self) -> SystemStatus:
+        """ Gets the :class:`~arrapi.objs.reload.SystemStatus`. See :meth:`~arrapi.apis.base.BaseAPI.system_status`. """
+        return SystemStatus(self, await self._raw.get_system_status())
+
+
+profile_methods(BaseAPI)
+profile_methods(AsyncBaseAPI)
@@ -5,5 +5,5 @@ from ..raws.lidarr import LidarrRawAPI
 
 
 class LidarrAPI(BaseV1API):
-    def __init__(self, url: str, apikey: str, session: Optional[Session] = None) -> None:
-        super().__init__(LidarrRawAPI(url, apikey, session=session))
+    def __init__(self, url: str, apikey: str, session: Optional[Session] = None, **kwargs) -> None:
+        super().__init__(LidarrRawAPI(url, apikey, session=session, **kwargs))
@@ -1,10 +1,17 @@
+import asyncio
+
 from requests import Session
-from typing import Optional, Union, List, Tuple
+from typing import Any, AsyncIterator, Iterator, Optional, Union, List, Tuple, TYPE_CHECKING
 from arrapi import RootFolder, QualityProfile, Movie, Tag, NotFound, Invalid, Exists
-from .base import BaseAPI
-from ..exceptions import Excluded
+from .base import BaseAPI, AsyncBaseAPI
+from ..exceptions import DeadlineExceeded, Excluded
 from ..objs.simple import RadarrExclusion
-from ..raws.radarr import RadarrRawAPI
+from ..raws.deadline import Deadline, deadline_scope
+from ..raws.radarr import RadarrRawAPI, AsyncRadarrRawAPI
+from ..table import MOVIE_COLUMNS, build_table, table_output
+
+if TYPE_CHECKING:
+    from aiohttp import ClientSession
 
 
 class RadarrAPI(BaseAPI):
@@ -14,10 +21,17 @@ class RadarrAPI(BaseAPI):
             url (str): URL of Radarr application.
             apikey (str): apikey for the Radarr application.
             session (Optional[Session]): Session object to use.
+            kwargs: Connection options passed to :class:`~arrapi.raws.base.BaseRawAPI`.
+
+        Attributes:
+            raw_results (bool): Return the decoded dictionaries from the Radarr API instead of building objects from
+                :meth:`all_movies`, :meth:`iter_movies`, :meth:`search_movies`, :meth:`all_tags`, :meth:`quality_profile`,
+                and :meth:`root_folder`. Each of them also takes ``raw`` to choose for that call. Methods that take
+                Movies, Tags, Quality Profiles, or Root Folders accept the dictionaries too.
      """
 
-    def __init__(self, url: str, apikey: str, session: Optional[Session] = None) -> None:
-        super().__init__(RadarrRawAPI(url, apikey, session=session))
+    def __init__(self, url: str, apikey: str, session: Optional[Session] = None, **kwargs) -> None:
+        super().__init__(RadarrRawAPI(url, apikey, session=session, **kwargs))
         self.exclusions = []
         self.minimum_availability_options = ["announced", "inCinemas", "released", "preDB"]
         self.monitor_options = ["movieOnly", "movieAndCollection", "none"]
@@ -77,24 +91,29 @@ class RadarrAPI(BaseAPI):
     def _validate_ids(self, ids):
         """ Validate IDs. """
         valid_ids = []
+        valid_inputs = []
         invalid_ids = []
         used_ids = []
         radarr_ids = {}
-        for m in self.all_movies():
-            radarr_ids[m.tmdbId] = m
-            radarr_ids[str(m.tmdbId)] = m
-            radarr_ids[m.imdbId] = m
+        for m in self.all_movies(raw=True):
+            radarr_ids[m.get("tmdbId")] = m
+            radarr_ids[str(m.get("tmdbId"))] = m
+            radarr_ids[m.get("imdbId")] = m
         for _id in ids:
-            if isinstance(_id, Movie) and str(_id.tmdbId) not in used_ids and str(_id.imdbId) not in used_ids:
-                valid_ids.append(_id.id)
-                used_ids.append(str(_id.tmdbId))
-                used_ids.append(str(_id.imdbId))
-            elif _id in radarr_ids and str(_id) not in used_ids:
-                valid_ids.append(radarr_ids[_id].id)
+            movie = (_id.get("id"), _id.get("tmdbId"), _id.get("imdbId")) if isinstance(_id, dict) \
+                else (_id.id, _id.tmdbId, _id.imdbId) if isinstance(_id, Movie) else None
+            if movie and str(movie[1]) not in used_ids and str(movie[2]) not in used_ids:
+                valid_ids.append(movie[0])
+                valid_inputs.append(_id)
+                used_ids.append(str(movie[1]))
+                used_ids.append(str(movie[2]))
+            elif movie is None and _id in radarr_ids and str(_id) not in used_ids:
+                valid_ids.append(radarr_ids[_id]["id"])
+                valid_inputs.append(_id)
                 used_ids.append(str(_id))
             else:
                 invalid_ids.append(_id)
-        return valid_ids, invalid_ids
+        return valid_ids, invalid_ids, valid_inputs
 
     def respect_list_exclusions_when_adding(self):
         """ Stores all List Exclusions so whenever :func:`~arrapi.objs.reload.Movie.add` or :func:`~arrapi.apis.sonarr.RadarrAPI.add_multiple_movies` is called the additions will be checked against the Exclusion List  """
@@ -119,24 +138,75 @@ class RadarrAPI(BaseAPI):
             raise ValueError("Expected either movie_id, tmdb_id or imdb_id args")
         return Movie(self, movie_id=movie_id, tmdb_id=tmdb_id, imdb_id=imdb_id)
 
-    def all_movies(self) -> List[Movie]:
+    def all_movies(self, prefetch: Optional[List[str]] = None, fields: Optional[List[str]] = None, raw: Optional[bool] = None) -> List[Union[Movie, dict]]:
         """ Gets all :class:`~arrapi.objs.reload.Movie` in Radarr.
 
+            Parameters:
+                prefetch (Optional[List[str]]): Fields to resolve with one request each after getting the Movies. Valid options are tags, qualityProfile, and profile (v2 Only). See :meth:`~arrapi.apis.base.BaseAPI.resolve`.
+                fields (Optional[List[str]]): Only keep these fields of each Movie (i.e. id, tmdbId, path, monitored, tags), the rest of its data is dropped as soon as it's decoded. Fields are attribute names or keys of the Radarr response, the ID and title are always kept. Reading a field that wasn't kept reloads the whole Movie, for asyncio APIs it raises an ``AttributeError`` instead. Editing a Movie reloads it first.
+                raw (Optional[bool]): Return the decoded dictionaries instead of Movies, ``fields`` still drops the rest of each one. Defaults to :attr:`raw_results`.
+
+            Returns:
+                List[Union[:class:`~arrapi.objs.reload.Movie`, dict]]: List of Movies in Radarr.
+
+            Raises:
+                :class:`~arrapi.exceptions.Invalid`: When one of the prefetch fields given is invalid or prefetch is used with raw results.
+        """
+        loaders = self._resolvers(prefetch)
+        if loaders and self._is_raw(raw):
+            raise Invalid("prefetch can't be used with raw results")
+        items = self._raw.get_movie()
+        keys = Movie._projection(fields, self._raw.new_codebase)
+        if self._is_raw(raw):
+            return items if keys is None else [{k: v for k, v in d.items() if k in keys} for d in items]
+        return self._resolve([Movie._projected(self, d, keys) for d in items], loaders)
+
+    def iter_movies(self, raw: Optional[bool] = None) -> Iterator[Union[Movie, dict]]:
+        """ Iterates over all :class:`~arrapi.objs.reload.Movie` in Radarr, decoding the response as it's received.
+
+            Uses about the same memory no matter how big the library is, unlike :meth:`all_movies` which holds the
+            whole response and every Movie in memory at once.
+
+            Parameters:
+                raw (Optional[bool]): Yield the decoded dictionaries instead of Movies. Defaults to :attr:`raw_results`.
+
             Returns:
-                List[:class:`~arrapi.objs.reload.Movie`]: List of Movies in Radarr.
+                Iterator[Union[:class:`~arrapi.objs.reload.Movie`, dict]]: Iterator of Movie in Radarr.
         """
-        return [Movie(self, data=d) for d in self._raw.get_movie()]
+        raw = self._is_raw(raw)
+        for data in self._raw.iter_movie():
+            yield data if raw else Movie(self, data=data)
+
+    def movies_table(self, columns: Optional[List[str]] = None, output: str = "auto") -> Any:
+        """ Gets all Movies in Radarr as columns built straight from the response instead of as
+            :class:`~arrapi.objs.reload.Movie` objects. Nested fields are flattened into columns named by their path
+            i.e. ``rating.value`` or ``collection.tmdbId``.
 
-    def search_movies(self, term: str) -> List[Movie]:
+            Parameters:
+                columns (Optional[List[str]]): Columns to build. Defaults to every column in :data:`arrapi.table.MOVIE_COLUMNS`.
+                output (str): What to build. Valid options are auto, array, numpy, pandas, or pyarrow. auto builds NumPy arrays when NumPy is installed and ``array.array`` otherwise.
+
+            Returns:
+                Any: Dictionary of column name to column for auto, array, and numpy, or a pandas ``DataFrame`` or pyarrow ``Table``. See :func:`~arrapi.table.build_table`.
+
+            Raises:
+                :class:`~arrapi.exceptions.Invalid`: When the output is invalid or its module isn't installed.
+        """
+        output = table_output(output)
+        return build_table(self._raw.get_movie(), MOVIE_COLUMNS, columns=columns, output=output)
+
+    def search_movies(self, term: str, raw: Optional[bool] = None) -> List[Union[Movie, dict]]:
         """ Gets a list of :class:`~arrapi.objs.reload.Movie` by a search term.
 
             Parameters:
                 term (str): Term to Search for.
+                raw (Optional[bool]): Return the decoded dictionaries instead of Movies. Defaults to :attr:`raw_results`.
 
             Returns:
-                List[:class:`~arrapi.objs.reload.Movie`]: List of Movie's found.
+                List[Union[:class:`~arrapi.objs.reload.Movie`, dict]]: List of Movie's found.
         """
-        return [Movie(self, data=d) for d in self._raw.get_movie_lookup(term)]
+        items = self._raw.get_movie_lookup(term)
+        return items if self._is_raw(raw) else [Movie(self, data=d) for d in items]
 
     def add_movie(
             self,
@@ -250,7 +320,8 @@ class RadarrAPI(BaseAPI):
                             search: bool = True,
                             minimum_availability: str = "announced",
                             tags: Optional[List[Union[str, int, Tag]]] = None,
-                            per_request: int = None
+                            per_request: int = None,
+                            deadline: Optional[Union[float, Deadline]] = None
                             ) -> Tuple[List[Movie], List[Movie], List[Union[int, str, Movie]], List[int]]:
         """ Adds multiple Movies to Radarr in a single call by their TMDb IDs.
 
@@ -267,6 +338,7 @@ class RadarrAPI(BaseAPI):
                 minimum_availability (str): Minimum Availability for the Movies. Valid options are announced, inCinemas, released, or preDB.
                 tags (Optional[List[Union[str, int, Tag]]]): Tags to be added to the Movies.
                 per_request (int): Number of Movies to add per request.
+                deadline (Optional[Union[float, Deadline]]): Seconds or :class:`~arrapi.raws.deadline.Deadline` to finish the whole call in. Items not reached in time are added to ``Deadline.skipped`` and the results so far are returned.
 
             Returns:
                 Tuple[List[:class:`~arrapi.objs.reload.Movie`], List[:class:`~arrapi.objs.reload.Movie`], List[Union[int, str, Movie]], List[int]]: List of Movies that were able to be added, List of Movies already in Radarr, List of Movies that could not be found, List of Movies that were excluded.
@@ -274,42 +346,53 @@ class RadarrAPI(BaseAPI):
             Raises:
                 :class:`~arrapi.exceptions.Invalid`: When one of the options given is invalid.
         """
-        options = self._validate_add_options(root_folder, quality_profile, monitor=monitor, search=search,
-                                             minimum_availability=minimum_availability, tags=tags)
         json = []
+        json_items = []
         movies = []
         existing_movies = []
         invalid_ids = []
         excluded_ids = []
         used_ids = []
-        for input_item in ids:
-            path = input_item[1] if isinstance(input_item, tuple) else None
-            item = input_item[0] if isinstance(input_item, tuple) else input_item
+        looked_up = 0
+        with deadline_scope(deadline) as limit:
             try:
-                if isinstance(item, Movie):
-                    movie = item
-                elif str(item).startswith("tt"):
-                    movie = self.get_movie(imdb_id=item)
-                else:
-                    if int(item) in used_ids or (self.exclusions and int(item) in self.exclusions):
-                        raise Excluded(int(item))
-                    movie = self.get_movie(tmdb_id=item)
-                if movie.tmdbId in used_ids or (self.exclusions and movie.tmdbId in self.exclusions):
-                    raise Excluded(movie.tmdbId)
-                used_ids.append(movie.tmdbId)
-                try:
-                    json.append(movie._get_add_data(options, path=path))
-                except Exists:
-                    existing_movies.append(movie)
-            except NotFound:
-                invalid_ids.append(input_item)
-            except Excluded as e:
-                excluded_ids.append(int(str(e)))
-        if len(json) > 0:
-            if per_request is None:
-                per_request = len(json)
-            for i in range(0, len(json), per_request):
-                movies.extend([Movie(self, data=m) for m in self._raw.post_movie_import(json[i:i+per_request])])
+                options = self._validate_add_options(root_folder, quality_profile, monitor=monitor, search=search,
+                                                     minimum_availability=minimum_availability, tags=tags)
+                for looked_up, input_item in enumerate(ids):
+                    path = input_item[1] if isinstance(input_item, tuple) else None
+                    item = input_item[0] if isinstance(input_item, tuple) else input_item
+                    try:
+                        if isinstance(item, Movie):
+                            movie = item
+                        elif isinstance(item, dict):
+                            movie = Movie(self, data=dict(item))
+                        elif str(item).startswith("tt"):
+                            movie = self.get_movie(imdb_id=item)
+                        else:
+                            if int(item) in used_ids or (self.exclusions and int(item) in self.exclusions):
+                                raise Excluded(int(item))
+                            movie = self.get_movie(tmdb_id=item)
+                        if movie.tmdbId in used_ids or (self.exclusions and movie.tmdbId in self.exclusions):
+                            raise Excluded(movie.tmdbId)
+                        used_ids.append(movie.tmdbId)
+                        try:
+                            json.append(movie._get_add_data(options, path=path))
+                            json_items.append(input_item)
+                        except Exists:
+                            existing_movies.append(movie)
+                    except NotFound:
+                        invalid_ids.append(input_item)
+                    except Excluded as e:
+                        excluded_ids.append(int(str(e)))
+                looked_up = len(ids)
+                if len(json) > 0:
+                    if per_request is None:
+                        per_request = len(json)
+                    for i in range(0, len(json), per_request):
+                        movies.extend([Movie(self, data=m) for m in self._raw.post_movie_import(json[i:i+per_request])])
+                        json_items = json_items[per_request:]
+            except DeadlineExceeded:
+                limit.skipped.extend(list(ids[looked_up:]) + json_items)
         return movies, existing_movies, invalid_ids, excluded_ids
 
     def edit_multiple_movies(self, ids: List[Union[int, str, Movie]],
@@ -320,7 +403,8 @@ class RadarrAPI(BaseAPI):
                              minimum_availability: Optional[str] = None,
                              tags: Optional[List[Union[str, int, Tag]]] = None,
                              apply_tags: str = "add",
-                             per_request: int = None
+                             per_request: int = None,
+                             deadline: Optional[Union[float, Deadline]] = None
                              ) -> Tuple[List[Movie], List[Union[int, str, Movie]]]:
         """ Edit multiple Movies in Radarr by their TMDb IDs.
 
@@ -334,6 +418,7 @@ class RadarrAPI(BaseAPI):
                 tags (Optional[List[Union[str, int, Tag]]]): Tags to be added, replaced, or removed from the Movie.
                 apply_tags (str): How you want to edit the Tags. Valid options are add, replace, or remove.
                 per_request (int): Number of Movies to edit per request.
+                deadline (Optional[Union[float, Deadline]]): Seconds or :class:`~arrapi.raws.deadline.Deadline` to finish the whole call in. Items not reached in time are added to ``Deadline.skipped`` and the results so far are returned.
 
             Returns:
                 Tuple[List[:class:`~arrapi.objs.reload.Movie`], List[Union[int, str, Movie]]]: List of Movies that were able to be edited, List of Movies that could not be found in Radarr.
@@ -341,23 +426,32 @@ class RadarrAPI(BaseAPI):
             Raises:
                 :class:`~arrapi.exceptions.Invalid`: When one of the options given is invalid.
         """
-        json = self._validate_edit_options(root_folder=root_folder, move_files=move_files,
-                                           quality_profile=quality_profile, monitored=monitored,
-                                           minimum_availability=minimum_availability, tags=tags, apply_tags=apply_tags)
         movie_list = []
-        valid_ids, invalid_ids = self._validate_ids(ids)
-        if len(valid_ids) > 0:
-            if per_request is None:
-                per_request = len(valid_ids)
-            for i in range(0, len(valid_ids), per_request):
-                json["movieIds"] = valid_ids[i:i+per_request]
-                movie_list = [Movie(self, data=m) for m in self._raw.put_movie_editor(json)]
+        invalid_ids = []
+        pending = list(ids)
+        with deadline_scope(deadline) as limit:
+            try:
+                json = self._validate_edit_options(root_folder=root_folder, move_files=move_files,
+                                                   quality_profile=quality_profile, monitored=monitored,
+                                                   minimum_availability=minimum_availability, tags=tags,
+                                                   apply_tags=apply_tags)
+                valid_ids, invalid_ids, pending = self._validate_ids(ids)
+                if len(valid_ids) > 0:
+                    if per_request is None:
+                        per_request = len(valid_ids)
+                    for i in range(0, len(valid_ids), per_request):
+                        json["movieIds"] = valid_ids[i:i+per_request]
+                        movie_list.extend([Movie(self, data=m) for m in self._raw.put_movie_editor(json)])
+                        pending = pending[per_request:]
+            except DeadlineExceeded:
+                limit.skipped.extend(pending)
         return movie_list, invalid_ids
 
     def delete_multiple_movies(self, ids: List[Union[int, str, Movie]],
                                addImportExclusion: bool = False,
                                deleteFiles: bool = False,
-                               per_request: int = None
+                               per_request: int = None,
+                               deadline: Optional[Union[float, Deadline]] = None
                                ) -> List[Union[int, str, Movie]]:
         """ Deletes multiple Movies in Radarr by their TMDb IDs.
 
@@ -366,19 +460,361 @@ class RadarrAPI(BaseAPI):
                 addImportExclusion (bool): Add Import Exclusion for these TMDb IDs.
                 deleteFiles (bool): Delete Files for these TMDb IDs.
                 per_request (int): Number of Movies to delete per request.
+                deadline (Optional[Union[float, Deadline]]): Seconds or :class:`~arrapi.raws.deadline.Deadline` to finish the whole call in. Items not reached in time are added to ``Deadline.skipped`` and the results so far are returned.
 
             Returns:
                 List[Union[int, str, Movie]]: List of Movies that could not be found in Radarr.
         """
-        valid_ids, invalid_ids = self._validate_ids(ids)
-        if len(valid_ids) > 0:
-            json = {
-                "deleteFiles": deleteFiles,
-                "addImportExclusion": addImportExclusion
-            }
-            if per_request is None:
-                per_request = len(valid_ids)
-            for i in range(0, len(valid_ids), per_request):
-                json["movieIds"] = valid_ids[i:i+per_request]
-                self._raw.delete_movie_editor(json)
+        invalid_ids = []
+        pending = list(ids)
+        with deadline_scope(deadline) as limit:
+            try:
+                valid_ids, invalid_ids, pending = self._validate_ids(ids)
+                if len(valid_ids) > 0:
+                    json = {
+                        "deleteFiles": deleteFiles,
+                        "addImportExclusion": addImportExclusion
+                    }
+                    if per_request is None:
+                        per_request = len(valid_ids)
+                    for i in range(0, len(valid_ids), per_request):
+                        json["movieIds"] = valid_ids[i:i+per_request]
+                        self._raw.delete_movie_editor(json)
+                        pending = pending[per_request:]
+            except DeadlineExceeded:
+                limit.skipped.extend(pending)
+        return invalid_ids
+
+
+class AsyncRadarrAPI(AsyncBaseAPI):
+    """ asyncio version of :class:`~arrapi.apis.radarr.RadarrAPI`, every method that talks to Radarr is a coroutine.
+
+        Use it as an async context manager or call :meth:`connect` before using it and :meth:`close` when done.
+
+        .. code-block:: python
+
+            async with AsyncRadarrAPI(url, apikey) as radarr:
+                movies = await radarr.all_movies()
+
+        Parameters:
+            url (str): URL of Radarr application.
+            apikey (str): apikey for the Radarr application.
+            session (Optional[aiohttp.ClientSession]): Session object to use.
+            kwargs: Connection options passed to :class:`~arrapi.raws.base.AsyncBaseRawAPI`.
+     """
+
+    def __init__(self, url: str, apikey: str, session: Optional["ClientSession"] = None, **kwargs) -> None:
+        super().__init__(AsyncRadarrRawAPI(url, apikey, session=session, **kwargs))
+        self.exclusions = []
+        self.minimum_availability_options = ["announced", "inCinemas", "released", "preDB"]
+        self.monitor_options = ["movieOnly", "movieAndCollection", "none"]
+
+    async def _validate_add_options(self, root_folder, quality_profile, monitor=True, search=True,
+                                    minimum_availability="announced", tags=None):
+        """ Validate Add Movie options. """
+        options = {
+            "root_folder": await self._validate_root_folder(root_folder),
+            "quality_profile": await self._validate_quality_profile(quality_profile),
+            "monitor": self._validate_monitor(monitor),
+            "search": True if search is True else False,
+            "minimum_availability": self._validate_minimum_availability(minimum_availability)
+        }
+        if tags:
+            options["tags"] = await self._validate_tags(tags)
+        return options
+
+    async def _validate_edit_options(self, root_folder=None, path=None, move_files=False, quality_profile=None,
+                                     monitored=None, minimum_availability=None, tags=None, apply_tags="add"):
+        """ Validate Edit Movie options. """
+        if all(v is None for v in [root_folder, path, quality_profile, monitored, minimum_availability, tags]):
+            raise ValueError("Expected either root_folder, path, quality_profile, "
+                             "monitored, minimum_availability, or tags args")
+        options = {"moveFiles": True if move_files is True else False}
+        if root_folder is not None:
+            options["rootFolderPath"] = await self._validate_root_folder(root_folder)
+        if path is not None:
+            options["path"] = path
+        if quality_profile is not None:
+            options["qualityProfileId" if self._raw.new_codebase else "profileId"] = await self._validate_quality_profile(quality_profile)
+        if monitored is not None:
+            options["monitored"] = self._validate_monitor(monitored, name="Monitored")
+        if minimum_availability is not None:
+            options["minimumAvailability"] = self._validate_minimum_availability(minimum_availability)
+        if tags is not None:
+            options["tags"] = await self._validate_tags(tags, create=apply_tags != "remove")
+            if apply_tags in self.apply_tags_options:
+                options["applyTags"] = apply_tags
+            else:
+                raise Invalid(f"Invalid apply_tags: '{apply_tags}' Options: {self.apply_tags_options}")
+        return options
+
+    def _validate_minimum_availability(self, minimum_availability):
+        """ Validate Minimum Availability options. """
+        return self._validate_options("Minimum Availability", minimum_availability, self.minimum_availability_options)
+
+    def _validate_monitor(self, monitor, name="Monitor"):
+        """ Validate Monitor options. """
+        if self._raw.v4:
+            if isinstance(monitor, bool):
+                return monitor
+            return self._validate_options(name, monitor, self.monitor_options)
+        else:
+            return True if monitor is True else False
+
+    async def _validate_ids(self, ids):
+        """ Validate IDs. """
+        valid_ids = []
+        valid_inputs = []
+        invalid_ids = []
+        used_ids = []
+        radarr_ids = {}
+        for m in await self.all_movies(raw=True):
+            radarr_ids[m.get("tmdbId")] = m
+            radarr_ids[str(m.get("tmdbId"))] = m
+            radarr_ids[m.get("imdbId")] = m
+        for _id in ids:
+            movie = (_id.get("id"), _id.get("tmdbId"), _id.get("imdbId")) if isinstance(_id, dict) \
+                else (_id.id, _id.tmdbId, _id.imdbId) if isinstance(_id, Movie) else None
+            if movie and str(movie[1]) not in used_ids and str(movie[2]) not in used_ids:
+                valid_ids.append(movie[0])
+                valid_inputs.append(_id)
+                used_ids.append(str(movie[1]))
+                used_ids.append(str(movie[2]))
+            elif movie is None and _id in radarr_ids and str(_id) not in used_ids:
+                valid_ids.append(radarr_ids[_id]["id"])
+                valid_inputs.append(_id)
+                used_ids.append(str(_id))
+            else:
+                invalid_ids.append(_id)
+        return valid_ids, invalid_ids, valid_inputs
+
+    async def respect_list_exclusions_when_adding(self):
+        """ See :meth:`~arrapi.apis.radarr.RadarrAPI.respect_list_exclusions_when_adding`. """
+        self.exclusions = [RadarrExclusion(self, ex).tmdbId for ex in await self._raw.get_exclusions()]
+
+    async def get_movie(self, movie_id: Optional[int] = None, tmdb_id: Optional[int] = None, imdb_id: Optional[str] = None) -> Movie:
+        """ Gets a :class:`~arrapi.objs.reload.Movie` by one of the IDs. See :meth:`~arrapi.apis.radarr.RadarrAPI.get_movie`. """
+        if all(v is None for v in [movie_id, tmdb_id, imdb_id]):
+            raise ValueError("Expected either movie_id, tmdb_id or imdb_id args")
+        movie = Movie(self, data={"id": movie_id, "tmdbId": tmdb_id, "imdbId": imdb_id})
+        await movie.reload()
+        return movie
+
+    async def all_movies(self, prefetch: Optional[List[str]] = None, fields: Optional[List[str]] = None, raw: Optional[bool] = None) -> List[Union[Movie, dict]]:
+        """ Gets all :class:`~arrapi.objs.reload.Movie` in Radarr. See :meth:`~arrapi.apis.radarr.RadarrAPI.all_movies`. """
+        loaders = self._resolvers(prefetch)
+        if loaders and self._is_raw(raw):
+            raise Invalid("prefetch can't be used with raw results")
+        items = await self._raw.get_movie()
+        keys = Movie._projection(fields, self._raw.new_codebase)
+        if self._is_raw(raw):
+            return items if keys is None else [{k: v for k, v in d.items() if k in keys} for d in items]
+        return await self._resolve([Movie._projected(self, d, keys) for d in items], loaders)
+
+    async def iter_movies(self, raw: Optional[bool] = None) -> AsyncIterator[Union[Movie, dict]]:
+        """ Iterates over all :class:`~arrapi.objs.reload.Movie` in Radarr, decoding the response as it's received. See :meth:`~arrapi.apis.radarr.RadarrAPI.iter_movies`. """
+        raw = self._is_raw(raw)
+        async for data in self._raw.iter_movie():
+            yield data if raw else Movie(self, data=data)
+
+    async def movies_table(self, columns: Optional[List[str]] = None, output: str = "auto") -> Any:
+        """ Gets all Movies in Radarr as columns instead of objects. See :meth:`~arrapi.apis.radarr.RadarrAPI.movies_table`. """
+        output = table_output(output)
+        return build_table(await self._raw.get_movie(), MOVIE_COLUMNS, columns=columns, output=output)
+
+    async def search_movies(self, term: str, raw: Optional[bool] = None) -> List[Union[Movie, dict]]:
+        """ Gets a list of :class:`~arrapi.objs.reload.Movie` by a search term. See :meth:`~arrapi.apis.radarr.RadarrAPI.search_movies`. """
+        items = await self._raw.get_movie_lookup(term)
+        return items if self._is_raw(raw) else [Movie(self, data=d) for d in items]
+
+    async def add_movie(
+            self,
+            root_folder: Union[str, int, "RootFolder"],
+            quality_profile: Union[str, int, "QualityProfile"],
+            movie_id: Optional[int] = None,
+            tmdb_id: Optional[int] = None,
+            imdb_id: Optional[str] = None,
+            monitor: bool = True,
+            search: bool = True,
+            minimum_availability: str = "announced",
+            tags: Optional[List[Union[str, int, Tag]]] = None
+    ) -> Movie:
+        """ Gets a :class:`~arrapi.objs.reload.Movie` by one of the IDs and adds it to Radarr. See :meth:`~arrapi.apis.radarr.RadarrAPI.add_movie`. """
+        movie = await self.get_movie(movie_id=movie_id, tmdb_id=tmdb_id, imdb_id=imdb_id)
+        await movie.add(root_folder, quality_profile, monitor=monitor, search=search,
+                        minimum_availability=minimum_availability, tags=tags)
+        return movie
+
+    async def edit_movie(
+            self,
+            movie_id: Optional[int] = None,
+            tmdb_id: Optional[int] = None,
+            imdb_id: Optional[str] = None,
+            path: Optional[str] = None,
+            move_files: bool = False,
+            quality_profile: Optional[Union[str, int, "QualityProfile"]] = None,
+            monitored: Optional[bool] = None,
+            minimum_availability: Optional[str] = None,
+            tags: Optional[List[Union[str, int, Tag]]] = None,
+            apply_tags: str = "add"
+    ) -> Movie:
+        """ Gets a :class:`~arrapi.objs.reload.Movie` by one of the IDs and edits it in Radarr. See :meth:`~arrapi.apis.radarr.RadarrAPI.edit_movie`. """
+        movie = await self.get_movie(movie_id=movie_id, tmdb_id=tmdb_id, imdb_id=imdb_id)
+        await movie.edit(path=path, move_files=move_files, quality_profile=quality_profile, monitored=monitored,
+                         minimum_availability=minimum_availability, tags=tags, apply_tags=apply_tags)
+        return movie
+
+    async def delete_movie(
+            self,
+            movie_id: Optional[int] = None,
+            tmdb_id: Optional[int] = None,
+            imdb_id: Optional[str] = None,
+            addImportExclusion: bool = False,
+            deleteFiles: bool = False
+    ) -> Movie:
+        """ Gets a :class:`~arrapi.objs.reload.Movie` by one of the IDs and deletes it from Radarr. See :meth:`~arrapi.apis.radarr.RadarrAPI.delete_movie`. """
+        movie = await self.get_movie(movie_id=movie_id, tmdb_id=tmdb_id, imdb_id=imdb_id)
+        await movie.delete(addImportExclusion=addImportExclusion, deleteFiles=deleteFiles)
+        return movie
+
+    async def add_multiple_movies(self, ids: List[Union[int, str, Movie, Tuple[Union[int, str, Movie], str]]],
+                                  root_folder: Union[str, int, RootFolder],
+                                  quality_profile: Union[str, int, QualityProfile],
+                                  monitor: bool = True,
+                                  search: bool = True,
+                                  minimum_availability: str = "announced",
+                                  tags: Optional[List[Union[str, int, Tag]]] = None,
+                                  per_request: int = None,
+                                  max_lookups: int = 10,
+                                  deadline: Optional[Union[float, Deadline]] = None
+                                  ) -> Tuple[List[Movie], List[Movie], List[Union[int, str, Movie]], List[int]]:
+        """ Adds multiple Movies to Radarr in a single call by their TMDb IDs. See :meth:`~arrapi.apis.radarr.RadarrAPI.add_multiple_movies`.
+
+            The lookups for the IDs given are run concurrently.
+
+            Parameters:
+                max_lookups (int): Maximum number of lookups running at once.
+        """
+        items = [(i[0], i[1]) if isinstance(i, tuple) else (i, None) for i in ids]
+        items = [(Movie(self, data=dict(i)) if isinstance(i, dict) else i, p) for i, p in items]
+        semaphore = asyncio.Semaphore(max_lookups)
+
+        async def lookup(_item):
+            async with semaphore:
+                if str(_item).startswith("tt"):
+                    return await self.get_movie(imdb_id=_item)
+                return await self.get_movie(tmdb_id=_item)
+
+        json = []
+        json_items = []
+        movies = []
+        existing_movies = []
+        invalid_ids = []
+        excluded_ids = []
+        used_ids = []
+        looked_up = 0
+        with deadline_scope(deadline) as limit:
+            try:
+                options = await self._validate_add_options(root_folder, quality_profile, monitor=monitor, search=search,
+                                                           minimum_availability=minimum_availability, tags=tags)
+                lookups = {}
+                for item, _ in items:
+                    if isinstance(item, Movie) or item in lookups:
+                        continue
+                    if not str(item).startswith("tt") and self.exclusions and int(item) in self.exclusions:
+                        continue
+                    lookups[item] = lookup(item)
+                found = dict(zip(lookups, await asyncio.gather(*lookups.values(), return_exceptions=True)))
+
+                for looked_up, (input_item, (item, path)) in enumerate(zip(ids, items)):
+                    try:
+                        if isinstance(item, Movie):
+                            movie = item
+                        else:
+                            if not str(item).startswith("tt") and (int(item) in used_ids or (self.exclusions and int(item) in self.exclusions)):
+                                raise Excluded(int(item))
+                            movie = found[item]
+                            if isinstance(movie, BaseException):
+                                raise movie
+                        if movie.tmdbId in used_ids or (self.exclusions and movie.tmdbId in self.exclusions):
+                            raise Excluded(movie.tmdbId)
+                        used_ids.append(movie.tmdbId)
+                        try:
+                            json.append(movie._get_add_data(options, path=path))
+                            json_items.append(input_item)
+                        except Exists:
+                            existing_movies.append(movie)
+                    except NotFound:
+                        invalid_ids.append(input_item)
+                    except Excluded as e:
+                        excluded_ids.append(int(str(e)))
+                looked_up = len(ids)
+                if len(json) > 0:
+                    if per_request is None:
+                        per_request = len(json)
+                    for i in range(0, len(json), per_request):
+                        movies.extend([Movie(self, data=m) for m in await self._raw.post_movie_import(json[i:i+per_request])])
+                        json_items = json_items[per_request:]
+            except DeadlineExceeded:
+                limit.skipped.extend(list(ids[looked_up:]) + json_items)
+        return movies, existing_movies, invalid_ids, excluded_ids
+
+    async def edit_multiple_movies(self, ids: List[Union[int, str, Movie]],
+                                   root_folder: Optional[Union[str, int, RootFolder]] = None,
+                                   move_files: bool = False,
+                                   quality_profile: Optional[Union[str, int, QualityProfile]] = None,
+                                   monitored: Optional[bool] = None,
+                                   minimum_availability: Optional[str] = None,
+                                   tags: Optional[List[Union[str, int, Tag]]] = None,
+                                   apply_tags: str = "add",
+                                   per_request: int = None,
+                                   deadline: Optional[Union[float, Deadline]] = None
+                                   ) -> Tuple[List[Movie], List[Union[int, str, Movie]]]:
+        """ Edit multiple Movies in Radarr by their TMDb IDs. See :meth:`~arrapi.apis.radarr.RadarrAPI.edit_multiple_movies`. """
+        movie_list = []
+        invalid_ids = []
+        pending = list(ids)
+        with deadline_scope(deadline) as limit:
+            try:
+                json = await self._validate_edit_options(root_folder=root_folder, move_files=move_files,
+                                                         quality_profile=quality_profile, monitored=monitored,
+                                                         minimum_availability=minimum_availability, tags=tags,
+                                                         apply_tags=apply_tags)
+                valid_ids, invalid_ids, pending = await self._validate_ids(ids)
+                if len(valid_ids) > 0:
+                    if per_request is None:
+                        per_request = len(valid_ids)
+                    for i in range(0, len(valid_ids), per_request):
+                        json["movieIds"] = valid_ids[i:i+per_request]
+                        movie_list.extend([Movie(self, data=m) for m in await self._raw.put_movie_editor(json)])
+                        pending = pending[per_request:]
+            except DeadlineExceeded:
+                limit.skipped.extend(pending)
+        return movie_list, invalid_ids
+
+    async def delete_multiple_movies(self, ids: List[Union[int, str, Movie]],
+                                     addImportExclusion: bool = False,
+                                     deleteFiles: bool = False,
+                                     per_request: int = None,
+                                     deadline: Optional[Union[float, Deadline]] = None
+                                     ) -> List[Union[int, str, Movie]]:
+        """ Deletes multiple Movies in Radarr by their TMDb IDs. See :meth:`~arrapi.apis.radarr.RadarrAPI.delete_multiple_movies`. """
+        invalid_ids = []
+        pending = list(ids)
+        with deadline_scope(deadline) as limit:
+            try:
+                valid_ids, invalid_ids, pending = await self._validate_ids(ids)
+                if len(valid_ids) > 0:
+                    json = {
+                        "deleteFiles": deleteFiles,
+                        "addImportExclusion": addImportExclusion
+                    }
+                    if per_request is None:
+                        per_request = len(valid_ids)
+                    for i in range(0, len(valid_ids), per_request):
+                        json["movieIds"] = valid_ids[i:i+per_request]
+                        await self._raw.delete_movie_editor(json)
+                        pending = pending[per_request:]
+            except DeadlineExceeded:
+                limit.skipped.extend(pending)
         return invalid_ids
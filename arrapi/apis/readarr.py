@@ -5,5 +5,5 @@ from ..raws.readarr import ReadarrRawAPI
 
 
 class ReadarrAPI(BaseV1API):
-    def __init__(self, url: str, apikey: str, session: Optional[Session] = None) -> None:
-        super().__init__(ReadarrRawAPI(url, apikey, session=session))
+    def __init__(self, url: str, apikey: str, session: Optional[Session] = None, **kwargs) -> None:
+        super().__init__(ReadarrRawAPI(url, apikey, session=session, **kwargs))
@@ -1,10 +1,17 @@
+import asyncio
+
 from requests import Session
-from typing import Optional, Union, List, Tuple
+from typing import Any, AsyncIterator, Iterator, Optional, Union, List, Tuple, TYPE_CHECKING
 from arrapi import LanguageProfile, RootFolder, QualityProfile, Series, Tag, NotFound, Invalid, Exists
-from .base import BaseAPI
-from ..exceptions import Excluded
+from .base import BaseAPI, AsyncBaseAPI
+from ..exceptions import DeadlineExceeded, Excluded
 from ..objs.simple import SonarrExclusion
-from ..raws.sonarr import SonarrRawAPI
+from ..raws.deadline import Deadline, deadline_scope
+from ..raws.sonarr import SonarrRawAPI, AsyncSonarrRawAPI
+from ..table import SERIES_COLUMNS, build_table, table_output
+
+if TYPE_CHECKING:
+    from aiohttp import ClientSession
 
 
 class SonarrAPI(BaseAPI):
@@ -14,10 +21,18 @@ class SonarrAPI(BaseAPI):
             url (str): URL of Sonarr application.
             apikey (str): apikey for the Sonarr application.
             session (Optional[Session]): Session object to use.
+            kwargs: Connection options passed to :class:`~arrapi.raws.base.BaseRawAPI`.
+
+        Attributes:
+            raw_results (bool): Return the decoded dictionaries from the Sonarr API instead of building objects from
+                :meth:`all_series`, :meth:`iter_series`, :meth:`search_series`, :meth:`all_tags`, :meth:`quality_profile`,
+                :meth:`language_profile`, and :meth:`root_folder`. Each of them also takes ``raw`` to choose for that
+                call. Methods that take Series, Tags, Quality Profiles, Language Profiles, or Root Folders accept the
+                dictionaries too.
      """
 
-    def __init__(self, url: str, apikey: str, session: Optional[Session] = None) -> None:
-        super().__init__(SonarrRawAPI(url, apikey, session=session))
+    def __init__(self, url: str, apikey: str, session: Optional[Session] = None, **kwargs) -> None:
+        super().__init__(SonarrRawAPI(url, apikey, session=session, **kwargs))
         self.exclusions = []
         self.monitor_options = ["all", "future", "missing", "existing", "pilot", "firstSeason", "latestSeason", "none"]
         self.series_type_options = ["standard", "daily", "anime"]
@@ -89,22 +104,27 @@ class SonarrAPI(BaseAPI):
     def _validate_tvdb_ids(self, ids):
         """ Validate TVDb IDs. """
         valid_ids = []
+        valid_inputs = []
         invalid_ids = []
         used_ids = []
         sonarr_ids = {}
-        for s in self.all_series():
-            sonarr_ids[s.tvdbId] = s
-            sonarr_ids[str(s.tvdbId)] = s
+        for s in self.all_series(raw=True):
+            sonarr_ids[s.get("tvdbId")] = s
+            sonarr_ids[str(s.get("tvdbId"))] = s
         for _id in ids:
-            if isinstance(_id, Series) and str(_id.tvdbId) not in used_ids:
-                valid_ids.append(_id.id)
-                used_ids.append(str(_id.tvdbId))
-            elif _id in sonarr_ids and str(_id) not in used_ids:
-                valid_ids.append(sonarr_ids[_id].id)
+            show = (_id.get("id"), _id.get("tvdbId")) if isinstance(_id, dict) \
+                else (_id.id, _id.tvdbId) if isinstance(_id, Series) else None
+            if show and str(show[1]) not in used_ids:
+                valid_ids.append(show[0])
+                valid_inputs.append(_id)
+                used_ids.append(str(show[1]))
+            elif show is None and _id in sonarr_ids and str(_id) not in used_ids:
+                valid_ids.append(sonarr_ids[_id]["id"])
+                valid_inputs.append(_id)
                 used_ids.append(str(_id))
             else:
                 invalid_ids.append(_id)
-        return valid_ids, invalid_ids
+        return valid_ids, invalid_ids, valid_inputs
 
     def respect_list_exclusions_when_adding(self):
         """ Stores all List Exclusions so whenever :func:`~arrapi.objs.reload.Series.add` or :func:`~arrapi.apis.sonarr.SonarrAPI.add_multiple_series` is called the additions will be checked against the Exclusion List  """
@@ -128,24 +148,75 @@ class SonarrAPI(BaseAPI):
             raise ValueError("Expected either series_id or tvdb_id args")
         return Series(self, series_id=series_id, tvdb_id=tvdb_id)
 
-    def all_series(self) -> List[Series]:
+    def all_series(self, prefetch: Optional[List[str]] = None, fields: Optional[List[str]] = None, raw: Optional[bool] = None) -> List[Union[Series, dict]]:
         """ Gets all :class:`~arrapi.objs.reload.Series` in Sonarr.
 
+            Parameters:
+                prefetch (Optional[List[str]]): Fields to resolve with one request each after getting the Series. Valid options are tags, qualityProfile, profile (v2 Only), and languageProfile. See :meth:`~arrapi.apis.base.BaseAPI.resolve`.
+                fields (Optional[List[str]]): Only keep these fields of each Series (i.e. id, tvdbId, path, monitored, tags), the rest of its data is dropped as soon as it's decoded. Fields are attribute names or keys of the Sonarr response, the ID and title are always kept. Reading a field that wasn't kept reloads the whole Series, for asyncio APIs it raises an ``AttributeError`` instead. Editing a Series reloads it first.
+                raw (Optional[bool]): Return the decoded dictionaries instead of Series, ``fields`` still drops the rest of each one. Defaults to :attr:`raw_results`.
+
+            Returns:
+                List[Union[:class:`~arrapi.objs.reload.Series`, dict]]: List of Series in Sonarr.
+
+            Raises:
+                :class:`~arrapi.exceptions.Invalid`: When one of the prefetch fields given is invalid or prefetch is used with raw results.
+        """
+        loaders = self._resolvers(prefetch)
+        if loaders and self._is_raw(raw):
+            raise Invalid("prefetch can't be used with raw results")
+        items = self._raw.get_series()
+        keys = Series._projection(fields, self._raw.new_codebase)
+        if self._is_raw(raw):
+            return items if keys is None else [{k: v for k, v in d.items() if k in keys} for d in items]
+        return self._resolve([Series._projected(self, d, keys) for d in items], loaders)
+
+    def iter_series(self, raw: Optional[bool] = None) -> Iterator[Union[Series, dict]]:
+        """ Iterates over all :class:`~arrapi.objs.reload.Series` in Sonarr, decoding the response as it's received.
+
+            Uses about the same memory no matter how big the library is, unlike :meth:`all_series` which holds the
+            whole response and every Series in memory at once.
+
+            Parameters:
+                raw (Optional[bool]): Yield the decoded dictionaries instead of Series. Defaults to :attr:`raw_results`.
+
             Returns:
-                List[:class:`~arrapi.objs.reload.Series`]: List of Series in Sonarr.
+                Iterator[Union[:class:`~arrapi.objs.reload.Series`, dict]]: Iterator of Series in Sonarr.
         """
-        return [Series(self, data=d) for d in self._raw.get_series()]
+        raw = self._is_raw(raw)
+        for data in self._raw.iter_series():
+            yield data if raw else Series(self, data=data)
+
+    def series_table(self, columns: Optional[List[str]] = None, output: str = "auto") -> Any:
+        """ Gets all Series in Sonarr as columns built straight from the response instead of as
+            :class:`~arrapi.objs.reload.Series` objects. Nested fields are flattened into columns named by their path
+            i.e. ``rating.value`` or ``statistics.sizeOnDisk``.
 
-    def search_series(self, term: str) -> List[Series]:
+            Parameters:
+                columns (Optional[List[str]]): Columns to build. Defaults to every column in :data:`arrapi.table.SERIES_COLUMNS`.
+                output (str): What to build. Valid options are auto, array, numpy, pandas, or pyarrow. auto builds NumPy arrays when NumPy is installed and ``array.array`` otherwise.
+
+            Returns:
+                Any: Dictionary of column name to column for auto, array, and numpy, or a pandas ``DataFrame`` or pyarrow ``Table``. See :func:`~arrapi.table.build_table`.
+
+            Raises:
+                :class:`~arrapi.exceptions.Invalid`: When the output is invalid or its module isn't installed.
+        """
+        output = table_output(output)
+        return build_table(self._raw.get_series(), SERIES_COLUMNS, columns=columns, output=output)
+
+    def search_series(self, term: str, raw: Optional[bool] = None) -> List[Union[Series, dict]]:
         """ Gets a list of :class:`~arrapi.objs.reload.Series` by a search term.
 
             Parameters:
                 term (str): Term to Search for.
+                raw (Optional[bool]): Return the decoded dictionaries instead of Series. Defaults to :attr:`raw_results`.
 
             Returns:
-                List[:class:`~arrapi.objs.reload.Series`]: List of Series's found.
+                List[Union[:class:`~arrapi.objs.reload.Series`, dict]]: List of Series's found.
         """
-        return [Series(self, data=d) for d in self._raw.get_series_lookup(term)]
+        items = self._raw.get_series_lookup(term)
+        return items if self._is_raw(raw) else [Series(self, data=d) for d in items]
 
     def add_series(
             self,
@@ -272,7 +343,8 @@ class SonarrAPI(BaseAPI):
                             unmet_search: bool = True,
                             series_type: str = "standard",
                             tags: Optional[List[Union[str, int, Tag]]] = None,
-                            per_request: int = None
+                            per_request: int = None,
+                            deadline: Optional[Union[float, Deadline]] = None
                             ) -> Tuple[List[Series], List[Series], List[Union[int, Series]], List[int]]:
         """ Adds multiple Series to Sonarr in a single call by their TVDb IDs.
 
@@ -292,6 +364,7 @@ class SonarrAPI(BaseAPI):
                 series_type (str): Series Type for the Series. Valid options are ``standard``, ``daily``, or ``anime``.
                 tags (Optional[List[Union[str, int, Tag]]]): Tags to be added to the Series.
                 per_request (int): Number of Series to add per request.
+                deadline (Optional[Union[float, Deadline]]): Seconds or :class:`~arrapi.raws.deadline.Deadline` to finish the whole call in. Items not reached in time are added to ``Deadline.skipped`` and the results so far are returned.
 
             Returns:
                 Tuple[List[:class:`~arrapi.objs.reload.Series`], List[:class:`~arrapi.objs.reload.Series`], List[Union[int, Series]], List[int]]: List of Series that were able to be added, List of Series already in Sonarr, List of Series that could not be found, List of Movies that were excluded.
@@ -299,41 +372,52 @@ class SonarrAPI(BaseAPI):
             Raises:
                 :class:`~arrapi.exceptions.Invalid`: When one of the options given is invalid.
         """
-        options = self._validate_add_options(root_folder, quality_profile, language_profile=language_profile,
-                                             monitor=monitor, season_folder=season_folder, search=search,
-                                             unmet_search=unmet_search, series_type=series_type, tags=tags)
         json = []
+        json_items = []
         series = []
         existing_series = []
         invalid_ids = []
         excluded_ids = []
         used_ids = []
-        for input_item in ids:
-            path = input_item[1] if isinstance(input_item, tuple) else None
-            item = input_item[0] if isinstance(input_item, tuple) else input_item
+        looked_up = 0
+        with deadline_scope(deadline) as limit:
             try:
-                if isinstance(item, Series):
-                    show = item
-                else:
-                    if int(item) in used_ids or (self.exclusions and int(item) in self.exclusions):
-                        raise Excluded(int(item))
-                    show = self.get_series(tvdb_id=item)
-                if show.tvdbId in used_ids or (self.exclusions and show.tvdbId in self.exclusions):
-                    raise Excluded(show.tvdbId)
-                used_ids.append(show.tvdbId)
-                try:
-                    json.append(show._get_add_data(options, path=path))
-                except Exists:
-                    existing_series.append(show)
-            except NotFound:
-                invalid_ids.append(input_item)
-            except Excluded as e:
-                excluded_ids.append(int(str(e)))
-        if len(json) > 0:
-            if per_request is None:
-                per_request = len(json)
-            for i in range(0, len(json), per_request):
-                series.extend([Series(self, data=s) for s in self._raw.post_series_import(json[i:i+per_request])])
+                options = self._validate_add_options(root_folder, quality_profile, language_profile=language_profile,
+                                                     monitor=monitor, season_folder=season_folder, search=search,
+                                                     unmet_search=unmet_search, series_type=series_type, tags=tags)
+                for looked_up, input_item in enumerate(ids):
+                    path = input_item[1] if isinstance(input_item, tuple) else None
+                    item = input_item[0] if isinstance(input_item, tuple) else input_item
+                    try:
+                        if isinstance(item, Series):
+                            show = item
+                        elif isinstance(item, dict):
+                            show = Series(self, data=dict(item))
+                        else:
+                            if int(item) in used_ids or (self.exclusions and int(item) in self.exclusions):
+                                raise Excluded(int(item))
+                            show = self.get_series(tvdb_id=item)
+                        if show.tvdbId in used_ids or (self.exclusions and show.tvdbId in self.exclusions):
+                            raise Excluded(show.tvdbId)
+                        used_ids.append(show.tvdbId)
+                        try:
+                            json.append(show._get_add_data(options, path=path))
+                            json_items.append(input_item)
+                        except Exists:
+                            existing_series.append(show)
+                    except NotFound:
+                        invalid_ids.append(input_item)
+                    except Excluded as e:
+                        excluded_ids.append(int(str(e)))
+                looked_up = len(ids)
+                if len(json) > 0:
+                    if per_request is None:
+                        per_request = len(json)
+                    for i in range(0, len(json), per_request):
+                        series.extend([Series(self, data=s) for s in self._raw.post_series_import(json[i:i+per_request])])
+                        json_items = json_items[per_request:]
+            except DeadlineExceeded:
+                limit.skipped.extend(list(ids[looked_up:]) + json_items)
         return series, existing_series, invalid_ids, excluded_ids
 
     def edit_multiple_series(self, ids: List[Union[Series, int]],
@@ -347,7 +431,8 @@ class SonarrAPI(BaseAPI):
                              series_type: Optional[str] = None,
                              tags: Optional[List[Union[str, int, Tag]]] = None,
                              apply_tags: str = "add",
-                             per_request: int = None
+                             per_request: int = None,
+                             deadline: Optional[Union[float, Deadline]] = None
                              ) -> Tuple[List[Series], List[Union[Series, int]]]:
         """ Edit multiple Series in Sonarr by their TVDb IDs.
 
@@ -364,6 +449,7 @@ class SonarrAPI(BaseAPI):
                 tags (Optional[List[Union[str, int, Tag]]]): Tags to be added, replaced, or removed from the Series.
                 apply_tags (str): How you want to edit the Tags. Valid options are add, replace, or remove.
                 per_request (int): Number of Series to edit per request.
+                deadline (Optional[Union[float, Deadline]]): Seconds or :class:`~arrapi.raws.deadline.Deadline` to finish the whole call in. Items not reached in time are added to ``Deadline.skipped`` and the results so far are returned.
 
             Returns:
                 Tuple[List[:class:`~arrapi.objs.reload.Series`], List[Union[Series, int]]]: List of Series that were able to be edited, List of Series that could not be found in Sonarr.
@@ -371,28 +457,36 @@ class SonarrAPI(BaseAPI):
             Raises:
                 :class:`~arrapi.exceptions.Invalid`: When one of the options given is invalid.
         """
-        json = self._validate_edit_options(root_folder=root_folder, move_files=move_files,
-                                           quality_profile=quality_profile, language_profile=language_profile,
-                                           monitor=monitor, monitored=monitored, season_folder=season_folder,
-                                           series_type=series_type, tags=tags, apply_tags=apply_tags)
         series_list = []
-        valid_ids, invalid_ids = self._validate_tvdb_ids(ids)
-        if len(valid_ids) > 0:
-            if per_request is None:
-                per_request = len(valid_ids)
-            if "monitor" in json:
-                json_monitor = json.pop("monitor")
-                for i in range(0, len(valid_ids), per_request):
-                    self._raw.edit_series_monitoring(valid_ids[i:i+per_request], json_monitor)
-            for i in range(0, len(valid_ids), per_request):
-                json["seriesIds"] = valid_ids[i:i+per_request]
-                series_list.extend([Series(self, data=s) for s in self._raw.put_series_editor(json)])
+        invalid_ids = []
+        pending = list(ids)
+        with deadline_scope(deadline) as limit:
+            try:
+                json = self._validate_edit_options(root_folder=root_folder, move_files=move_files,
+                                                   quality_profile=quality_profile, language_profile=language_profile,
+                                                   monitor=monitor, monitored=monitored, season_folder=season_folder,
+                                                   series_type=series_type, tags=tags, apply_tags=apply_tags)
+                valid_ids, invalid_ids, pending = self._validate_tvdb_ids(ids)
+                if len(valid_ids) > 0:
+                    if per_request is None:
+                        per_request = len(valid_ids)
+                    if "monitor" in json:
+                        json_monitor = json.pop("monitor")
+                        for i in range(0, len(valid_ids), per_request):
+                            self._raw.edit_series_monitoring(valid_ids[i:i+per_request], json_monitor)
+                    for i in range(0, len(valid_ids), per_request):
+                        json["seriesIds"] = valid_ids[i:i+per_request]
+                        series_list.extend([Series(self, data=s) for s in self._raw.put_series_editor(json)])
+                        pending = pending[per_request:]
+            except DeadlineExceeded:
+                limit.skipped.extend(pending)
         return series_list, invalid_ids
 
     def delete_multiple_series(self, ids: List[Union[int, Series]],
                                addImportExclusion: bool = False,
                                deleteFiles: bool = False,
-                               per_request: int = None
+                               per_request: int = None,
+                               deadline: Optional[Union[float, Deadline]] = None
                                ) -> List[Union[Series, int]]:
         """ Deletes multiple Series in Sonarr by their TVDb IDs.
 
@@ -401,35 +495,49 @@ class SonarrAPI(BaseAPI):
                 addImportExclusion (bool): Add Import Exclusion for these TVDb IDs.
                 deleteFiles (bool): Delete Files for these TVDb IDs.
                 per_request (int): Number of Series to delete per request.
+                deadline (Optional[Union[float, Deadline]]): Seconds or :class:`~arrapi.raws.deadline.Deadline` to finish the whole call in. Items not reached in time are added to ``Deadline.skipped`` and the results so far are returned.
 
             Returns:
                 List[Union[Series, int]]: List of Series that could not be found in Sonarr.
         """
-        valid_ids, invalid_ids = self._validate_tvdb_ids(ids)
-        if len(valid_ids) > 0:
-            json = {
-                "deleteFiles": deleteFiles,
-                "addImportExclusion": addImportExclusion
-            }
-            if per_request is None:
-                per_request = len(valid_ids)
-            for i in range(0, len(valid_ids), per_request):
-                json["seriesIds"] = valid_ids[i:i+per_request]
-                self._raw.delete_series_editor(json)
+        invalid_ids = []
+        pending = list(ids)
+        with deadline_scope(deadline) as limit:
+            try:
+                valid_ids, invalid_ids, pending = self._validate_tvdb_ids(ids)
+                if len(valid_ids) > 0:
+                    json = {
+                        "deleteFiles": deleteFiles,
+                        "addImportExclusion": addImportExclusion
+                    }
+                    if per_request is None:
+                        per_request = len(valid_ids)
+                    for i in range(0, len(valid_ids), per_request):
+                        json["seriesIds"] = valid_ids[i:i+per_request]
+                        self._raw.delete_series_editor(json)
+                        pending = pending[per_request:]
+            except DeadlineExceeded:
+                limit.skipped.extend(pending)
         return invalid_ids
 
-    def language_profile(self) -> List[LanguageProfile]:
+    def language_profile(self, raw: Optional[bool] = None) -> List[Union[LanguageProfile, dict]]:
         """ Gets every :class:`~arrapi.objs.reload.LanguageProfile` in Sonarr.
 
+            Parameters:
+                raw (Optional[bool]): Return the decoded dictionaries instead of Language Profiles. Defaults to :attr:`raw_results`.
+
             Returns:
-                List[:class:`~arrapi.objs.reload.LanguageProfile`]: List of all Language Profiles
+                List[Union[:class:`~arrapi.objs.reload.LanguageProfile`, dict]]: List of all Language Profiles
         """
-        return [LanguageProfile(self, data) for data in self._raw.get_languageProfile()]
+        items = self._raw.get_languageProfile()
+        return items if self._is_raw(raw) else [LanguageProfile(self, data) for data in items]
 
     def _validate_language_profile(self, language_profile):
         """ Validate Quality Profile options. """
+        if isinstance(language_profile, dict):
+            language_profile = language_profile["id"]
         options = []
-        for profile in self.language_profile():
+        for profile in self.language_profile(raw=False):
             options.append(profile)
             if (isinstance(language_profile, LanguageProfile) and profile.id == language_profile.id) \
                     or (isinstance(language_profile, int) and profile.id == language_profile) \
@@ -437,3 +545,375 @@ class SonarrAPI(BaseAPI):
                 return profile.id
         raise Invalid(f"Invalid Language Profile: '{language_profile}' Options: {options}")
 
+
+class AsyncSonarrAPI(AsyncBaseAPI):
+    """ asyncio version of :class:`~arrapi.apis.sonarr.SonarrAPI`, every method that talks to Sonarr is a coroutine.
+
+        Use it as an async context manager or call :meth:`connect` before using it and :meth:`close` when done.
+
+        .. code-block:: python
+
+            async with AsyncSonarrAPI(url, apikey) as sonarr:
+                series = await sonarr.all_series()
+
+        Parameters:
+            url (str): URL of Sonarr application.
+            apikey (str): apikey for the Sonarr application.
+            session (Optional[aiohttp.ClientSession]): Session object to use.
+            kwargs: Connection options passed to :class:`~arrapi.raws.base.AsyncBaseRawAPI`.
+     """
+
+    def __init__(self, url: str, apikey: str, session: Optional["ClientSession"] = None, **kwargs) -> None:
+        super().__init__(AsyncSonarrRawAPI(url, apikey, session=session, **kwargs))
+        self.exclusions = []
+        self.monitor_options = ["all", "future", "missing", "existing", "pilot", "firstSeason", "latestSeason", "none"]
+        self.series_type_options = ["standard", "daily", "anime"]
+
+    async def _validate_add_options(self, root_folder, quality_profile, language_profile=None, monitor="all",
+                                    season_folder=True, search=True, unmet_search=False, series_type="standard",
+                                    tags=None):
+        """ Validate Add Series options. """
+        options = {
+            "root_folder": await self._validate_root_folder(root_folder),
+            "quality_profile" if self._raw.new_codebase else "profileId": await self._validate_quality_profile(quality_profile),
+            "monitor": self._validate_monitor(monitor),
+            "monitored": monitor != "none",
+            "season_folder": True if season_folder is True else False,
+            "search": True if search is True else False,
+            "unmet_search": True if unmet_search is True else False,
+            "series_type": self._validate_series_type(series_type),
+        }
+        if not self._raw.v4:
+            if not language_profile:
+                raise Invalid("Language Profile Required")
+            options["language_profile"] = await self._validate_language_profile(language_profile)
+        if tags:
+            options["tags"] = await self._validate_tags(tags)
+        return options
+
+    async def _validate_edit_options(self, root_folder=None, path=None, move_files=False, quality_profile=None,
+                                     language_profile=None, monitor=None, monitored=None, season_folder=None,
+                                     series_type=None, tags=None, apply_tags="add"):
+        """ Validate Edit Series options. """
+        variables = [root_folder, path, quality_profile, language_profile, monitor,
+                     monitored, season_folder, series_type, tags]
+        if all(v is None for v in variables):
+            raise ValueError("Expected either root_folder, path, quality_profile, language_profile, "
+                             "monitor, monitored, season_folder, series_type, or tags args")
+        options = {"moveFiles": True if move_files is True else False}
+        if root_folder is not None:
+            options["rootFolderPath"] = await self._validate_root_folder(root_folder)
+        if path is not None:
+            options["path"] = path
+        if quality_profile is not None:
+            options["qualityProfileId" if self._raw.new_codebase else "profileId"] = await self._validate_quality_profile(quality_profile)
+        if language_profile is not None and not self._raw.v4:
+            options["languageProfileId"] = await self._validate_language_profile(language_profile)
+        if monitor is not None:
+            options["monitor"] = self._validate_monitor(monitor)
+        if monitored is not None:
+            options["monitored"] = True if monitored is True else False
+        if season_folder is not None:
+            options["seasonFolder"] = True if season_folder is True else False
+        if series_type is not None:
+            options["seriesType"] = self._validate_series_type(series_type)
+        if tags is not None:
+            options["tags"] = await self._validate_tags(tags, create=apply_tags != "remove")
+            if apply_tags in self.apply_tags_options:
+                options["applyTags"] = apply_tags
+            else:
+                raise Invalid(f"Invalid apply_tags: '{apply_tags}' Options: {self.apply_tags_options}")
+        return options
+
+    def _validate_monitor(self, monitor):
+        """ Validate Monitor options. """
+        return self._validate_options("Monitor", monitor, self.monitor_options)
+
+    def _validate_series_type(self, series_type):
+        """ Validate Series Type options. """
+        return self._validate_options("Series Type", series_type, self.series_type_options)
+
+    async def _validate_tvdb_ids(self, ids):
+        """ Validate TVDb IDs. """
+        valid_ids = []
+        valid_inputs = []
+        invalid_ids = []
+        used_ids = []
+        sonarr_ids = {}
+        for s in await self.all_series(raw=True):
+            sonarr_ids[s.get("tvdbId")] = s
+            sonarr_ids[str(s.get("tvdbId"))] = s
+        for _id in ids:
+            show = (_id.get("id"), _id.get("tvdbId")) if isinstance(_id, dict) \
+                else (_id.id, _id.tvdbId) if isinstance(_id, Series) else None
+            if show and str(show[1]) not in used_ids:
+                valid_ids.append(show[0])
+                valid_inputs.append(_id)
+                used_ids.append(str(show[1]))
+            elif show is None and _id in sonarr_ids and str(_id) not in used_ids:
+                valid_ids.append(sonarr_ids[_id]["id"])
+                valid_inputs.append(_id)
+                used_ids.append(str(_id))
+            else:
+                invalid_ids.append(_id)
+        return valid_ids, invalid_ids, valid_inputs
+
+    async def respect_list_exclusions_when_adding(self):
+        """ See :meth:`~arrapi.apis.sonarr.SonarrAPI.respect_list_exclusions_when_adding`. """
+        self.exclusions = [SonarrExclusion(self, ex).tvdbId for ex in await self._raw.get_importlistexclusion()]
+
+    async def get_series(self, series_id: Optional[int] = None, tvdb_id: Optional[int] = None) -> Series:
+        """ Gets a :class:`~arrapi.objs.reload.Series` by one of the IDs. See :meth:`~arrapi.apis.sonarr.SonarrAPI.get_series`. """
+        if all(v is None for v in [series_id, tvdb_id]):
+            raise ValueError("Expected either series_id or tvdb_id args")
+        series = Series(self, data={"id": series_id, "tvdbId": tvdb_id})
+        await series.reload()
+        return series
+
+    async def all_series(self, prefetch: Optional[List[str]] = None, fields: Optional[List[str]] = None, raw: Optional[bool] = None) -> List[Union[Series, dict]]:
+        """ Gets all :class:`~arrapi.objs.reload.Series` in Sonarr. See :meth:`~arrapi.apis.sonarr.SonarrAPI.all_series`. """
+        loaders = self._resolvers(prefetch)
+        if loaders and self._is_raw(raw):
+            raise Invalid("prefetch can't be used with raw results")
+        items = await self._raw.get_series()
+        keys = Series._projection(fields, self._raw.new_codebase)
+        if self._is_raw(raw):
+            return items if keys is None else [{k: v for k, v in d.items() if k in keys} for d in items]
+        return await self._resolve([Series._projected(self, d, keys) for d in items], loaders)
+
+    async def iter_series(self, raw: Optional[bool] = None) -> AsyncIterator[Union[Series, dict]]:
+        """ Iterates over all :class:`~arrapi.objs.reload.Series` in Sonarr, decoding the response as it's received. See :meth:`~arrapi.apis.sonarr.SonarrAPI.iter_series`. """
+        raw = self._is_raw(raw)
+        async for data in self._raw.iter_series():
+            yield data if raw else Series(self, data=data)
+
+    async def series_table(self, columns: Optional[List[str]] = None, output: str = "auto") -> Any:
+        """ Gets all Series in Sonarr as columns instead of objects. See :meth:`~arrapi.apis.sonarr.SonarrAPI.series_table`. """
+        output = table_output(output)
+        return build_table(await self._raw.get_series(), SERIES_COLUMNS, columns=columns, output=output)
+
+    async def search_series(self, term: str, raw: Optional[bool] = None) -> List[Union[Series, dict]]:
+        """ Gets a list of :class:`~arrapi.objs.reload.Series` by a search term. See :meth:`~arrapi.apis.sonarr.SonarrAPI.search_series`. """
+        items = await self._raw.get_series_lookup(term)
+        return items if self._is_raw(raw) else [Series(self, data=d) for d in items]
+
+    async def add_series(
+            self,
+            root_folder: Union[str, int, "RootFolder"],
+            quality_profile: Union[str, int, "QualityProfile"],
+            language_profile: Union[str, int, "LanguageProfile"],
+            series_id: Optional[int] = None,
+            tvdb_id: Optional[int] = None,
+            monitor: str = "all",
+            season_folder: bool = True,
+            search: bool = True,
+            unmet_search: bool = True,
+            series_type: str = "standard",
+            tags: Optional[List[Union[str, int, Tag]]] = None
+    ) -> Series:
+        """ Gets a :class:`~arrapi.objs.reload.Series` by one of the IDs and adds it to Sonarr. See :meth:`~arrapi.apis.sonarr.SonarrAPI.add_series`. """
+        series = await self.get_series(series_id=series_id, tvdb_id=tvdb_id)
+        await series.add(root_folder, quality_profile, language_profile, monitor=monitor, season_folder=season_folder,
+                         search=search, unmet_search=unmet_search, series_type=series_type, tags=tags)
+        return series
+
+    async def edit_series(
+            self,
+            series_id: Optional[int] = None,
+            tvdb_id: Optional[int] = None,
+            path: Optional[str] = None,
+            move_files: bool = False,
+            quality_profile: Optional[Union[str, int, "QualityProfile"]] = None,
+            language_profile: Optional[Union[str, int, "LanguageProfile"]] = None,
+            monitor: Optional[str] = None,
+            monitored: Optional[bool] = None,
+            season_folder: Optional[bool] = None,
+            series_type: Optional[str] = None,
+            tags: Optional[List[Union[str, int, Tag]]] = None,
+            apply_tags: str = "add"
+    ) -> Series:
+        """ Gets a :class:`~arrapi.objs.reload.Series` by one of the IDs and edits it in Sonarr. See :meth:`~arrapi.apis.sonarr.SonarrAPI.edit_series`. """
+        series = await self.get_series(series_id=series_id, tvdb_id=tvdb_id)
+        await series.edit(path=path, move_files=move_files, quality_profile=quality_profile,
+                          language_profile=language_profile, monitor=monitor, monitored=monitored,
+                          season_folder=season_folder, series_type=series_type, tags=tags, apply_tags=apply_tags)
+        return series
+
+    async def delete_series(
+            self,
+            series_id: Optional[int] = None,
+            tvdb_id: Optional[int] = None,
+            addImportListExclusion: bool = False,
+            deleteFiles: bool = False
+    ) -> Series:
+        """ Gets a :class:`~arrapi.objs.reload.Series` by one of the IDs and deletes it from Sonarr. See :meth:`~arrapi.apis.sonarr.SonarrAPI.delete_series`. """
+        series = await self.get_series(series_id=series_id, tvdb_id=tvdb_id)
+        await series.delete(addImportListExclusion=addImportListExclusion, deleteFiles=deleteFiles)
+        return series
+
+    async def add_multiple_series(self, ids: List[Union[Series, int, Tuple[Union[Series, int], str]]],
+                                  root_folder: Union[str, int, RootFolder],
+                                  quality_profile: Union[str, int, QualityProfile],
+                                  language_profile: Optional[Union[str, int, LanguageProfile]] = None,
+                                  monitor: str = "all",
+                                  season_folder: bool = True,
+                                  search: bool = True,
+                                  unmet_search: bool = True,
+                                  series_type: str = "standard",
+                                  tags: Optional[List[Union[str, int, Tag]]] = None,
+                                  per_request: int = None,
+                                  max_lookups: int = 10,
+                                  deadline: Optional[Union[float, Deadline]] = None
+                                  ) -> Tuple[List[Series], List[Series], List[Union[int, Series]], List[int]]:
+        """ Adds multiple Series to Sonarr in a single call by their TVDb IDs. See :meth:`~arrapi.apis.sonarr.SonarrAPI.add_multiple_series`.
+
+            The lookups for the IDs given are run concurrently.
+
+            Parameters:
+                max_lookups (int): Maximum number of lookups running at once.
+        """
+        items = [(i[0], i[1]) if isinstance(i, tuple) else (i, None) for i in ids]
+        items = [(Series(self, data=dict(i)) if isinstance(i, dict) else i, p) for i, p in items]
+        semaphore = asyncio.Semaphore(max_lookups)
+
+        async def lookup(_item):
+            async with semaphore:
+                return await self.get_series(tvdb_id=_item)
+
+        json = []
+        json_items = []
+        series = []
+        existing_series = []
+        invalid_ids = []
+        excluded_ids = []
+        used_ids = []
+        looked_up = 0
+        with deadline_scope(deadline) as limit:
+            try:
+                options = await self._validate_add_options(root_folder, quality_profile, language_profile=language_profile,
+                                                           monitor=monitor, season_folder=season_folder, search=search,
+                                                           unmet_search=unmet_search, series_type=series_type, tags=tags)
+                lookups = {}
+                for item, _ in items:
+                    if isinstance(item, Series) or item in lookups or (self.exclusions and int(item) in self.exclusions):
+                        continue
+                    lookups[item] = lookup(item)
+                found = dict(zip(lookups, await asyncio.gather(*lookups.values(), return_exceptions=True)))
+
+                for looked_up, (input_item, (item, path)) in enumerate(zip(ids, items)):
+                    try:
+                        if isinstance(item, Series):
+                            show = item
+                        else:
+                            if int(item) in used_ids or (self.exclusions and int(item) in self.exclusions):
+                                raise Excluded(int(item))
+                            show = found[item]
+                            if isinstance(show, BaseException):
+                                raise show
+                        if show.tvdbId in used_ids or (self.exclusions and show.tvdbId in self.exclusions):
+                            raise Excluded(show.tvdbId)
+                        used_ids.append(show.tvdbId)
+                        try:
+                            json.append(show._get_add_data(options, path=path))
+                            json_items.append(input_item)
+                        except Exists:
+                            existing_series.append(show)
+                    except NotFound:
+                        invalid_ids.append(input_item)
+                    except Excluded as e:
+                        excluded_ids.append(int(str(e)))
+                looked_up = len(ids)
+                if len(json) > 0:
+                    if per_request is None:
+                        per_request = len(json)
+                    for i in range(0, len(json), per_request):
+                        series.extend([Series(self, data=s) for s in await self._raw.post_series_import(json[i:i+per_request])])
+                        json_items = json_items[per_request:]
+            except DeadlineExceeded:
+                limit.skipped.extend(list(ids[looked_up:]) + json_items)
+        return series, existing_series, invalid_ids, excluded_ids
+
+    async def edit_multiple_series(self, ids: List[Union[Series, int]],
+                                   root_folder: Optional[Union[str, int, RootFolder]] = None,
+                                   move_files: bool = False,
+                                   quality_profile: Optional[Union[str, int, QualityProfile]] = None,
+                                   language_profile: Optional[Union[str, int, LanguageProfile]] = None,
+                                   monitor: Optional[str] = None,
+                                   monitored: Optional[bool] = None,
+                                   season_folder: Optional[bool] = None,
+                                   series_type: Optional[str] = None,
+                                   tags: Optional[List[Union[str, int, Tag]]] = None,
+                                   apply_tags: str = "add",
+                                   per_request: int = None,
+                                   deadline: Optional[Union[float, Deadline]] = None
+                                   ) -> Tuple[List[Series], List[Union[Series, int]]]:
+        """ Edit multiple Series in Sonarr by their TVDb IDs. See :meth:`~arrapi.apis.sonarr.SonarrAPI.edit_multiple_series`. """
+        series_list = []
+        invalid_ids = []
+        pending = list(ids)
+        with deadline_scope(deadline) as limit:
+            try:
+                json = await self._validate_edit_options(root_folder=root_folder, move_files=move_files,
+                                                         quality_profile=quality_profile, language_profile=language_profile,
+                                                         monitor=monitor, monitored=monitored, season_folder=season_folder,
+                                                         series_type=series_type, tags=tags, apply_tags=apply_tags)
+                valid_ids, invalid_ids, pending = await self._validate_tvdb_ids(ids)
+                if len(valid_ids) > 0:
+                    if per_request is None:
+                        per_request = len(valid_ids)
+                    if "monitor" in json:
+                        json_monitor = json.pop("monitor")
+                        for i in range(0, len(valid_ids), per_request):
+                            await self._raw.edit_series_monitoring(valid_ids[i:i+per_request], json_monitor)
+                    for i in range(0, len(valid_ids), per_request):
+                        json["seriesIds"] = valid_ids[i:i+per_request]
+                        series_list.extend([Series(self, data=s) for s in await self._raw.put_series_editor(json)])
+                        pending = pending[per_request:]
+            except DeadlineExceeded:
+                limit.skipped.extend(pending)
+        return series_list, invalid_ids
+
+    async def delete_multiple_series(self, ids: List[Union[int, Series]],
+                                     addImportExclusion: bool = False,
+                                     deleteFiles: bool = False,
+                                     per_request: int = None,
+                                     deadline: Optional[Union[float, Deadline]] = None
+                                     ) -> List[Union[Series, int]]:
+        """ Deletes multiple Series in Sonarr by their TVDb IDs. See :meth:`~arrapi.apis.sonarr.SonarrAPI.delete_multiple_series`. """
+        invalid_ids = []
+        pending = list(ids)
+        with deadline_scope(deadline) as limit:
+            try:
+                valid_ids, invalid_ids, pending = await self._validate_tvdb_ids(ids)
+                if len(valid_ids) > 0:
+                    json = {
+                        "deleteFiles": deleteFiles,
+                        "addImportExclusion": addImportExclusion
+                    }
+                    if per_request is None:
+                        per_request = len(valid_ids)
+                    for i in range(0, len(valid_ids), per_request):
+                        json["seriesIds"] = valid_ids[i:i+per_request]
+                        await self._raw.delete_series_editor(json)
+                        pending = pending[per_request:]
+            except DeadlineExceeded:
+                limit.skipped.extend(pending)
+        return invalid_ids
+
+    async def language_profile(self, raw: Optional[bool] = None) -> List[Union[LanguageProfile, dict]]:
+        """ Gets every :class:`~arrapi.objs.reload.LanguageProfile` in Sonarr. See :meth:`~arrapi.apis.sonarr.SonarrAPI.language_profile`. """
+        items = await self._raw.get_languageProfile()
+        return items if self._is_raw(raw) else [LanguageProfile(self, data) for data in items]
+
+    async def _validate_language_profile(self, language_profile):
+        """ Validate Language Profile options. """
+        if isinstance(language_profile, dict):
+            language_profile = language_profile["id"]
+        options = []
+        for profile in await self.language_profile(raw=False):
+            options.append(profile)
+            if (isinstance(language_profile, LanguageProfile) and profile.id == language_profile.id) \
+                    or (isinstance(language_profile, int) and profile.id == language_profile) \
+                    or (profile.name == language_profile):
+                return profile.id
+        raise Invalid(f"Invalid Language Profile: '{language_profile}' Options: {options}")
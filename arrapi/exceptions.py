@@ -31,3 +31,23 @@ class NotFound(ArrException):
 class Unauthorized(ArrException):
     """ Invalid apikey. """
     pass
+
+
+class DeadlineExceeded(ConnectionFailure):
+    """ Deadline passed before the request finished. """
+    pass
+
+
+class CircuitOpen(ConnectionFailure):
+    """ Request not sent because the circuit breaker for the Arr instance is open. """
+    pass
+
+
+class TooManyLazyLoads(ArrException):
+    """ More partial objects were reloaded by reading their fields than a :class:`~arrapi.profiling.LazyLoads` allows. """
+    pass
+
+
+class LazyLoadWarning(UserWarning):
+    """ More partial objects were reloaded by reading their fields than a :class:`~arrapi.profiling.LazyLoads` allows. """
+    pass
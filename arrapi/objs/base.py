@@ -1,31 +1,268 @@
+import functools, inspect, sys, time
+
 from abc import ABC, abstractmethod
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional, Union, Any
 
+from arrapi.profiling import current_call, lazy_load
+
+
+def _parse_isoformat(value: str) -> datetime:
+    """ Parses an ISO 8601 timestamp from an Arr instance keeping its timezone, a trailing ``Z`` is UTC. Fractional
+        seconds are cut to microseconds (.NET sends up to seven digits). This is what :meth:`datetime.fromisoformat`
+        does from Python 3.11, older versions don't take the ``Z`` or more than six digits.
+
+        Parameters:
+            value (str): Timestamp to parse.
+
+        Returns:
+            datetime: Parsed Timestamp.
+
+        Raises:
+            :class:`ValueError`: When the value isn't an ISO 8601 timestamp.
+    """
+    utc = value[-1:] in ("Z", "z")
+    if utc:
+        value = value[:-1]
+    seconds, dot, fraction = value.partition(".")
+    if dot:
+        digits = len(fraction)
+        for i, char in enumerate(fraction):
+            if not char.isdigit():
+                digits = i
+                break
+        value = f"{seconds}.{fraction[:min(digits, 6)]:0<6}{fraction[digits:]}"
+    parsed = datetime.fromisoformat(value)
+    return parsed.replace(tzinfo=timezone.utc) if utc else parsed
+
+
+# Parses the timestamps of Arr payloads. The C parser from Python 3.11 is faster than looking the timestamp up in a memo,
+# the Python fallback isn't so the timestamps it parses (which repeat a lot i.e. release dates and air times) are memoized.
+if sys.version_info >= (3, 11):
+    parse_date = datetime.fromisoformat
+else:
+    parse_date = functools.lru_cache(maxsize=16384)(_parse_isoformat)
+
+
+class Field:
+    """ Field of an Arr Object parsed from its data with :meth:`BaseObj._parse` the first time it's read. The parsed
+        value is kept in the dictionary in the object's ``_parsed`` slot (created on the first read) so later reads are a
+        dictionary lookup. Reading a field that is ``None`` on a partial object reloads the object once, as does reading a
+        field left out of a projected object (see :meth:`BaseObj._projected`).
+
+        Parameters:
+            attrs (Union[str, list]): Attributes of the data to parse.
+            value_type (str): Type that the value is.
+            default_is_none (bool): Makes default None.
+            is_list (bool): Is list of values.
+            new_codebase (Optional[bool]): Only an attribute when the Arr instance is (``True``) or is not (``False``)
+                on the new codebase.
+            old_attrs (Optional[Union[str, list]]): Attributes of the data to parse instead when the Arr instance is not
+                on the new codebase.
+            requires (Optional[str]): Only an attribute when this key is in the data.
+    """
+    __slots__ = ("name", "attrs", "value_type", "default_is_none", "is_list", "new_codebase", "old_attrs", "requires")
+
+    def __init__(self, attrs: Union[str, list], value_type: str = "str", default_is_none: bool = False,
+                 is_list: bool = False, new_codebase: Optional[bool] = None,
+                 old_attrs: Optional[Union[str, list]] = None, requires: Optional[str] = None):
+        self.name = None
+        self.attrs = attrs
+        self.value_type = value_type
+        self.default_is_none = default_is_none
+        self.is_list = is_list
+        self.new_codebase = new_codebase
+        self.old_attrs = old_attrs
+        self.requires = requires
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def key(self, new_codebase: bool) -> str:
+        """ Returns the top level key of the data this field is parsed from. """
+        attrs = self.attrs if new_codebase or self.old_attrs is None else self.old_attrs
+        return attrs[0] if isinstance(attrs, list) else attrs
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        parsed = obj._parsed
+        if parsed is not None and self.name in parsed:
+            return parsed[self.name]
+        new_codebase = obj._raw.new_codebase
+        if self.new_codebase is not None and new_codebase != self.new_codebase:
+            raise AttributeError(f"'{type(obj).__name__}' object has no attribute '{self.name}'")
+        attrs = self.attrs if new_codebase or self.old_attrs is None else self.old_attrs
+        if obj._fields is not None and not obj._loading \
+                and (attrs[0] if isinstance(attrs, list) else attrs) not in obj._fields:
+            if obj._raw.is_async:
+                raise AttributeError(f"'{type(obj).__name__}' attribute '{self.name}' wasn't in the fields loaded, "
+                                     f"await reload() to load all of them")
+            lazy_load(obj, self.name)
+            obj.reload()
+            return getattr(obj, self.name)
+        if self.requires and self.requires not in obj._data:
+            raise AttributeError(f"'{type(obj).__name__}' object has no attribute '{self.name}'")
+        value = obj._parse(attrs=attrs, value_type=self.value_type, default_is_none=self.default_is_none,
+                           is_list=self.is_list)
+        if value is None and not obj._loading and obj._partial and not obj._raw.is_async:
+            lazy_load(obj, self.name)
+            obj._load(None)
+            return getattr(obj, self.name)
+        if obj._parsed is None:
+            obj._parsed = {}
+        obj._parsed[self.name] = value
+        return value
+
+
+class _LazyField:
+    """ Data descriptor for a field of a partial object that was ``None`` when loaded. Reading it reloads the object
+        once, otherwise the value is kept in the field's slot. """
+    __slots__ = ("name", "slot")
+
+    def __init__(self, name, slot):
+        self.name = name
+        self.slot = slot
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        if not obj._loading and obj._partial:
+            lazy_load(obj, self.name)
+            obj._load(None)
+            return getattr(obj, self.name)
+        return obj.__dict__.get(self.name) if self.slot is None else self.slot.__get__(obj, owner)
+
+    def __set__(self, obj, value):
+        if self.slot is None:
+            obj.__dict__[self.name] = value
+        else:
+            self.slot.__set__(obj, value)
+
+
+_lazy_classes = {}
+
+
+def _lazy_class(cls, names):
+    """ Returns the subclass of ``cls`` with a :class:`_LazyField` for each of the names given. """
+    key = (cls, names)
+    lazy_cls = _lazy_classes.get(key)
+    if lazy_cls is None:
+        attrs = {"__slots__": (), "__module__": cls.__module__, "__qualname__": cls.__qualname__,
+                 "__doc__": cls.__doc__, "_lazy_base": cls, "_lazy_names": names}
+        for name in names:
+            slot = next((vars(c)[name] for c in cls.__mro__ if name in vars(c)), None)
+            attrs[name] = _LazyField(name, slot if hasattr(slot, "__set__") else None)
+        lazy_cls = _lazy_classes[key] = type(cls.__name__, (cls,), attrs)
+    return lazy_cls
+
+
+def _rebuild(cls, names):
+    """ Returns an empty object of the class given, with the lazy fields given, for its state to be restored into. """
+    obj = cls.__new__(cls)
+    if names:
+        obj.__class__ = _lazy_class(cls, names)
+    return obj
+
+
+def _base_class(obj):
+    """ Returns the class of the object without its lazy fields. """
+    return getattr(type(obj), "_lazy_base", type(obj))
+
+
+def _intern(data, keys):
+    """ Interns the string values and string list items of the keys given in place. """
+    for key in keys:
+        value = data.get(key)
+        if value.__class__ is str:
+            data[key] = sys.intern(value)
+        elif value.__class__ is list:
+            data[key] = [sys.intern(v) if v.__class__ is str else v for v in value]
+
 
 class BaseObj(ABC):
     """ Base Class for Arr Objects.
 
+        Attributes are plain slots so reading them runs no Python code. A partial object (one built from a list
+        response) with fields that were ``None`` is given a subclass with a :class:`_LazyField` descriptor for only
+        those fields, reading one of them reloads the whole object once and turns it back into the plain class.
+
+        The string values of the keys in ``_interned`` take only a few distinct values (i.e. ``status``), they're
+        interned in the data when the object is loaded so large libraries share one string per value instead of keeping
+        the copy decoded for every object.
+
+        Objects with :class:`Field` attributes have a ``_parsed`` slot holding the values parsed so far and a ``_fields``
+        slot holding the keys of the data that were kept when the object was projected, both are dropped when the object
+        is reloaded.
+
         Attributes:
             id (int): ID of the Object.
     """
+    __slots__ = ("_loading", "_arr", "_raw", "_partial", "_name", "_data", "_lazy", "id")
+    _interned = ()
+    _parsed = None
+    _fields = None
 
     def __init__(self, arr, data):
-        self._loading = True
         self._arr = arr
         self._raw = arr._raw
         self._partial = False
-        self._name = None
-        self._load(data)
+        call = current_call()
+        if call is None or call.building:
+            self._load(data)
+            return
+        call.building = True
+        start = time.perf_counter()
+        waited = call.network + call.decode
+        try:
+            self._load(data)
+        finally:
+            call.building = False
+            call.build += time.perf_counter() - start - (call.network + call.decode - waited)
+
+    @classmethod
+    def _projection(cls, fields, new_codebase):
+        """ Returns the top level keys of the data holding the fields given, which can be attribute names or keys of the
+            data. The ID and the key the object is named from are always kept. """
+        if fields is None:
+            return None
+        keys = {"id", "title"}
+        for field in fields:
+            descriptor = getattr(cls, field, None)
+            keys.add(descriptor.key(new_codebase) if isinstance(descriptor, Field) else field)
+        return frozenset(keys)
+
+    @classmethod
+    def _projected(cls, arr, data, keys):
+        """ Returns the object built from only the keys of the data given so the rest of the data can be freed. Reading
+            a field that isn't kept reloads the whole object, the class must have a ``_fields`` slot. """
+        if keys is None:
+            return cls(arr, data)
+        obj = cls(arr, {k: v for k, v in data.items() if k in keys})
+        obj._fields = keys
+        return obj
 
     @abstractmethod
     def _load(self, data):
+        if self._interned and data:
+            _intern(data, self._interned)
         self._data = data
         self._loading = True
+        self._lazy = None
+        lazy_base = getattr(type(self), "_lazy_base", None)
+        if lazy_base is not None:
+            self.__class__ = lazy_base
+        if self._parsed is not None:
+            self._parsed = None
+        if self._fields is not None:
+            self._fields = None
         self.id = None
 
     def _finish(self, name):
         self._name = name
+        if self._lazy:
+            self.__class__ = _lazy_class(type(self), frozenset(self._lazy))
+            self._lazy = None
         self._loading = False
 
     def __repr__(self):
@@ -35,7 +272,7 @@ class BaseObj(ABC):
         return f"[{self.id}:{self._name}]" if self.id is not None else f"[{self._name}]"
 
     def __eq__(self, other):
-        if type(self) is type(other):
+        if _base_class(self) is _base_class(other):
             if self.id is None and other.id is None:
                 return self._name == other._name
             elif self.id is not None and other.id is not None:
@@ -47,22 +284,63 @@ class BaseObj(ABC):
         else:
             return str(self._name) == str(other)
 
-    def __getattribute__(self, item):
-        value = super().__getattribute__(item)
-        if item.startswith("_") or self._loading or not self._partial or value is not None:
-            return value
-        self._load(None)
-        return super().__getattribute__(item)
-
     def __setattr__(self, key, value):
-        if key.startswith("_") or self._loading:
-            super().__setattr__(key, value)
-        else:
+        if key[0] == "_":
+            object.__setattr__(self, key, value)
+        elif not self._loading:
             raise AttributeError("Attributes cannot be edited")
+        else:
+            if value is None and self._partial and not self._raw.is_async:
+                if self._lazy is None:
+                    self._lazy = set()
+                self._lazy.add(key)
+            elif self._lazy and key in self._lazy:
+                self._lazy.discard(key)
+            object.__setattr__(self, key, value)
 
     def __delattr__(self, key):
         raise AttributeError("Attributes cannot be deleted")
 
+    def __reduce_ex__(self, protocol):
+        """ Copies and pickles the object by its base class without reloading it, the class with lazy fields is rebuilt
+            when it's restored since it can't be looked up by name. """
+        cls = _base_class(self)
+        slots = {}
+        for klass in cls.__mro__:
+            for name in vars(klass).get("__slots__", ()):
+                if not name.startswith("__"):
+                    try:
+                        # Read through the slot itself, reading a lazy field would reload the object
+                        slots[name] = vars(klass)[name].__get__(self, cls)
+                    except AttributeError:
+                        pass
+        return _rebuild, (cls, getattr(type(self), "_lazy_names", None)), (getattr(self, "__dict__", None) or None, slots)
+
+    def __setstate__(self, state):
+        """ Restores the attributes when copied or unpickled, bypassing the read-only check. """
+        state, slots = state if isinstance(state, tuple) else (state, None)
+        for key, value in {**(state or {}), **(slots or {})}.items():
+            object.__setattr__(self, key, value)
+
+    @staticmethod
+    def _then(result, callback):
+        """ Calls the callback with the result, when the result is awaitable (from an asyncio API) the callback is
+            called once it has been awaited and a coroutine is returned instead.
+
+            Parameters:
+                result (Any): Result of a raw API call.
+                callback (Callable): Called with the result.
+
+            Returns:
+                Any: Return value of the callback or a coroutine for it.
+        """
+        if inspect.isawaitable(result):
+            async def _await_result():
+                value = callback(await result)
+                return (await value) if inspect.isawaitable(value) else value
+            return _await_result()
+        return callback(result)
+
     def _parse(self, data: Any = None, attrs: Optional[Union[str, list]] = None, value_type: str = "str",
                default_is_none: bool = False, is_list: bool = False):
         """ Validate the value given from the options given.
@@ -112,7 +390,7 @@ class BaseObj(ABC):
             else:
                 return default
         elif value_type == "date":
-            return datetime.strptime(value[:-1].split(".")[0], "%Y-%m-%dT%H:%M:%S")
+            return parse_date(value)
         elif value_type == "collection":
             return arrapi.objs.simple.Collection(self._arr, value)
         elif value_type == "image":
@@ -120,11 +398,11 @@ class BaseObj(ABC):
         elif value_type == "season":
             return arrapi.objs.simple.Season(self._arr, value)
         elif value_type == "intTag":
-            return arrapi.objs.reload.Tag(self._arr, {"id": value})
+            return self._arr._reference(arrapi.objs.reload.Tag, value)
         elif value_type == "intQualityProfile":
-            return arrapi.objs.reload.QualityProfile(self._arr, {"id": value})
+            return self._arr._reference(arrapi.objs.reload.QualityProfile, value)
         elif value_type == "intLanguageProfile":
-            return arrapi.objs.reload.LanguageProfile(self._arr, {"id": value})
+            return self._arr._reference(arrapi.objs.reload.LanguageProfile, value)
         elif value_type == "str":
             return str(value)
         else:
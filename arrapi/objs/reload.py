@@ -2,15 +2,17 @@ from abc import abstractmethod
 from typing import Union, Optional, List, TYPE_CHECKING
 
 from arrapi import NotFound, Invalid, Exists, Excluded
-from arrapi.objs.base import BaseObj
+from arrapi.objs.base import BaseObj, Field
 
 if TYPE_CHECKING:
     from arrapi.objs.simple import RootFolder
 
 class ReloadObj(BaseObj):
+    __slots__ = ()
+
     def __init__(self, arr, data, load=False):
         super().__init__(arr, data)
-        if load:
+        if load and data is not None:
             self._load(None)
 
     @abstractmethod
@@ -22,9 +24,26 @@ class ReloadObj(BaseObj):
     def _full_load(self):
         pass
 
+    def _deleted(self, _):
+        self._loading = True
+        self.id = None
+        self._loading = False
+
     def reload(self):
-        """ Reloads the Object """
-        self._load(None)
+        """ Reloads the Object, when connected through an asyncio API this must be awaited. """
+        self._partial = False
+        return self._then(self._full_load(), self._reloaded)
+
+    def _reloaded(self, data):
+        self._load(data)
+        self._partial = False
+
+    @staticmethod
+    def _first_item(items):
+        if items:
+            return items[0]
+        else:
+            raise NotFound("Item Not Found")
 
 
 class QualityProfile(ReloadObj):
@@ -34,6 +53,7 @@ class QualityProfile(ReloadObj):
             id (int): ID of the Quality Profile.
             name (str): Name of the Quality Profile.
     """
+    __slots__ = ("name",)
 
     def _load(self, data):
         super()._load(data)
@@ -52,6 +72,7 @@ class LanguageProfile(ReloadObj):
             id (int): ID of the Language Profile.
             name (str): Name of the Language Profile.
     """
+    __slots__ = ("name",)
 
     def _load(self, data):
         super()._load(data)
@@ -71,12 +92,13 @@ class SystemStatus(ReloadObj):
 
         Check dir(SystemStatus) for all attribute as the rest are auto built.
     """
+    __slots__ = ("version", "__dict__")
 
-    def __init__(self, arr):
-        super().__init__(arr, None)
+    def __init__(self, arr, data=None):
+        super().__init__(arr, data)
 
     def _load(self, data):
-        super()._load(None)
+        super()._load(data)
         self.version = ""
         for key, value in self._data.items():
             if key.startswith("is") or key == "migrationVersion":
@@ -109,6 +131,10 @@ class Tag(ReloadObj):
             artistIds (List[int]): Lidarr Artist IDs. (Only when loaded with details using :class:`~arrapi.apis.lidarr.LidarrAPI`)
             authorIds (List[int]): Readarr Author IDs. (Only when loaded with details using :class:`~arrapi.apis.readarr.ReadarrAPI`)
     """
+    __slots__ = (
+        "label", "detail", "delayProfileIds", "notificationIds", "restrictionIds", "importListIds", "movieIds",
+        "seriesIds", "artistIds", "authorIds"
+    )
 
     def _load(self, data):
         super()._load(data)
@@ -144,11 +170,12 @@ class Tag(ReloadObj):
                 label (str): Label to change tag to.
 
         """
-        self._load(self._raw.put_tag_id(self.id, label))
+        return self._then(self._raw.put_tag_id(self.id, label), self._load)
 
     def delete(self) -> None:
         """ Delete the :class:`~arrapi.objs.reload.Tag`."""
-        self._raw.delete_tag_id(self.id)
+        self._arr._forget(Tag, self.id)
+        return self._then(self._raw.delete_tag_id(self.id), lambda _: None)
 
 
 class Command(ReloadObj):
@@ -172,6 +199,10 @@ class Command(ReloadObj):
             updateScheduledTask (bool):Update Scheduled Task.
             id (int): ID of the Command.
     """
+    __slots__ = (
+        "name", "commandName", "message", "body", "priority", "status", "queued", "started", "ended", "duration",
+        "exception", "trigger", "sendUpdatesToClient", "updateScheduledTask", "stateChangeTime", "lastExecutionTime"
+    )
 
     def _load(self, data):
         super()._load(data)
@@ -245,72 +276,70 @@ class Movie(ReloadObj):
             profileId (int): Quality Profile ID of the Movie. (Radarr v2 Only)
             profile (:class:`~arrapi.objs.reload.QualityProfile`): Quality Profile of the Movie. (Radarr v2 Only)
     """
+    __slots__ = ("_parsed", "_fields")
+    _interned = ("status", "minimumAvailability", "certification", "studio", "genres")
+    tmdbId = Field("tmdbId", value_type="int", default_is_none=True)
+    imdbId = Field("imdbId")
+    title = Field("title")
+    sortTitle = Field("sortTitle")
+    sizeOnDisk = Field("sizeOnDisk", value_type="int")
+    status = Field("status")
+    overview = Field("overview")
+    inCinemas = Field("inCinemas", value_type="date")
+    physicalRelease = Field("physicalRelease", value_type="date")
+    digitalRelease = Field("digitalRelease", value_type="date")
+    images = Field("images", value_type="image", is_list=True)
+    website = Field("website")
+    year = Field("year", value_type="int")
+    hasFile = Field("hasFile", value_type="bool")
+    youTubeTrailerId = Field("youTubeTrailerId")
+    studio = Field("studio")
+    path = Field("path")
+    monitored = Field("monitored", value_type="bool")
+    minimumAvailability = Field("minimumAvailability")
+    isAvailable = Field("isAvailable", value_type="bool")
+    folderName = Field("folderName")
+    folder = Field("folder")
+    runtime = Field("runtime", value_type="int")
+    cleanTitle = Field("cleanTitle")
+    titleSlug = Field("titleSlug")
+    certification = Field("certification")
+    genres = Field("genres", is_list=True)
+    tagsIds = Field("tags", value_type="int", is_list=True)
+    tags = Field("tags", value_type="intTag", is_list=True)
+    added = Field("added", value_type="date")
+    rating_votes = Field(["rating", "votes"], value_type="int")
+    rating_value = Field(["rating", "value"], value_type="float")
+    collection = Field("collection", value_type="collection")
+    originalTitle = Field("originalTitle", new_codebase=True)
+    qualityProfileId = Field("qualityProfileId", value_type="int", new_codebase=True)
+    qualityProfile = Field("qualityProfileId", value_type="intQualityProfile", new_codebase=True)
+    collection_name = Field(["collection", "name"], new_codebase=True)
+    collection_tmdbId = Field(["collection", "tmdbId"], value_type="int", default_is_none=True, new_codebase=True)
+    downloaded = Field("downloaded", value_type="bool", new_codebase=False)
+    profileId = Field("profileId", value_type="int", new_codebase=False)
+    profile = Field("profileId", value_type="intQualityProfile", new_codebase=False)
 
     def __init__(self, radarr, data=None, movie_id=None, tmdb_id=None, imdb_id=None):
         self._loading = True
+        self._partial = False
+        self._lazy = None
         self.id = movie_id
-        self.tmdbId = tmdb_id
-        self.imdbId = imdb_id
+        self._parsed = {"tmdbId": tmdb_id, "imdbId": imdb_id}
+        self._fields = None
         super().__init__(radarr, data, load=movie_id or tmdb_id or imdb_id)
 
     def _load(self, data):
         super()._load(data)
-        self.title = self._parse(attrs="title")
-        self.sortTitle = self._parse(attrs="sortTitle")
-        self.sizeOnDisk = self._parse(attrs="sizeOnDisk", value_type="int")
-        self.status = self._parse(attrs="status")
-        self.overview = self._parse(attrs="overview")
-        self.inCinemas = self._parse(attrs="inCinemas", value_type="date")
-        self.physicalRelease = self._parse(attrs="physicalRelease", value_type="date")
-        self.digitalRelease = self._parse(attrs="digitalRelease", value_type="date")
-        self.images = self._parse(attrs="images", value_type="image", is_list=True)
-        self.website = self._parse(attrs="website")
-        self.year = self._parse(attrs="year", value_type="int")
-        self.hasFile = self._parse(attrs="hasFile", value_type="bool")
-        self.youTubeTrailerId = self._parse(attrs="youTubeTrailerId")
-        self.studio = self._parse(attrs="studio")
-        self.path = self._parse(attrs="path")
-        self.monitored = self._parse(attrs="monitored", value_type="bool")
-        self.minimumAvailability = self._parse(attrs="minimumAvailability")
-        self.isAvailable = self._parse(attrs="isAvailable", value_type="bool")
-        self.folderName = self._parse(attrs="folderName")
-        self.folder = self._parse(attrs="folder")
-        self.runtime = self._parse(attrs="runtime", value_type="int")
-        self.cleanTitle = self._parse(attrs="cleanTitle")
-        self.imdbId = self._parse(attrs="imdbId")
-        self.tmdbId = self._parse(attrs="tmdbId", value_type="int", default_is_none=True)
-        self.titleSlug = self._parse(attrs="titleSlug")
-        self.certification = self._parse(attrs="certification")
-        self.genres = self._parse(attrs="genres", is_list=True)
-        self.tagsIds = self._parse(attrs="tags", value_type="int", is_list=True)
-        self.tags = self._parse(attrs="tags", value_type="intTag", is_list=True)
-        self.added = self._parse(attrs="added", value_type="date")
-        self.rating_votes = self._parse(attrs=["rating", "votes"], value_type="int")
-        self.rating_value = self._parse(attrs=["rating", "value"], value_type="float")
-        self.collection = self._parse(attrs="collection", value_type="collection")
         self.id = self._parse(attrs="id", value_type="int", default_is_none=True)
-        if self._raw.new_codebase:
-            self.originalTitle = self._parse(attrs="originalTitle")
-            self.digitalRelease = self._parse(attrs="digitalRelease", value_type="date")
-            self.qualityProfileId = self._parse(attrs="qualityProfileId", value_type="int")
-            self.qualityProfile = self._parse(attrs="qualityProfileId", value_type="intQualityProfile")
-            self.collection_name = self._parse(attrs=["collection", "name"])
-            self.collection_tmdbId = self._parse(attrs=["collection", "tmdbId"], value_type="int", default_is_none=True)
-        else:
-            self.downloaded = self._parse(attrs="downloaded", value_type="bool")
-            self.profileId = self._parse(attrs="profileId", value_type="int")
-            self.profile = self._parse(attrs="profileId", value_type="intQualityProfile")
-        self._finish(self.title)
+        self._finish(self._data.get("title"))
 
     def _full_load(self):
         if self.id:
             return self._raw.get_movie_id(self.id)
         elif self.tmdbId or self.imdbId:
-            items = self._raw.get_movie_lookup(f"tmdb:{self.tmdbId}" if self.tmdbId else f"imdb:{self.imdbId}")
-            if items:
-                return items[0]
-            else:
-                raise NotFound("Item Not Found")
+            lookup = self._raw.get_movie_lookup(f"tmdb:{self.tmdbId}" if self.tmdbId else f"imdb:{self.imdbId}")
+            return self._then(lookup, self._first_item)
         else:
             raise Invalid("Load Failed: No Load Input")
 
@@ -357,14 +386,17 @@ class Movie(ReloadObj):
         """
         if self._arr.exclusions and self.tmdbId in self._arr.exclusions:
             raise Excluded(f"TMDb ID: {self.tmdbId} is excluded from being added.")
-        self._load(self._raw.post_movie(self._get_add_data(self._arr._validate_add_options(
+        return self._then(self._arr._validate_add_options(
             root_folder,
             quality_profile,
             monitor=monitor,
             search=search,
             minimum_availability=minimum_availability,
             tags=tags
-        ))))
+        ), self._add)
+
+    def _add(self, options):
+        return self._then(self._raw.post_movie(self._get_add_data(options)), self._load)
 
     def edit(self,
              path: Optional[str] = None,
@@ -393,9 +425,14 @@ class Movie(ReloadObj):
         """
         if not self.id:
             raise NotFound(f"{self.title} not found Radarr, it must be added before editing")
-        options = self._arr._validate_edit_options(path=path, move_files=move_files, quality_profile=quality_profile,
-                                                   monitored=monitored, minimum_availability=minimum_availability,
-                                                   tags=tags, apply_tags=apply_tags)
+        return self._then(self._arr._validate_edit_options(path=path, move_files=move_files,
+                                                           quality_profile=quality_profile, monitored=monitored,
+                                                           minimum_availability=minimum_availability,
+                                                           tags=tags, apply_tags=apply_tags), self._edit)
+
+    def _edit(self, options):
+        if self._fields is not None:
+            return self._then(self.reload(), lambda _: self._edit(options))
         valid_move_files = options["path"] if "path" in options else False
         for key, value in options.items():
             if key == "tags":
@@ -410,7 +447,7 @@ class Movie(ReloadObj):
                     raise Invalid(f"Invalid apply_tags: '{tag_type}' Options: {self._arr.apply_tags_options}")
             elif key != ["applyTags", "moveFiles"]:
                 self._data[key] = value
-        self._load(self._raw.put_movie_id(self.id, self._data, moveFiles=valid_move_files))
+        return self._then(self._raw.put_movie_id(self.id, self._data, moveFiles=valid_move_files), self._load)
 
     def delete(self, addImportExclusion: bool = False, deleteFiles: bool = False) -> None:
         """ Delete this Movie from Radarr.
@@ -424,10 +461,8 @@ class Movie(ReloadObj):
         """
         if not self.id:
             raise NotFound(f"{self.title} not found Radarr, it must be added before deleting")
-        self._raw.delete_movie_id(self.id, addImportExclusion=addImportExclusion, deleteFiles=deleteFiles)
-        self._loading = True
-        self.id = None
-        self._loading = False
+        return self._then(self._raw.delete_movie_id(self.id, addImportExclusion=addImportExclusion,
+                                                    deleteFiles=deleteFiles), self._deleted)
 
 
 class Series(ReloadObj):
@@ -482,82 +517,74 @@ class Series(ReloadObj):
             profileId (int): Quality Profile ID of the Series. (Sonarr v2 Only)
             profile (:class:`~arrapi.objs.reload.QualityProfile`): Quality Profile of the Series. (Sonarr v2 Only)
     """
+    __slots__ = ("_parsed", "_fields")
+    _interned = ("status", "network", "airTime", "seriesType", "certification", "genres")
+    tvdbId = Field("tvdbId", value_type="int")
+    title = Field("title")
+    sortTitle = Field("sortTitle")
+    status = Field("status")
+    overview = Field("overview")
+    nextAiring = Field("nextAiring", value_type="date")
+    previousAiring = Field("previousAiring", value_type="date")
+    network = Field("network")
+    airTime = Field("airTime")
+    images = Field("images", value_type="image", is_list=True)
+    year = Field("year", value_type="int")
+    path = Field("path")
+    languageProfileId = Field("languageProfileId", value_type="int")
+    languageProfile = Field("languageProfileId", value_type="intLanguageProfile")
+    seasonFolder = Field("seasonFolder", value_type="bool")
+    monitored = Field("monitored", value_type="bool")
+    useSceneNumbering = Field("useSceneNumbering", value_type="bool")
+    folder = Field("folder")
+    runtime = Field("runtime", value_type="int")
+    cleanTitle = Field("cleanTitle")
+    imdbId = Field("imdbId")
+    tvRageId = Field("tvRageId", value_type="int")
+    tvMazeId = Field("tvMazeId", value_type="int")
+    titleSlug = Field("titleSlug")
+    firstAired = Field("firstAired", value_type="date")
+    seriesType = Field("seriesType")
+    certification = Field("certification")
+    genres = Field("genres", is_list=True)
+    tagsIds = Field("tags", value_type="int", is_list=True)
+    tags = Field("tags", value_type="intTag", is_list=True)
+    added = Field("added", value_type="date")
+    seasons = Field("seasons", value_type="season", is_list=True)
+    rating_votes = Field(["rating", "votes"], value_type="int", requires="rating")
+    rating_value = Field(["rating", "value"], value_type="float", requires="rating")
+    ended = Field("ended", value_type="bool", new_codebase=True)
+    rootFolderPath = Field("rootFolderPath", new_codebase=True)
+    qualityProfileId = Field("qualityProfileId", value_type="int", new_codebase=True)
+    qualityProfile = Field("qualityProfileId", value_type="intQualityProfile", new_codebase=True)
+    seasonCount = Field(["statistics", "seasonCount"], value_type="int", old_attrs="seasonCount")
+    totalEpisodeCount = Field(["statistics", "totalEpisodeCount"], value_type="int", old_attrs="totalEpisodeCount")
+    episodeCount = Field(["statistics", "episodeCount"], value_type="int", old_attrs="episodeCount")
+    episodeFileCount = Field(["statistics", "episodeFileCount"], value_type="int", old_attrs="episodeFileCount")
+    sizeOnDisk = Field(["statistics", "sizeOnDisk"], value_type="int", old_attrs="sizeOnDisk")
+    percentOfEpisodes = Field(["statistics", "percentOfEpisodes"], value_type="float", new_codebase=True)
+    profileId = Field("profileId", value_type="int", new_codebase=False)
+    profile = Field("profileId", value_type="intQualityProfile", new_codebase=False)
 
     def __init__(self, sonarr, data=None, series_id=None, tvdb_id=None):
         self._loading = True
+        self._partial = False
+        self._lazy = None
         self.id = series_id
-        self.tvdbId = tvdb_id
+        self._parsed = {"tvdbId": tvdb_id}
+        self._fields = None
         super().__init__(sonarr, data, load=series_id or tvdb_id)
 
     def _load(self, data):
         super()._load(data)
-        self.title = self._parse(attrs="title")
-        self.sortTitle = self._parse(attrs="sortTitle")
-        self.status = self._parse(attrs="status")
-        self.overview = self._parse(attrs="overview")
-        self.nextAiring = self._parse(attrs="nextAiring", value_type="date")
-        self.previousAiring = self._parse(attrs="previousAiring", value_type="date")
-        self.network = self._parse(attrs="network")
-        self.airTime = self._parse(attrs="airTime")
-        self.images = self._parse(attrs="images", value_type="image", is_list=True)
-        self.year = self._parse(attrs="year", value_type="int")
-        self.path = self._parse(attrs="path")
-        self.languageProfileId = self._parse(attrs="languageProfileId", value_type="int")
-        self.languageProfile = self._parse(attrs="languageProfileId", value_type="intLanguageProfile")
-        self.seasonFolder = self._parse(attrs="seasonFolder", value_type="bool")
-        self.monitored = self._parse(attrs="monitored", value_type="bool")
-        self.useSceneNumbering = self._parse(attrs="useSceneNumbering", value_type="bool")
-        self.folder = self._parse(attrs="folder")
-        self.runtime = self._parse(attrs="runtime", value_type="int")
-        self.cleanTitle = self._parse(attrs="cleanTitle")
-        self.imdbId = self._parse(attrs="imdbId")
-        self.tvdbId = self._parse(attrs="tvdbId", value_type="int")
-        self.tvRageId = self._parse(attrs="tvRageId", value_type="int")
-        self.tvMazeId = self._parse(attrs="tvMazeId", value_type="int")
-        self.titleSlug = self._parse(attrs="titleSlug")
-        self.firstAired = self._parse(attrs="firstAired", value_type="date")
-        self.seriesType = self._parse(attrs="seriesType")
-        self.certification = self._parse(attrs="certification")
-        self.genres = self._parse(attrs="genres", is_list=True)
-        self.tagsIds = self._parse(attrs="tags", value_type="int", is_list=True)
-        self.tags = self._parse(attrs="tags", value_type="intTag", is_list=True)
-        self.added = self._parse(attrs="added", value_type="date")
-        if "rating" in self._data:
-            self.rating_votes = self._parse(attrs=["rating", "votes"], value_type="int")
-            self.rating_value = self._parse(attrs=["rating", "value"], value_type="float")
         self.id = self._parse(attrs="id", value_type="int", default_is_none=True)
-        self.seasons = self._parse(attrs="seasons", value_type="season", is_list=True)
-
-        if self._raw.new_codebase:
-            self.ended = self._parse(attrs="ended", value_type="bool")
-            self.rootFolderPath = self._parse(attrs="rootFolderPath")
-            self.qualityProfileId = self._parse(attrs="qualityProfileId", value_type="int")
-            self.qualityProfile = self._parse(attrs="qualityProfileId", value_type="intQualityProfile")
-            self.seasonCount = self._parse(attrs=["statistics", "seasonCount"], value_type="int")
-            self.totalEpisodeCount = self._parse(attrs=["statistics", "totalEpisodeCount"], value_type="int")
-            self.episodeCount = self._parse(attrs=["statistics", "episodeCount"], value_type="int")
-            self.episodeFileCount = self._parse(attrs=["statistics", "episodeFileCount"], value_type="int")
-            self.sizeOnDisk = self._parse(attrs=["statistics", "sizeOnDisk"], value_type="int")
-            self.percentOfEpisodes = self._parse(attrs=["statistics", "percentOfEpisodes"], value_type="float")
-        else:
-            self.profileId = self._parse(attrs="profileId", value_type="int")
-            self.profile = self._parse(attrs="profileId", value_type="intQualityProfile")
-            self.seasonCount = self._parse(attrs="seasonCount", value_type="int")
-            self.totalEpisodeCount = self._parse(attrs="totalEpisodeCount", value_type="int")
-            self.episodeCount = self._parse(attrs="episodeCount", value_type="int")
-            self.episodeFileCount = self._parse(attrs="episodeFileCount", value_type="int")
-            self.sizeOnDisk = self._parse(attrs="sizeOnDisk", value_type="int")
-        self._finish(self.title)
+        self._finish(self._data.get("title"))
 
     def _full_load(self):
         if self.id:
             return self._raw.get_series_id(self.id)
         elif self.tvdbId:
-            items = self._raw.get_series_lookup(f"tvdb:{self.tvdbId}")
-            if items:
-                return items[0]
-            else:
-                raise NotFound("Item Not Found")
+            return self._then(self._raw.get_series_lookup(f"tvdb:{self.tvdbId}"), self._first_item)
         else:
             raise Invalid("Load Failed: No Load Input")
 
@@ -616,7 +643,7 @@ class Series(ReloadObj):
         """
         if self._arr.exclusions and self.tvdbId in self._arr.exclusions:
             raise Excluded(f"TVDb ID: {self.tvdbId} is excluded from being added.")
-        self._load(self._raw.post_series(self._get_add_data(self._arr._validate_add_options(
+        return self._then(self._arr._validate_add_options(
             root_folder,
             quality_profile,
             language_profile=language_profile,
@@ -626,7 +653,10 @@ class Series(ReloadObj):
             unmet_search=unmet_search,
             series_type=series_type,
             tags=tags
-        ))))
+        ), self._add)
+
+    def _add(self, options):
+        return self._then(self._raw.post_series(self._get_add_data(options)), self._load)
 
     def edit(self,
              path: Optional[str] = None,
@@ -661,12 +691,19 @@ class Series(ReloadObj):
         """
         if not self.id:
             raise NotFound(f"{self.title} not found in Sonarr, it must be added before editing")
-        options = self._arr._validate_edit_options(path=path, move_files=move_files, quality_profile=quality_profile,
-                                                   language_profile=language_profile, monitor=monitor,
-                                                   monitored=monitored, season_folder=season_folder,
-                                                   series_type=series_type, tags=tags, apply_tags=apply_tags)
+        return self._then(self._arr._validate_edit_options(path=path, move_files=move_files,
+                                                           quality_profile=quality_profile,
+                                                           language_profile=language_profile, monitor=monitor,
+                                                           monitored=monitored, season_folder=season_folder,
+                                                           series_type=series_type, tags=tags, apply_tags=apply_tags),
+                          self._edit)
+
+    def _edit(self, options):
+        if self._fields is not None:
+            return self._then(self.reload(), lambda _: self._edit(options))
         if "monitor" in options:
-            self._raw.edit_series_monitoring([self.id], options.pop("monitor"))
+            monitoring = self._raw.edit_series_monitoring([self.id], options.pop("monitor"))
+            return self._then(monitoring, lambda _: self._edit(options))
         valid_move_files = options["path"] if "path" in options else False
         for key, value in options.items():
             if key == "tags":
@@ -681,7 +718,7 @@ class Series(ReloadObj):
                     raise Invalid(f"Invalid apply_tags: '{tag_type}' Options: {self._arr.apply_tags_options}")
             elif key != ["applyTags", "moveFiles"]:
                 self._data[key] = value
-        self._load(self._raw.put_series_id(self.id, self._data, moveFiles=valid_move_files))
+        return self._then(self._raw.put_series_id(self.id, self._data, moveFiles=valid_move_files), self._load)
 
     def delete(self, addImportListExclusion: bool = False, deleteFiles: bool = False) -> None:
         """ Delete this Series from Sonarr.
@@ -695,7 +732,5 @@ class Series(ReloadObj):
         """
         if not self.id:
             raise NotFound(f"{self.title} not found in Sonarr, it must be added before deleting")
-        self._raw.delete_series_id(self.id, addImportListExclusion=addImportListExclusion, deleteFiles=deleteFiles)
-        self._loading = True
-        self.id = None
-        self._loading = False
+        return self._then(self._raw.delete_series_id(self.id, addImportListExclusion=addImportListExclusion,
+                                                     deleteFiles=deleteFiles), self._deleted)
@@ -3,6 +3,8 @@ from abc import abstractmethod
 from arrapi.objs.base import BaseObj
 
 class SimpleObj(BaseObj):
+    __slots__ = ()
+
     @abstractmethod
     def _load(self, data):
         super()._load(data)
@@ -15,6 +17,7 @@ class Collection(SimpleObj):
             name (str): Name of the Collection.
             tmdbId (int): TMDb Collection ID of the Collection.
     """
+    __slots__ = ("name", "tmdbId")
 
     def _load(self, data):
         super()._load(data)
@@ -35,6 +38,8 @@ class Image(SimpleObj):
             url (str): URL of the Image.
             remoteUrl (str): Remote URL of the Image.
     """
+    __slots__ = ("coverType", "url", "remoteUrl")
+    _interned = ("coverType",)
 
     def _load(self, data):
         super()._load(data)
@@ -51,6 +56,7 @@ class MetadataProfile(SimpleObj):
             id (int): ID of the Metadata Profile.
             name (str): Name of the Metadata Profile.
     """
+    __slots__ = ("name",)
 
     def _load(self, data):
         super()._load(data)
@@ -67,6 +73,7 @@ class RemotePathMapping(SimpleObj):
             localPath (str): Local Path of the Remote Path Mapping.
             remotePath (str): Remote Path of the Remote Path Mapping.
     """
+    __slots__ = ("host", "remotePath", "localPath")
 
     def _load(self, data):
         super()._load(data)
@@ -91,6 +98,10 @@ class RootFolder(SimpleObj):
             isCalibreLibrary (bool): If the Root Folder is a Calibre Library. (Only when loaded using :class:`~arrapi.apis.readarr.ReadarrAPI`)
             unmappedFolders (List[UnmappedFolder]): Unmapped Folders in the Root Folder. (Only when loaded using :class:`~arrapi.apis.radarr.SonarrAPI` V3 or :class:`~arrapi.apis.radarr.RadarrAPI` V3)
     """
+    __slots__ = (
+        "path", "freeSpace", "name", "defaultMetadataProfileId", "defaultQualityProfileId", "defaultMonitorOption",
+        "defaultTags", "isCalibreLibrary", "unmappedFolders"
+    )
 
     def _load(self, data):
         super()._load(data)
@@ -114,7 +125,7 @@ class RootFolder(SimpleObj):
         self._finish(self.name if "name" in self._data else self.path)
 
     def delete(self):
-        self._raw.delete_rootFolder(self.id)
+        return self._then(self._raw.delete_rootFolder(self.id), lambda _: None)
 
 class Season(SimpleObj):
     """ Represents a single Season.
@@ -130,6 +141,10 @@ class Season(SimpleObj):
             nextAiring (datetime): Next Airing Date for an Episode of this Season.
             previousAiring (datetime): Previous Airing Date for the latest Episode of this Season.
     """
+    __slots__ = (
+        "seasonNumber", "monitored", "totalEpisodeCount", "episodeCount", "episodeFileCount", "sizeOnDisk",
+        "percentOfEpisodes", "nextAiring", "previousAiring"
+    )
 
     def _load(self, data):
         super()._load(data)
@@ -153,6 +168,7 @@ class UnmappedFolder(SimpleObj):
             name (str): Name of the Unmapped Folder.
             path (str): Path of the Unmapped Folder.
     """
+    __slots__ = ("name", "path")
 
     def _load(self, data):
         super()._load(data)
@@ -168,6 +184,7 @@ class RadarrExclusion(SimpleObj):
             title (str): Title of the Excluded Movie.
             year (int): Year of the Excluded Movie.
     """
+    __slots__ = ("tmdbId", "title", "year")
 
     def _load(self, data):
         super()._load(data)
@@ -183,6 +200,7 @@ class SonarrExclusion(SimpleObj):
             tvdbId (int): TVDb ID of the Excluded Series.
             title (str): Title of the Excluded Series.
     """
+    __slots__ = ("tvdbId", "title")
 
     def _load(self, data):
         super()._load(data)
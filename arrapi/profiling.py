@@ -0,0 +1,305 @@
+import functools, inspect, sys, threading, time, warnings
+
+from contextvars import ContextVar
+from typing import Dict, List, Optional
+
+from arrapi.exceptions import Invalid, LazyLoadWarning, TooManyLazyLoads
+
+_active = ContextVar("_active_profile", default=None)
+_call = ContextVar("_profile_call", default=None)
+_lazy_loads = ContextVar("_lazy_loads", default=None)
+
+PHASES = ("network", "decode", "build")
+
+
+class _Call:
+    """ Phase times of one API method call. """
+    __slots__ = ("network", "decode", "build", "building")
+
+    def __init__(self):
+        self.network = 0.0
+        self.decode = 0.0
+        self.build = 0.0
+        self.building = False
+
+
+class Profile:
+    """ Records the wall time of every API method called while it's entered and how it splits into phases.
+
+        * ``network``: Sending requests and waiting for their responses.
+        * ``decode``: Decoding JSON response bodies.
+        * ``build``: Creating the :class:`~arrapi.objs.base.BaseObj` objects returned.
+
+        The rest of a method's time is counted as ``other``. Only the outermost API method is recorded when one calls
+        another, and only calls made in the thread or task that entered the profile (and tasks it starts) are recorded.
+        Requests sent concurrently by asyncio methods each add their own time so the phases can add up to more than the
+        total.
+
+        .. code-block:: python
+
+            with radarr.profile() as profile:
+                radarr.all_movies()
+            print(profile.report())
+    """
+
+    def __init__(self):
+        self._methods = {}
+        self._lock = threading.Lock()
+        self._tokens = []
+
+    def __repr__(self):
+        return f"[Profile: {len(self._methods)} methods]"
+
+    def __enter__(self):
+        self._tokens.append(_active.set(self))
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        _active.reset(self._tokens.pop())
+
+    def _add(self, method, elapsed, call):
+        with self._lock:
+            stats = self._methods.get(method)
+            if stats is None:
+                stats = self._methods[method] = {"calls": 0, "total": 0.0, "network": 0.0, "decode": 0.0, "build": 0.0}
+            stats["calls"] += 1
+            stats["total"] += elapsed
+            stats["network"] += call.network
+            stats["decode"] += call.decode
+            stats["build"] += call.build
+
+    def stats(self) -> List[Dict]:
+        """ Returns the seconds spent in each method and phase, slowest method first. """
+        with self._lock:
+            methods = [{"method": m, **s} for m, s in self._methods.items()]
+        for stats in methods:
+            stats["other"] = max(stats["total"] - sum(stats[p] for p in PHASES), 0.0)
+        return sorted(methods, key=lambda s: s["total"], reverse=True)
+
+    def report(self, limit: Optional[int] = 10) -> str:
+        """ Returns a table of the slowest methods with the share of their time spent in each phase.
+
+            Parameters:
+                limit (Optional[int]): Number of methods to show. Shows all when ``None``.
+        """
+        lines = [f"{'method':<40} {'calls':>6} {'total s':>9} {'network':>8} {'decode':>8} {'build':>8} {'other':>8}"]
+        for stats in self.stats()[:limit]:
+            shares = [f"{stats[p] / stats['total'] * 100 if stats['total'] else 0:7.1f}%" for p in (*PHASES, "other")]
+            lines.append(f"{stats['method']:<40} {stats['calls']:>6} {stats['total']:>9.3f} {' '.join(shares)}")
+        return "\n".join(lines)
+
+
+class LazyLoads:
+    """ Counts the partial objects (i.e. every Movie from ``all_movies()`` or the Tags they reference) reloaded because
+        one of their fields was read while it's entered, by class, attribute, and the line outside ArrAPI that read it.
+        Each one is a request hidden behind an attribute, usually fixed with
+        :meth:`~arrapi.apis.base.BaseAPI.resolve` or by reading the objects from a list instead.
+
+        Only reads in the thread or task that entered it (and tasks it starts) are counted.
+
+        .. code-block:: python
+
+            with radarr.lazy_loads(threshold=100) as lazy_loads:
+                for movie in radarr.all_movies():
+                    print([tag.label for tag in movie.tags])
+            print(lazy_loads.report())
+
+        Parameters:
+            threshold (Optional[int]): Number of lazy loads allowed, ``None`` only counts them.
+            action (str): What to do when the threshold is crossed. Valid options are warn (one
+                :class:`~arrapi.exceptions.LazyLoadWarning`) or raise (:class:`~arrapi.exceptions.TooManyLazyLoads`
+                instead of every lazy load after the threshold).
+
+        Raises:
+            :class:`~arrapi.exceptions.Invalid`: When the action is invalid.
+    """
+
+    def __init__(self, threshold: Optional[int] = None, action: str = "warn"):
+        if action not in ("warn", "raise"):
+            raise Invalid(f"Invalid action: '{action}' Options: ['warn', 'raise']")
+        self.threshold = threshold
+        self.action = action
+        self.total = 0
+        self._sites = {}
+        self._warned = False
+        self._lock = threading.Lock()
+        self._tokens = []
+
+    def __repr__(self):
+        return f"[LazyLoads: {self.total}]"
+
+    def __enter__(self):
+        self._tokens.append(_lazy_loads.set(self))
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        _lazy_loads.reset(self._tokens.pop())
+
+    def _add(self, cls, attr, site):
+        with self._lock:
+            key = (cls, attr, site)
+            self._sites[key] = self._sites.get(key, 0) + 1
+            self.total += 1
+            crossed = self.threshold is not None and self.total > self.threshold
+            warn = crossed and self.action == "warn" and not self._warned
+            if warn:
+                self._warned = True
+        if crossed and (warn or self.action == "raise"):
+            message = f"{self.total} lazy loads, more than the {self.threshold} allowed: {cls}.{attr} read at {site}"
+            if self.action == "raise":
+                raise TooManyLazyLoads(message)
+            warnings.warn(message, LazyLoadWarning, stacklevel=4)
+
+    def stats(self) -> List[Dict]:
+        """ Returns the number of lazy loads for each class, attribute, and call site, most first. """
+        with self._lock:
+            sites = [{"class": c, "attribute": a, "site": s, "count": n} for (c, a, s), n in self._sites.items()]
+        return sorted(sites, key=lambda s: s["count"], reverse=True)
+
+    def report(self, limit: Optional[int] = 10) -> str:
+        """ Returns a table of the attributes and call sites that caused the most lazy loads.
+
+            Parameters:
+                limit (Optional[int]): Number of rows to show. Shows all when ``None``.
+        """
+        lines = [f"{self.total} lazy loads", f"{'count':>6}  {'attribute':<30} site"]
+        for stats in self.stats()[:limit]:
+            lines.append(f"{stats['count']:>6}  {stats['class'] + '.' + stats['attribute']:<30} {stats['site']}")
+        return "\n".join(lines)
+
+
+def _call_site():
+    """ Returns the file, line, and function of the first frame outside ArrAPI. """
+    frame = sys._getframe(2)
+    while frame is not None and frame.f_globals.get("__name__", "").partition(".")[0] == "arrapi":
+        frame = frame.f_back
+    if frame is None:
+        return "<unknown>"
+    return f"{frame.f_code.co_filename}:{frame.f_lineno} ({frame.f_code.co_name})"
+
+
+def lazy_load(obj, attr: str) -> None:
+    """ Records that reading the attribute is about to reload the partial object in the active :class:`LazyLoads`.
+
+        Raises:
+            :class:`~arrapi.exceptions.TooManyLazyLoads`: When the threshold of the active :class:`LazyLoads` is crossed
+                and its action is raise.
+    """
+    lazy_loads = _lazy_loads.get()
+    if lazy_loads is not None:
+        lazy_loads._add(type(obj).__name__, attr, _call_site())
+
+
+def current_call() -> Optional[_Call]:
+    """ Returns the phase times of the API method being profiled or ``None`` when not profiling. """
+    return _call.get()
+
+
+def _start(api, attr):
+    """ Starts recording a method call when a profile is active and no other method is being recorded. """
+    if _call.get() is not None:
+        return None
+    profile = _active.get()
+    if profile is None:
+        return None
+    call = _Call()
+    return profile, f"{type(api).__name__}.{attr}", call, _call.set(call), time.perf_counter()
+
+
+def _stop(started):
+    profile, name, call, token, start = started
+    _call.reset(token)
+    profile._add(name, time.perf_counter() - start, call)
+
+
+class _Steps:
+    """ Records the steps of a generator as one call, leaving out the time spent by the caller between items. """
+
+    def __init__(self, api, attr):
+        self.profile = _active.get() if _call.get() is None else None
+        self.name = f"{type(api).__name__}.{attr}"
+        self.call = _Call()
+        self.elapsed = 0.0
+
+    def start(self):
+        if self.profile is not None:
+            return _call.set(self.call), time.perf_counter()
+
+    def stop(self, started):
+        if started is not None:
+            token, start = started
+            _call.reset(token)
+            self.elapsed += time.perf_counter() - start
+
+    def finish(self):
+        if self.profile is not None:
+            self.profile._add(self.name, self.elapsed, self.call)
+
+
+def _profiled(attr, func):
+    """ Wraps an API method so its calls are recorded by the active :class:`Profile`. """
+    if inspect.isasyncgenfunction(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            generator = func(*args, **kwargs)
+            steps = _Steps(args[0], attr)
+            try:
+                while True:
+                    started = steps.start()
+                    try:
+                        item = await generator.__anext__()
+                    except StopAsyncIteration:
+                        return
+                    finally:
+                        steps.stop(started)
+                    yield item
+            finally:
+                await generator.aclose()
+                steps.finish()
+    elif inspect.isgeneratorfunction(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            generator = func(*args, **kwargs)
+            steps = _Steps(args[0], attr)
+            try:
+                while True:
+                    started = steps.start()
+                    try:
+                        item = next(generator)
+                    except StopIteration:
+                        return
+                    finally:
+                        steps.stop(started)
+                    yield item
+            finally:
+                generator.close()
+                steps.finish()
+    elif inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            started = _start(args[0], attr)
+            if started is None:
+                return await func(*args, **kwargs)
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                _stop(started)
+    else:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            started = _start(args[0], attr)
+            if started is None:
+                return func(*args, **kwargs)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _stop(started)
+    return wrapper
+
+
+def profile_methods(cls) -> None:
+    """ Wraps the public methods defined on the class so they're recorded by the active :class:`Profile`. """
+    for attr, value in list(vars(cls).items()):
+        if attr.startswith("_") or attr in ("connect", "close", "profile") or not inspect.isfunction(value):
+            continue
+        setattr(cls, attr, _profiled(attr, value))
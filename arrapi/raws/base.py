@@ -1,31 +1,195 @@
-import logging
+import asyncio, logging, threading, time
 
 from abc import ABC, abstractmethod
-from json.decoder import JSONDecodeError
+from contextvars import ContextVar
 from requests import Session
 from requests.exceptions import RequestException
-from arrapi import ArrException, ConnectionFailure, NotFound, Unauthorized, Invalid
+from arrapi.profiling import current_call
+from arrapi import ArrException, CircuitOpen, ConnectionFailure, DeadlineExceeded, NotFound, Unauthorized, Invalid
+from .breaker import CLOSED, HALF_OPEN
+from .codec import JSONArrayDecoder, get_codec, iter_json_array
+from .deadline import current_deadline
+from .metrics import Metrics
+from .pool import ConnectionStats, PoolAdapter
+from .singleflight import SingleFlight
+from .state import TransientState
+from .transport import HTTPTransport
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
 
 logger = logging.getLogger(__name__)
+_json_headers = {"Content-Type": "application/json"}
+_connecting = ContextVar("_connecting", default=False)
+_probing = ContextVar("_probing", default=False)
+DEFAULT_TIMEOUT = (10, 120)
+
+
+class _Body:
+    """ Request or response body that is only formatted when a debug record is emitted. """
+    __slots__ = ("body", "limit")
+
+    def __init__(self, body, limit):
+        self.body = body
+        self.limit = limit
+
+    def __str__(self):
+        body = self.body if isinstance(self.body, (bytes, str)) else str(self.body)
+        suffix = ""
+        if self.limit and len(body) > self.limit:
+            suffix = f"... [{len(body)} total]"
+            body = body[:self.limit]
+        if isinstance(body, bytes):
+            body = body.decode("utf-8", "replace")
+        return f"{body}{suffix}"
 
-class BaseRawAPI(ABC):
+
+class BaseRawAPI(TransientState, ABC):
+    """ Base class for the raw APIs, every method maps to a single API call.
+
+        Parameters:
+            url (str): URL of the Arr application.
+            apikey (str): apikey for the Arr application.
+            v1 (bool): Use the v1 API.
+            session (Optional[Session]): Session object to use. The pool options and :attr:`connection_stats` only apply to sessions created by ArrAPI.
+            pool_connections (int): Number of host connection pools to keep.
+            pool_maxsize (int): Number of connections to keep open per host.
+            pool_block (bool): Wait for a free connection when ``pool_maxsize`` connections are in use instead of opening extra connections that are thrown away after use.
+            keep_alive (bool): Keep connections open between requests.
+            timeout (Optional[Union[float, Tuple[float, float]]]): Seconds to wait for the server to connect and respond or a ``(connect, read)`` tuple. Defaults to 10 seconds to connect and 120 seconds to respond. Never times out when ``None``.
+            retry (Optional[:class:`~arrapi.raws.retry.RetryPolicy`]): Policy used to retry failed requests. Requests are not retried when ``None``.
+            rate_limit (Optional[:class:`~arrapi.raws.limits.RateLimiter`]): Limits the requests sent per second.
+            concurrency_limit (Optional[:class:`~arrapi.raws.limits.ConcurrencyLimiter`]): Limits the requests in flight at once.
+            log_body (Optional[int]): Characters of each request and response body to write to the debug log. Only sizes are logged when ``0`` and whole bodies when ``None``.
+            codec (Optional[Union[str, :class:`~arrapi.raws.codec.JSONCodec`]]): JSON codec or name of the codec (``orjson``, ``msgspec``, or ``json``) used for request and response bodies. Defaults to the fastest installed.
+            coalesce (bool): Make identical GET requests made at the same time share one HTTP request. Each caller still gets its own decoded copy of the response.
+            lazy (bool): Check the version on the first request instead of when created. The apikey isn't checked until then either.
+            version (Optional[Union[str, Dict]]): Known version or system status of the Arr instance. Skips the version check.
+            cache (Optional[:class:`~arrapi.raws.capabilities.CapabilityCache`]): Cache to read the version from and save it to after checking it.
+            breaker (Optional[:class:`~arrapi.raws.breaker.CircuitBreaker`]): Circuit breaker failing requests straight away while the Arr instance is down.
+            transport (Optional[:class:`~arrapi.raws.transport.Transport`]): Transport sending the requests. Defaults to :class:`~arrapi.raws.transport.HTTPTransport`.
+            metrics (Optional[Union[:class:`~arrapi.raws.metrics.Metrics`, bool]]): Registry to record the latency, sizes, and status of each request to. A new registry is used when ``None`` and nothing is recorded when ``False``.
+
+        Attributes:
+            connection_stats (:class:`~arrapi.raws.pool.ConnectionStats`): Requests sent and connections opened.
+            metrics (Optional[:class:`~arrapi.raws.metrics.Metrics`]): Per endpoint metrics of the requests sent.
+    """
+    is_async = False
+    _transient = {"_connect_lock": threading.Lock}
 
     @abstractmethod
-    def __init__(self, url, apikey, v1=False, session=None):
+    def __init__(self, url, apikey, v1=False, session=None, pool_connections=10, pool_maxsize=10, pool_block=False,
+                 keep_alive=True, timeout=DEFAULT_TIMEOUT, retry=None, rate_limit=None, concurrency_limit=None,
+                 log_body=1000, codec=None, coalesce=True, lazy=False, version=None, cache=None, breaker=None,
+                 transport=None, metrics=None):
         self.url = url.rstrip("/")
         self.apikey = apikey
-        self.session = Session() if session is None else session
+        self.connection_stats = ConnectionStats()
+        if session is None:
+            session = Session()
+            adapter = PoolAdapter(self.connection_stats, pool_connections=pool_connections,
+                                  pool_maxsize=pool_maxsize, pool_block=pool_block)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            if not keep_alive:
+                session.headers["Connection"] = "close"
+        self.session = session
+        self.timeout = timeout
+        self.retry = retry
+        self.rate_limit = rate_limit
+        self.concurrency_limit = concurrency_limit
+        self.breaker = breaker
+        self.transport = HTTPTransport() if transport is None else transport
+        self.metrics = Metrics() if metrics is None else metrics or None
+        self.log_body = log_body
+        self.codec = get_codec(codec)
+        self.singleflight = SingleFlight(self.connection_stats) if coalesce else None
         self.v1 = v1
         self.v3 = True
         self.v4 = False
-        try:
-            status = self.get_system_status()
-        except NotFound:
-            self.v3 = False
-            status = self.get_system_status()
+        self.new_codebase = True
+        self.cache = cache
+        self._version = version
+        self._connected = False
+        self._connect_lock = threading.Lock()
+        if not lazy:
+            self._ensure_connected()
+
+    @property
+    def v3(self) -> bool:
+        """ If the Arr instance uses the v3 API. """
+        self._ensure_connected()
+        return self._v3
+
+    @v3.setter
+    def v3(self, value):
+        self._v3 = value
+
+    @property
+    def v4(self) -> bool:
+        """ If the Arr instance is version 4 or newer. """
+        self._ensure_connected()
+        return self._v4
+
+    @v4.setter
+    def v4(self, value):
+        self._v4 = value
+
+    @property
+    def new_codebase(self) -> bool:
+        """ If the Arr instance uses the v1 or v3 API. """
+        self._ensure_connected()
+        return self._new_codebase
+
+    @new_codebase.setter
+    def new_codebase(self, value):
+        self._new_codebase = value
+
+    def _ensure_connected(self):
+        """ Sets the version flags if they haven't been set yet. """
+        if self._connected or _connecting.get():
+            return
+        with self._connect_lock:
+            if self._connected:
+                return
+            token = _connecting.set(True)
+            try:
+                self._connect()
+            finally:
+                _connecting.reset(token)
+
+    def _connect(self):
+        """ Sets the version flags from the version given, the cache, or by checking system/status. """
+        status = self._known_status()
+        if status is None:
+            try:
+                status = self.get_system_status()
+            except NotFound:
+                self.v3 = False
+                status = self.get_system_status()
+            self._set_version(status)
+            if self.cache is not None:
+                self.cache.set(self.url, status["version"])
+        else:
+            self._set_version(status)
+        self._connected = True
+
+    def _known_status(self):
+        """ Returns the system status from the version given or the cache if available. """
+        if self._version is not None:
+            return self._version if isinstance(self._version, dict) else {"version": self._version}
+        if self.cache is not None:
+            version = self.cache.get(self.url)
+            if version is not None:
+                return {"version": version}
+
+    def _set_version(self, status):
+        """ Sets the version flags from the system status. """
         if "version" not in status or status["version"] is None:
             raise ConnectionFailure(f"Failed to Connect to {self.url}")
-        if v1 is False:
+        if self.v1 is False:
             major = int(status["version"].split(".")[0])
             self.v3 = major == 3
             self.v4 = major > 3
@@ -33,7 +197,15 @@ class BaseRawAPI(ABC):
 
     def _get(self, path, **kwargs):
         """ process get request. """
-        return self._request("get", path, **kwargs)
+        if self.singleflight is None:
+            return self._request("get", path, **kwargs)
+        response = self.singleflight.do(self._get_key(path, kwargs), lambda: self._response("get", path, None, kwargs))
+        return self._process_response(response.status_code, response.reason, response.content)
+
+    @staticmethod
+    def _get_key(path, params):
+        """ Key identifying identical get requests. """
+        return path, repr(sorted(params.items()))
 
     def _delete(self, path, json=None, **kwargs):
         """ process delete request. """
@@ -47,46 +219,204 @@ class BaseRawAPI(ABC):
         """ process put request. """
         return self._request("put", path, json=json, **kwargs)
 
-    def _request(self, request_type, path, json=None, **kwargs):
-        """ process request. """
+    def _request_args(self, path, json, params):
+        """ Builds the request url, url parameters, and encoded body. """
+        self._ensure_connected()
         url_params = {"apikey": f"{self.apikey}"}
-        for kwarg in kwargs:
-            url_params[kwarg] = kwargs[kwarg]
+        for param in params:
+            url_params[param] = params[param]
         request_url = f"{self.url}/api{'/v1' if self.v1 else '/v3' if self.v3 or self.v4 else ''}/{path}"
-        if json is not None:
-            logger.debug(f"Request JSON {json}")
+        if json is not None and self.log_body != 0 and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Request JSON %s", _Body(json, self.log_body))
+        return request_url, url_params, None if json is None else self.codec.dumps(json)
+
+    def _send(self, request_type, path, request_url, body, url_params, stream=False):
+        """ Sends a single request once the circuit breaker and limiters allow it. """
+        if self.breaker is not None:
+            self._check_circuit()
+        if self.rate_limit is not None:
+            self.rate_limit.acquire()
+        if self.concurrency_limit is not None:
+            self.concurrency_limit.acquire()
+        start = time.monotonic()
+        status_code = None
         try:
-            if request_type == "delete":
-                response = self.session.delete(request_url, json=json, params=url_params)
-            elif request_type == "post":
-                response = self.session.post(request_url, json=json, params=url_params)
-            elif request_type == "put":
-                response = self.session.put(request_url, json=json, params=url_params)
+            response = self._session_request(request_type, request_url, body, url_params, stream=stream)
+            status_code = response.status_code
+        except Exception as e:
+            if self.metrics is not None:
+                self.metrics.record(self.url, request_type, path, None, time.monotonic() - start, len(body or b""), error=e.__class__.__name__)
+            raise
+        finally:
+            elapsed = time.monotonic() - start
+            if self.concurrency_limit is not None:
+                self.concurrency_limit.release(elapsed, failed=status_code is None or self._overloaded(status_code))
+            if self.breaker is not None:
+                self._record_circuit(status_code)
+            call = current_call()
+            if call is not None:
+                call.network += elapsed
+        if self.metrics is not None:
+            received = int(response.headers.get("Content-Length") or 0) if stream else len(response.content)
+            self.metrics.record(self.url, request_type, path, status_code, elapsed, len(body or b""), received)
+        self._log_response(request_type, path, response.status_code, None if stream else response.content, elapsed)
+        return response
+
+    def _check_circuit(self):
+        """ Raises :class:`~arrapi.exceptions.CircuitOpen` while the circuit is open, probing system/status once the
+            cool down has passed. """
+        if _probing.get():
+            return
+        state = self.breaker.allow()
+        if state == HALF_OPEN:
+            token = _probing.set(True)
+            try:
+                self.get_system_status()
+            except ArrException:
+                pass
+            finally:
+                _probing.reset(token)
+                self.breaker.probe_finished()
+            state = self.breaker.state
+        if state != CLOSED:
+            raise CircuitOpen(f"Circuit open for {self.url}, next probe in {self.breaker.retry_in():.1f}s")
+
+    def _record_circuit(self, status_code):
+        """ Records the result of a request in the circuit breaker. ``status_code`` is ``None`` when it failed to connect. """
+        if status_code is None:
+            deadline = current_deadline()
+            if deadline is None or not deadline.expired:
+                self.breaker.record_failure()
+        elif self.breaker.is_failure(status_code):
+            self.breaker.record_failure()
+        else:
+            self.breaker.record_success()
+
+    def _session_request(self, request_type, request_url, body, url_params, stream=False):
+        """ Sends a single request using the transport. """
+        headers = None if body is None else _json_headers
+        return self.transport.send(self.session, request_type, request_url, url_params, body, headers,
+                                   self._request_timeout(), stream=stream)
+
+    def _request_timeout(self):
+        """ Returns :attr:`timeout` shortened to the time left before the current :class:`~arrapi.raws.deadline.Deadline`. """
+        deadline = current_deadline()
+        return self.timeout if deadline is None else deadline.timeout(self.timeout)
+
+    def _log_response(self, request_type, path, status_code, content, elapsed):
+        """ Writes a debug record for a response with ``method``, ``path``, ``status``, ``bytes``, and ``elapsed`` attributes.
+            ``bytes`` is ``None`` for streamed responses. """
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+        method = request_type.upper()
+        size = None if content is None else len(content)
+        logger.debug("%s %s %s %s bytes %.3fs", method, path, status_code, "?" if size is None else size, elapsed,
+                     extra={"method": method, "path": path, "status": status_code, "bytes": size, "elapsed": elapsed})
+        if self.log_body != 0 and content:
+            logger.debug("Response %s", _Body(content, self.log_body))
+
+    @staticmethod
+    def _overloaded(status_code):
+        """ If the status code shows the server is struggling. """
+        return status_code == 429 or status_code >= 500
+
+    def _request(self, request_type, path, json=None, **kwargs):
+        """ process request. """
+        response = self._response(request_type, path, json, kwargs)
+        return self._process_response(response.status_code, response.reason, response.content)
+
+    def _get_stream(self, path, **kwargs):
+        """ process get request yielding the items of the JSON array response as they're received.
+            Reading and decoding the body is profiled as decoding. """
+        response = self._response("get", path, None, kwargs, stream=True)
+        with response:
+            if response.status_code >= 400:
+                self._process_response(response.status_code, response.reason, response.content)
+            items = iter_json_array(response.iter_content(chunk_size=65536))
+            try:
+                while True:
+                    call = current_call()
+                    start = time.perf_counter() if call is not None else None
+                    try:
+                        item = next(items)
+                    except StopIteration:
+                        return
+                    if call is not None:
+                        call.decode += time.perf_counter() - start
+                    yield item
+            except RequestException:
+                raise ConnectionFailure(f"Failed to Connect to {self.url}")
+
+    def _response(self, request_type, path, json, params, stream=False):
+        """ Sends a request, retrying it when the retry policy allows, and returns the last response. """
+        request_url, url_params, body = self._request_args(path, json, params)
+        deadline = current_deadline()
+        attempt = 0
+        while True:
+            if deadline is not None:
+                deadline.check()
+            try:
+                response = self._send(request_type, path, request_url, body, url_params, stream=stream)
+            except RequestException as e:
+                delay = self._retry_delay(request_type, path, attempt, error=e)
+                if delay is None:
+                    raise ConnectionFailure(f"Failed to Connect to {self.url}")
             else:
-                response = self.session.get(request_url, params=url_params)
-        except RequestException:
-            raise ConnectionFailure(f"Failed to Connect to {self.url}")
+                delay = self._retry_delay(request_type, path, attempt, status_code=response.status_code,
+                                          content=response.content if response.status_code >= 400 else None,
+                                          retry_after=response.headers.get("Retry-After"))
+                if delay is None:
+                    return response
+                response.close()
+            time.sleep(delay)
+            attempt += 1
+
+    def _retry_delay(self, request_type, path, attempt, error=None, status_code=None, content=None, retry_after=None):
+        """ Returns the seconds to wait before retrying a failed request or ``None`` when it shouldn't be retried.
+            Raises :class:`~arrapi.exceptions.DeadlineExceeded` when the request failed because the deadline passed. """
+        deadline = current_deadline()
+        if error is not None and deadline is not None and deadline.expired:
+            raise DeadlineExceeded(f"Deadline of {deadline.seconds}s exceeded during {request_type.upper()} {path}")
+        if self.retry is None or _probing.get() or not self.retry.can_retry(request_type, attempt):
+            return None
+        if error is None:
+            if not self.retry.retry_status(status_code):
+                return None
+            if status_code == 500 and b"Sequence contains no matching element" in content:
+                return None
+        delay = self.retry.delay(attempt, retry_after=retry_after)
+        if deadline is not None and delay >= deadline.remaining():
+            return None
+        self.connection_stats._retried()
+        reason = error.__class__.__name__ if error is not None else status_code
+        logger.debug("Retrying %s %s (%s) in %.2fs [Retry %d/%d]", request_type.upper(), path, reason, delay, attempt + 1, self.retry.retries)
+        return delay
+
+    def _process_response(self, status_code, reason, content):
+        """ process response. """
+        call = current_call()
+        start = time.perf_counter() if call is not None else None
         try:
-            response_json = response.json()
-        except JSONDecodeError:
-            logger.debug(f"Response ({response.status_code} [{response.reason}]) {response.content}")
-            if response.status_code >= 400:
-                raise ArrException(f"({response.status_code} [{response.reason}]) {response.content}")
+            response_json = self.codec.loads(content)
+        except self.codec.errors:
+            if status_code >= 400:
+                raise ArrException(f"({status_code} [{reason}]) {content}")
             else:
                 return None
         else:
-            logger.debug(f"Response ({response.status_code} [{response.reason}]) {response_json}")
-            if response.status_code == 401:
-                raise Unauthorized(f"({response.status_code} [{response.reason}]) Invalid API Key {response_json}")
-            elif response.status_code == 404:
-                raise NotFound(f"({response.status_code} [{response.reason}]) Item Not Found {response_json}")
-            elif response.status_code == 500 and "message" in response_json and response_json["message"] == "Sequence contains no matching element":
-                raise Invalid(f"({response.status_code} [{response.reason}]) Invalid option provided")
-            elif response.status_code >= 400:
+            if call is not None:
+                call.decode += time.perf_counter() - start
+            if status_code == 401:
+                raise Unauthorized(f"({status_code} [{reason}]) Invalid API Key {response_json}")
+            elif status_code == 404:
+                raise NotFound(f"({status_code} [{reason}]) Item Not Found {response_json}")
+            elif status_code == 500 and "message" in response_json and response_json["message"] == "Sequence contains no matching element":
+                raise Invalid(f"({status_code} [{reason}]) Invalid option provided")
+            elif status_code >= 400:
                 if isinstance(response_json, list) and "errorMessage" in response_json[0]:
-                    raise ArrException(f"({response.status_code} [{response.reason}]) {response_json[0]['errorMessage']}")
+                    raise ArrException(f"({status_code} [{reason}]) {response_json[0]['errorMessage']}")
                 else:
-                    raise ArrException(f"({response.status_code} [{response.reason}]) {response_json}")
+                    raise ArrException(f"({status_code} [{reason}]) {response_json}")
             return response_json
 
     def get_tag(self, detail=False):
@@ -143,7 +473,7 @@ class BaseRawAPI(ABC):
         return self.post_rootFolder({"path": path})
 
     def delete_rootFolder(self, rootFolderID):
-        self._delete(f"rootFolder/{rootFolderID}")
+        return self._delete(f"rootFolder/{rootFolderID}")
 
     def get_remotePathMapping(self):
         """ GET /remotePathMapping """
@@ -157,9 +487,286 @@ class BaseRawAPI(ABC):
 class BaseRawV1API(BaseRawAPI):
 
     @abstractmethod
-    def __init__(self, url, apikey, session=None):
-        super().__init__(url, apikey, v1=True, session=session)
+    def __init__(self, url, apikey, session=None, **kwargs):
+        super().__init__(url, apikey, v1=True, session=session, **kwargs)
 
     def get_metadataProfile(self):
         """ GET /metadataProfile """
-        return self._get("metadataProfile")
\ No newline at end of file
+        return self._get("metadataProfile")
+
+
+class AsyncBaseRawAPI(BaseRawAPI):
+    """ Base class for the asyncio raw APIs.
+
+        Every request method returns a coroutine. The version check runs on :meth:`connect` instead of in the constructor.
+
+        Parameters are the same as :class:`BaseRawAPI` with ``session`` being an ``aiohttp.ClientSession``. Copies and
+        unpickled objects create their own session on their first request.
+    """
+    is_async = True
+    _transient = {"_connect_task": lambda: None}
+
+    def __getstate__(self):
+        state = super().__getstate__()
+        state.update(session=None, _close_session=True)
+        return state
+
+    @abstractmethod
+    def __init__(self, url, apikey, v1=False, session=None, pool_connections=10, pool_maxsize=10, pool_block=False,
+                 keep_alive=True, timeout=DEFAULT_TIMEOUT, retry=None, rate_limit=None, concurrency_limit=None,
+                 log_body=1000, codec=None, coalesce=True, lazy=False, version=None, cache=None, breaker=None,
+                 transport=None, metrics=None):
+        if aiohttp is None:
+            raise ImportError("aiohttp is required for the asyncio API, install it with 'pip install arrapi[async]'")
+        self.url = url.rstrip("/")
+        self.apikey = apikey
+        self.connection_stats = ConnectionStats()
+        self.session = session
+        self._close_session = session is None
+        self._connector_options = {
+            "limit": pool_connections * pool_maxsize if pool_block else 0,
+            "limit_per_host": pool_maxsize if pool_block else 0,
+            "force_close": not keep_alive
+        }
+        self.timeout = timeout
+        self.retry = retry
+        self.rate_limit = rate_limit
+        self.concurrency_limit = concurrency_limit
+        self.breaker = breaker
+        self.transport = HTTPTransport() if transport is None else transport
+        self.metrics = Metrics() if metrics is None else metrics or None
+        self.log_body = log_body
+        self.codec = get_codec(codec)
+        self.singleflight = SingleFlight(self.connection_stats) if coalesce else None
+        self.v1 = v1
+        self.v3 = True
+        self.v4 = False
+        self.new_codebase = True
+        self.cache = cache
+        self._version = version
+        self._connected = False
+        self._connect_task = None
+
+    def _ensure_connected(self):
+        """ The version flags are set by :meth:`connect` which runs before the first request. """
+
+    async def connect(self):
+        """ Checks the connection and sets the version flags. Concurrent calls share one check. """
+        if self._connect_task is None or (self._connect_task.done() and not self._connected):
+            self._connect_task = asyncio.ensure_future(self._connect())
+        await asyncio.shield(self._connect_task)
+
+    async def _connect(self):
+        """ Sets the version flags from the version given, the cache, or by checking system/status. """
+        _connecting.set(True)
+        status = self._known_status()
+        if status is None:
+            try:
+                status = await self.get_system_status()
+            except NotFound:
+                self.v3 = False
+                status = await self.get_system_status()
+            self._set_version(status)
+            if self.cache is not None:
+                self.cache.set(self.url, status["version"])
+        else:
+            self._set_version(status)
+        self._connected = True
+
+    async def close(self):
+        """ Closes the session if it was created by this object. """
+        if self._close_session and self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    def _create_session(self):
+        """ Creates a session that records its requests and new connections in :attr:`connection_stats`. """
+        async def request_sent(session, context, params):
+            self.connection_stats._request_sent()
+
+        async def connection_opened(session, context, params):
+            self.connection_stats._connection_opened()
+
+        trace = aiohttp.TraceConfig()
+        trace.on_request_start.append(request_sent)
+        trace.on_connection_create_end.append(connection_opened)
+        connector = aiohttp.TCPConnector(**self._connector_options)
+        return aiohttp.ClientSession(connector=connector, trace_configs=[trace])
+
+    async def _get(self, path, **kwargs):
+        """ process get request. """
+        if self.singleflight is None:
+            return await self._request("get", path, **kwargs)
+        status, reason, _, content = await self.singleflight.do_async(self._get_key(path, kwargs), lambda: self._response("get", path, None, kwargs))
+        return self._process_response(status, reason, content)
+
+    async def _request(self, request_type, path, json=None, **kwargs):
+        """ process request. """
+        status, reason, _, content = await self._response(request_type, path, json, kwargs)
+        return self._process_response(status, reason, content)
+
+    async def _response(self, request_type, path, json, params):
+        """ Sends a request, retrying it when the retry policy allows, and returns the last response's status, reason,
+            headers, and content. """
+        if not self._connected and not _connecting.get():
+            await self.connect()
+        if self.session is None:
+            self.session = self._create_session()
+        request_url, url_params, body = self._request_args(path, json, params)
+        deadline = current_deadline()
+        attempt = 0
+        while True:
+            if deadline is not None:
+                deadline.check()
+            try:
+                response = await self._send(request_type, path, request_url, body, url_params)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                delay = self._retry_delay(request_type, path, attempt, error=e)
+                if delay is None:
+                    raise ConnectionFailure(f"Failed to Connect to {self.url}")
+            else:
+                status, _, headers, content = response
+                delay = self._retry_delay(request_type, path, attempt, status_code=status, content=content,
+                                          retry_after=headers.get("Retry-After"))
+                if delay is None:
+                    return response
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _get_stream(self, path, **kwargs):
+        """ process get request yielding the items of the JSON array response as they're received.
+            Streamed requests are not retried. Like :meth:`_send` the concurrency limiter is held until the response
+            starts, and the metrics are recorded once the body has been read. """
+        if not self._connected:
+            await self.connect()
+        if self.session is None:
+            self.session = self._create_session()
+        request_url, url_params, _ = self._request_args(path, None, kwargs)
+        deadline = current_deadline()
+        if deadline is not None:
+            deadline.check()
+        if self.breaker is not None:
+            await self._check_circuit()
+        if self.rate_limit is not None:
+            delay = self.rate_limit.reserve()
+            if delay:
+                await asyncio.sleep(delay)
+        if self.concurrency_limit is not None:
+            await self.concurrency_limit.acquire_async()
+        decoder = JSONArrayDecoder()
+        start = time.monotonic()
+        elapsed = None
+        status = None
+        received = 0
+        try:
+            async with self.transport.stream_async(self.session, request_url, url_params, self._request_timeout()) as (status, reason, chunks):
+                elapsed = self._stream_started(start, status)
+                if status >= 400:
+                    content = b"".join([chunk async for chunk in chunks])
+                    received = len(content)
+                    if self.metrics is not None:
+                        self.metrics.record(self.url, "get", path, status, elapsed, 0, received)
+                    self._log_response("get", path, status, content, elapsed)
+                    self._process_response(status, reason, content)
+                chunks = chunks.__aiter__()
+                while True:
+                    call = current_call()
+                    read_start = time.perf_counter()
+                    try:
+                        chunk = await chunks.__anext__()
+                    except StopAsyncIteration:
+                        break
+                    received += len(chunk)
+                    read = time.perf_counter()
+                    items = decoder.feed(chunk)
+                    if call is not None:
+                        call.network += read - read_start
+                        call.decode += time.perf_counter() - read
+                    for item in items:
+                        yield item
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            if elapsed is None:
+                elapsed = self._stream_started(start, None)
+            if self.metrics is not None:
+                self.metrics.record(self.url, "get", path, status, elapsed, 0, received, error=e.__class__.__name__)
+            raise ConnectionFailure(f"Failed to Connect to {self.url}")
+        finally:
+            if elapsed is None:
+                # Cancelled before the response started
+                self._stream_started(start, None)
+        if self.metrics is not None:
+            self.metrics.record(self.url, "get", path, status, elapsed, 0, received)
+        self._log_response("get", path, status, None, elapsed)
+        for item in decoder.close():
+            yield item
+
+    def _stream_started(self, start, status):
+        """ Releases the concurrency limiter and records the circuit breaker result once a streamed response starts or
+            fails to, returning the seconds it took. ``status`` is ``None`` when it failed. """
+        elapsed = time.monotonic() - start
+        if self.concurrency_limit is not None:
+            self.concurrency_limit.release(elapsed, failed=status is None or self._overloaded(status))
+        if self.breaker is not None:
+            self._record_circuit(status)
+        call = current_call()
+        if call is not None:
+            call.network += elapsed
+        return elapsed
+
+    async def _send(self, request_type, path, request_url, body, url_params):
+        """ Sends a single request once the circuit breaker and limiters allow it. """
+        if self.breaker is not None:
+            await self._check_circuit()
+        if self.rate_limit is not None:
+            delay = self.rate_limit.reserve()
+            if delay:
+                await asyncio.sleep(delay)
+        if self.concurrency_limit is not None:
+            await self.concurrency_limit.acquire_async()
+        start = time.monotonic()
+        status = None
+        try:
+            result = await self._session_request(request_type, request_url, body, url_params)
+            status = result[0]
+        except Exception as e:
+            if self.metrics is not None:
+                self.metrics.record(self.url, request_type, path, None, time.monotonic() - start, len(body or b""), error=e.__class__.__name__)
+            raise
+        finally:
+            elapsed = time.monotonic() - start
+            if self.concurrency_limit is not None:
+                self.concurrency_limit.release(elapsed, failed=status is None or self._overloaded(status))
+            if self.breaker is not None:
+                self._record_circuit(status)
+            call = current_call()
+            if call is not None:
+                call.network += elapsed
+        if self.metrics is not None:
+            self.metrics.record(self.url, request_type, path, status, elapsed, len(body or b""), len(result[3]))
+        self._log_response(request_type, path, result[0], result[3], elapsed)
+        return result
+
+    async def _check_circuit(self):
+        """ Raises :class:`~arrapi.exceptions.CircuitOpen` while the circuit is open, probing system/status once the
+            cool down has passed. """
+        if _probing.get():
+            return
+        state = self.breaker.allow()
+        if state == HALF_OPEN:
+            token = _probing.set(True)
+            try:
+                await self.get_system_status()
+            except ArrException:
+                pass
+            finally:
+                _probing.reset(token)
+                self.breaker.probe_finished()
+            state = self.breaker.state
+        if state != CLOSED:
+            raise CircuitOpen(f"Circuit open for {self.url}, next probe in {self.breaker.retry_in():.1f}s")
+
+    async def _session_request(self, request_type, request_url, body, url_params):
+        """ Sends a single request using the transport. """
+        headers = None if body is None else _json_headers
+        return await self.transport.send_async(self.session, request_type, request_url, url_params, body, headers,
+                                               self._request_timeout())
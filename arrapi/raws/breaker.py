@@ -0,0 +1,96 @@
+import threading, time
+
+from .limits import _SharedLimiter
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half-open"
+
+
+class CircuitBreaker(_SharedLimiter):
+    """ Stops sending requests to an Arr instance that keeps failing.
+
+        The circuit starts ``closed`` and every request is sent. After ``failure_threshold`` requests in a row fail to
+        connect or get one of the ``statuses`` the circuit opens and every request raises
+        :class:`~arrapi.exceptions.CircuitOpen` straight away. Once ``cool_down`` seconds have passed the circuit is
+        ``half-open`` and the next request first checks ``system/status``, closing the circuit when it responds or
+        opening it for another ``cool_down`` when it doesn't.
+
+        The breaker is thread-safe and can be shared between API objects pointing at the same Arr instance.
+
+        Parameters:
+            failure_threshold (int): Failures in a row that open the circuit.
+            cool_down (float): Seconds the circuit stays open before it's probed.
+            statuses (List[int]): HTTP status codes counted as failures.
+
+        Attributes:
+            failures (int): Failures in a row since the last success.
+            trips (int): Number of times the circuit has opened.
+    """
+
+    def __init__(self, failure_threshold: int = 5, cool_down: float = 30, statuses=(502, 503, 504)):
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+        self.failure_threshold = failure_threshold
+        self.cool_down = cool_down
+        self.statuses = list(statuses)
+        self.failures = 0
+        self.trips = 0
+        self._state = CLOSED
+        self._opened = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f"[CircuitBreaker: {self.state}, {self.failures}/{self.failure_threshold} failures]"
+
+    @property
+    def state(self) -> str:
+        """ ``closed``, ``open``, or ``half-open`` once the cool down has passed. """
+        with self._lock:
+            if self._state == OPEN and time.monotonic() - self._opened >= self.cool_down:
+                return HALF_OPEN
+            return self._state
+
+    def retry_in(self) -> float:
+        """ Seconds until the circuit can be probed. ``0`` when it isn't open. """
+        with self._lock:
+            if self._state == CLOSED:
+                return 0
+            return max(self._opened + self.cool_down - time.monotonic(), 0)
+
+    def allow(self) -> str:
+        """ Returns ``closed`` when a request can be sent, ``half-open`` when the caller has to probe the instance first
+            and report the result, or ``open`` when the request shouldn't be sent. Only one caller probes at a time. """
+        with self._lock:
+            if self._state == CLOSED:
+                return CLOSED
+            if self._probing or time.monotonic() - self._opened < self.cool_down:
+                return OPEN
+            self._state = HALF_OPEN
+            self._probing = True
+            return HALF_OPEN
+
+    def is_failure(self, status_code: int) -> bool:
+        """ If a response with the status code given counts as a failure. """
+        return status_code in self.statuses
+
+    def record_success(self) -> None:
+        """ Closes the circuit and resets the failure count. """
+        with self._lock:
+            self.failures = 0
+            self._state = CLOSED
+
+    def record_failure(self) -> None:
+        """ Counts a failure, opening the circuit once the threshold is reached or when the probe failed. """
+        with self._lock:
+            self.failures += 1
+            if self._state == HALF_OPEN or (self._state == CLOSED and self.failures >= self.failure_threshold):
+                self._state = OPEN
+                self._opened = time.monotonic()
+                self.trips += 1
+
+    def probe_finished(self) -> None:
+        """ Lets another caller probe when the probe ended without recording a result. """
+        with self._lock:
+            self._probing = False
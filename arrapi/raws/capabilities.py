@@ -0,0 +1,71 @@
+import json, logging, os, tempfile, threading, time
+
+from typing import Optional
+
+from .state import TransientState
+
+logger = logging.getLogger(__name__)
+
+
+def _default_path():
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_home, "arrapi", "capabilities.json")
+
+
+class CapabilityCache(TransientState):
+    """ On-disk cache of the version of each Arr instance so new API objects can skip the ``system/status`` check.
+
+        Entries are keyed by URL and shared by every process using the same file.
+
+        Parameters:
+            path (Optional[str]): JSON file to use. Defaults to ``arrapi/capabilities.json`` in ``$XDG_CACHE_HOME`` or ``~/.cache``.
+            ttl (float): Seconds an entry is used before the version is checked again.
+    """
+
+    def __init__(self, path: Optional[str] = None, ttl: float = 86400):
+        self.path = path or _default_path()
+        self.ttl = ttl
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f"[CapabilityCache: {self.path}]"
+
+    def _read(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def get(self, url: str) -> Optional[str]:
+        """ Returns the cached version of the Arr instance at the URL or ``None`` when it isn't cached or has expired. """
+        entry = self._read().get(url.rstrip("/"))
+        if not isinstance(entry, dict) or time.time() - entry.get("checked", 0) > self.ttl:
+            return None
+        return entry.get("version")
+
+    def set(self, url: str, version: str) -> None:
+        """ Caches the version of the Arr instance at the URL. """
+        self._update(lambda data: data.__setitem__(url.rstrip("/"), {"version": version, "checked": time.time()}))
+
+    def clear(self, url: Optional[str] = None) -> None:
+        """ Removes the entry for the URL or every entry when no URL is given. """
+        self._update(lambda data: data.pop(url.rstrip("/"), None) if url else data.clear())
+
+    def _update(self, change):
+        with self._lock:
+            data = self._read()
+            change(data)
+            directory = os.path.dirname(self.path) or "."
+            temp_path = None
+            try:
+                os.makedirs(directory, exist_ok=True)
+                fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(data, f)
+                os.replace(temp_path, self.path)
+            except OSError as e:
+                logger.debug("Failed to write capability cache %s: %s", self.path, e)
+                if temp_path is not None and os.path.exists(temp_path):
+                    os.remove(temp_path)
@@ -0,0 +1,147 @@
+import codecs, json, re
+
+from json import JSONDecodeError, JSONDecoder
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple, Type, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+_separator = re.compile(r"[ \t\n\r,]*")
+
+
+class JSONCodec:
+    """ Encodes request bodies and decodes response bodies.
+
+        Parameters:
+            name (str): Name of the codec.
+            loads (Callable[[bytes], Any]): Function decoding a response body.
+            dumps (Callable[[Any], bytes]): Function encoding a request body to compact UTF-8 bytes.
+            errors (Tuple[Type[Exception], ...]): Exceptions ``loads`` raises for invalid JSON.
+    """
+
+    def __init__(self, name: str, loads: Callable[[bytes], Any], dumps: Callable[[Any], bytes],
+                 errors: Tuple[Type[Exception], ...] = (ValueError,)):
+        self.name = name
+        self.loads = loads
+        self.dumps = dumps
+        self.errors = errors
+
+    def __repr__(self):
+        return f"[JSONCodec: {self.name}]"
+
+
+def _stdlib_dumps(obj):
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+available_codecs = {"json": JSONCodec("json", json.loads, _stdlib_dumps)}
+if msgspec is not None:
+    available_codecs["msgspec"] = JSONCodec("msgspec", msgspec.json.decode, msgspec.json.encode, errors=(msgspec.DecodeError, ValueError))
+if orjson is not None:
+    available_codecs["orjson"] = JSONCodec("orjson", orjson.loads, orjson.dumps)
+
+
+def get_codec(codec: Optional[Union[str, JSONCodec]] = None) -> JSONCodec:
+    """ Returns the codec given by name or the fastest one installed when ``None``.
+
+        ``orjson`` is used when installed, then ``msgspec``, then the standard library ``json``.
+
+        Parameters:
+            codec (Optional[Union[str, JSONCodec]]): Codec or name of an installed codec.
+
+        Raises:
+            :class:`ValueError`: When the codec named isn't installed.
+    """
+    if isinstance(codec, JSONCodec):
+        return codec
+    if codec is None:
+        for name in ("orjson", "msgspec", "json"):
+            if name in available_codecs:
+                return available_codecs[name]
+    if codec not in available_codecs:
+        raise ValueError(f"JSON codec {codec} is not installed, options: {', '.join(available_codecs)}")
+    return available_codecs[codec]
+
+
+class JSONArrayDecoder:
+    """ Decodes a JSON array fed to it in chunks of bytes, returning each item as soon as it is complete.
+
+        Only the undecoded part of the array is kept in memory so the memory used depends on the size of the largest
+        item instead of the size of the whole array.
+    """
+
+    def __init__(self):
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._json = JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._started = False
+        self._finished = False
+
+    def feed(self, chunk: bytes, final: bool = False) -> List:
+        """ Adds a chunk of the array and returns the items completed by it.
+
+            Parameters:
+                chunk (bytes): Next chunk of the response body.
+                final (bool): If this is the last chunk.
+
+            Raises:
+                :class:`json.JSONDecodeError`: When the response isn't a valid JSON array.
+        """
+        self._buffer += self._text.decode(chunk, final)
+        buffer = self._buffer
+        items = []
+        while not self._finished:
+            pos = _separator.match(buffer, self._pos).end()
+            if pos >= len(buffer):
+                break
+            if not self._started:
+                if buffer[pos] != "[":
+                    raise JSONDecodeError("Expecting '['", buffer, pos)
+                self._started = True
+                self._pos = pos + 1
+            elif buffer[pos] == "]":
+                self._finished = True
+                self._pos = pos + 1
+            else:
+                try:
+                    item, end = self._json.raw_decode(buffer, pos)
+                except JSONDecodeError:
+                    if final:
+                        raise
+                    break
+                if end == len(buffer) and not final:
+                    # a number at the end of the buffer might continue in the next chunk
+                    break
+                items.append(item)
+                self._pos = end
+        if self._pos > 65536:
+            self._buffer = self._buffer[self._pos:]
+            self._pos = 0
+        return items
+
+    def close(self) -> List:
+        """ Finishes decoding and returns any remaining items.
+
+            Raises:
+                :class:`json.JSONDecodeError`: When the array was never closed.
+        """
+        items = self.feed(b"", final=True)
+        if not self._finished:
+            raise JSONDecodeError("Unterminated array", self._buffer, self._pos)
+        return items
+
+
+def iter_json_array(chunks: Iterable[bytes]) -> Iterator:
+    """ Yields the items of a JSON array from chunks of bytes one at a time. """
+    decoder = JSONArrayDecoder()
+    for chunk in chunks:
+        yield from decoder.feed(chunk)
+    yield from decoder.close()
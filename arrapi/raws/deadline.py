@@ -0,0 +1,99 @@
+import time
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional, Tuple, Union
+
+from arrapi.exceptions import DeadlineExceeded
+
+_current = ContextVar("_current_deadline", default=None)
+_entered = ContextVar("_entered_deadlines", default=())
+
+
+class Deadline:
+    """ Time limit for a group of requests.
+
+        While the deadline is entered with ``with`` every request is given a timeout no longer than the time remaining
+        and no request is sent once it has passed, raising :class:`~arrapi.exceptions.DeadlineExceeded` instead. The bulk
+        methods of the APIs catch it and return what they finished, adding the items they didn't get to to
+        :attr:`skipped`.
+
+        .. code-block:: python
+
+            deadline = Deadline(60)
+            added, exists, invalid, excluded = radarr.add_multiple_movies(ids, "/movies", "HD-1080p", deadline=deadline)
+            if deadline.skipped:
+                print(f"Ran out of time before adding {deadline.skipped}")
+
+        Parameters:
+            seconds (float): Seconds from now until the deadline.
+
+        Attributes:
+            expires (float): :func:`time.monotonic` time of the deadline.
+            skipped (list): Items the bulk methods didn't get to before the deadline.
+    """
+
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+        self.expires = time.monotonic() + seconds
+        self.skipped = []
+
+    def __repr__(self):
+        return f"[Deadline: {self.remaining():.2f}s remaining]"
+
+    def __enter__(self):
+        # The token of each entry is kept in the context entering it so tasks and threads can share a deadline
+        _entered.set(_entered.get() + (_current.set(self),))
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        *entered, token = _entered.get()
+        _entered.set(tuple(entered))
+        _current.reset(token)
+
+    @property
+    def expired(self) -> bool:
+        """ If the deadline has passed. """
+        return time.monotonic() >= self.expires
+
+    def remaining(self) -> float:
+        """ Seconds until the deadline. """
+        return max(self.expires - time.monotonic(), 0)
+
+    def check(self) -> None:
+        """ Raises :class:`~arrapi.exceptions.DeadlineExceeded` if the deadline has passed. """
+        if self.expired:
+            raise DeadlineExceeded(f"Deadline of {self.seconds}s exceeded")
+
+    def timeout(self, timeout: Optional[Union[float, Tuple[float, float]]]) -> Tuple[float, float]:
+        """ Returns the ``(connect, read)`` timeout given shortened to the time remaining.
+
+            Raises:
+                :class:`~arrapi.exceptions.DeadlineExceeded`: When the deadline has passed.
+        """
+        self.check()
+        remaining = self.remaining()
+        if timeout is None:
+            return remaining, remaining
+        connect, read = timeout if isinstance(timeout, tuple) else (timeout, timeout)
+        return min(connect, remaining), min(read, remaining)
+
+
+def current_deadline() -> Optional[Deadline]:
+    """ Returns the deadline currently entered or ``None``. """
+    return _current.get()
+
+
+@contextmanager
+def deadline_scope(deadline: Optional[Union[float, Deadline]]) -> Iterator[Optional[Deadline]]:
+    """ Enters the deadline or seconds given, or keeps the current deadline when ``None``. """
+    if deadline is None:
+        yield current_deadline()
+        return
+    if not isinstance(deadline, Deadline):
+        deadline = Deadline(deadline)
+    token = _current.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current.reset(token)
@@ -3,5 +3,5 @@ from typing import Optional
 from .base import BaseRawV1API
 
 class LidarrRawAPI(BaseRawV1API):
-    def __init__(self, url: str, apikey: str, session: Optional[Session] = None) -> None:
-        super().__init__(url, apikey, session=session)
+    def __init__(self, url: str, apikey: str, session: Optional[Session] = None, **kwargs) -> None:
+        super().__init__(url, apikey, session=session, **kwargs)
@@ -0,0 +1,185 @@
+import asyncio, threading, time
+
+from collections import deque
+
+from .state import TransientState
+
+_shared = {}
+_shared_lock = threading.Lock()
+
+
+def _resolve(future):
+    if not future.done():
+        future.set_result(None)
+
+
+class _SharedLimiter(TransientState):
+    """ Base class for limiters that can be shared between API objects. """
+
+    @classmethod
+    def for_url(cls, url: str, *args, **kwargs):
+        """ Returns the limiter of this type for the URL given creating it with the arguments given if needed.
+
+            Pass the result to every API object pointing at the same Arr instance to make them share one limit.
+
+            Parameters:
+                url (str): URL of the Arr application.
+        """
+        key = (cls, url.rstrip("/"))
+        with _shared_lock:
+            if key not in _shared:
+                _shared[key] = cls(*args, **kwargs)
+            return _shared[key]
+
+
+class RateLimiter(_SharedLimiter):
+    """ Token bucket limiting how many requests per second are sent.
+
+        The limiter is thread-safe and can be shared between API objects to limit them together.
+
+        Parameters:
+            rate (float): Requests allowed per second.
+            burst (Optional[int]): Requests allowed at once after being idle. Defaults to ``rate`` rounded up.
+
+        Attributes:
+            throttled (int): Number of requests that had to wait.
+    """
+
+    def __init__(self, rate: float, burst: int = None):
+        if rate <= 0:
+            raise ValueError("rate must be greater than 0")
+        self.rate = rate
+        self.burst = max(int(rate + 0.99), 1) if burst is None else burst
+        self.throttled = 0
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f"[RateLimiter: {self.rate}/s burst {self.burst}]"
+
+    def reserve(self) -> float:
+        """ Takes a token from the bucket and returns the seconds to wait before sending the request. """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0
+            self.throttled += 1
+            return -self._tokens / self.rate
+
+    def acquire(self) -> None:
+        """ Waits until a request can be sent. """
+        delay = self.reserve()
+        if delay:
+            time.sleep(delay)
+
+
+class ConcurrencyLimiter(_SharedLimiter):
+    """ Limits how many requests are in flight at once, adjusting the limit with AIMD (additive increase,
+        multiplicative decrease).
+
+        Every successful response that took less than ``latency_threshold`` grows the limit by ``1 / limit`` (about one
+        request per round of responses). A server error, 429, connection failure, or slow response multiplies the limit
+        by ``decrease``, at most once per round of responses.
+
+        The limiter is thread-safe and can be shared between API objects to limit them together. Tasks waiting in
+        :meth:`acquire_async` are queued and take the slots freed in the order they started waiting.
+
+        Parameters:
+            limit (int): Starting number of requests allowed in flight.
+            min_limit (int): Smallest the limit can shrink to.
+            max_limit (int): Largest the limit can grow to.
+            latency_threshold (Optional[float]): Seconds after which a response counts as slow. Latency is ignored when ``None``.
+            decrease (float): Factor the limit is multiplied by when shrinking.
+
+        Attributes:
+            in_flight (int): Number of requests currently sent.
+    """
+    _transient = {"_condition": threading.Condition, "_waiters": deque}
+
+    def __init__(self, limit: int = 4, min_limit: int = 1, max_limit: int = 32, latency_threshold: float = 2.0,
+                 decrease: float = 0.5):
+        if not 1 <= min_limit <= limit <= max_limit:
+            raise ValueError("limits must satisfy 1 <= min_limit <= limit <= max_limit")
+        self._limit = float(limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_threshold = latency_threshold
+        self.decrease = decrease
+        self.in_flight = 0
+        self._last_decrease = 0.0
+        self._condition = threading.Condition()
+        self._waiters = deque()
+
+    def __repr__(self):
+        return f"[ConcurrencyLimiter: {self.in_flight}/{self.limit} in flight]"
+
+    @property
+    def limit(self) -> int:
+        """ Number of requests currently allowed in flight. """
+        return int(self._limit)
+
+    def try_acquire(self) -> bool:
+        """ Takes a slot if one is free and returns if it did. """
+        with self._condition:
+            if self._waiters or self.in_flight >= self.limit:
+                return False
+            self.in_flight += 1
+            return True
+
+    def acquire(self) -> None:
+        """ Waits until a slot is free and takes it. """
+        with self._condition:
+            while self._waiters or self.in_flight >= self.limit:
+                self._condition.wait()
+            self.in_flight += 1
+
+    async def acquire_async(self) -> None:
+        """ Waits without blocking the event loop until a slot is free and takes it. """
+        loop = asyncio.get_running_loop()
+        with self._condition:
+            if not self._waiters and self.in_flight < self.limit:
+                self.in_flight += 1
+                return
+            waiter = (loop, loop.create_future())
+            self._waiters.append(waiter)
+        try:
+            await waiter[1]
+        except asyncio.CancelledError:
+            with self._condition:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                else:
+                    # The slot was handed over as the task was cancelled
+                    self.in_flight -= 1
+                    self._wake()
+            raise
+
+    def _wake(self):
+        """ Hands the free slots to the queued tasks in order and wakes the waiting threads, the condition must be held. """
+        while self._waiters and self.in_flight < self.limit:
+            loop, future = self._waiters.popleft()
+            self.in_flight += 1
+            loop.call_soon_threadsafe(_resolve, future)
+        self._condition.notify_all()
+
+    def release(self, latency: float, failed: bool = False) -> None:
+        """ Frees a slot and adjusts the limit.
+
+            Parameters:
+                latency (float): Seconds the request took.
+                failed (bool): If the request failed because of the server.
+        """
+        with self._condition:
+            self.in_flight -= 1
+            now = time.monotonic()
+            if failed or (self.latency_threshold is not None and latency > self.latency_threshold):
+                if now - latency >= self._last_decrease:
+                    self._limit = max(float(self.min_limit), self._limit * self.decrease)
+                    self._last_decrease = now
+            else:
+                self._limit = min(float(self.max_limit), self._limit + 1 / self._limit)
+            self._wake()
@@ -0,0 +1,141 @@
+import re, threading
+
+from bisect import bisect_left
+from typing import Dict, List, Optional
+
+from .state import TransientState
+
+_id_segment = re.compile(r"(?<=/)\d+(?=/|$)")
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+
+
+def endpoint_template(path: str) -> str:
+    """ Returns the path with its numeric IDs replaced by ``{id}`` i.e. ``movie/12`` becomes ``movie/{id}``. """
+    return _id_segment.sub("{id}", f"/{path}")[1:]
+
+
+class _Endpoint:
+    __slots__ = ("calls", "statuses", "errors", "buckets", "latency_sum", "request_bytes", "response_bytes")
+
+    def __init__(self, size):
+        self.calls = 0
+        self.statuses = {}
+        self.errors = {}
+        self.buckets = [0] * size
+        self.latency_sum = 0.0
+        self.request_bytes = 0
+        self.response_bytes = 0
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels):
+    return ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items())
+
+
+class Metrics(TransientState):
+    """ Counts calls, latency, payload sizes, status codes, and errors per Arr instance, method, and endpoint template.
+
+        Every raw API records to its own registry by default. Pass one registry to several API objects to collect them
+        together, the ``instance`` label tells them apart. Recording is a dictionary lookup and a few additions under
+        a lock so it can stay on in production.
+
+        Parameters:
+            buckets (List[float]): Upper bounds in seconds of the latency histogram buckets.
+    """
+
+    def __init__(self, buckets: List[float] = DEFAULT_BUCKETS):
+        self.buckets = sorted(buckets)
+        self._endpoints = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f"[Metrics: {len(self._endpoints)} endpoints]"
+
+    def record(self, instance: str, method: str, path: str, status: Optional[int], elapsed: float,
+               sent: int = 0, received: int = 0, error: Optional[str] = None) -> None:
+        """ Records one request.
+
+            Parameters:
+                instance (str): URL of the Arr instance.
+                method (str): HTTP method.
+                path (str): Request path, numeric IDs are replaced by ``{id}``.
+                status (Optional[int]): Status code of the response or ``None`` when there was no response.
+                elapsed (float): Seconds the request took.
+                sent (int): Bytes in the request body.
+                received (int): Bytes in the response body.
+                error (Optional[str]): Name of the exception raised sending the request.
+        """
+        key = (instance, method.upper(), endpoint_template(path))
+        bucket = bisect_left(self.buckets, elapsed)
+        with self._lock:
+            endpoint = self._endpoints.get(key)
+            if endpoint is None:
+                endpoint = self._endpoints[key] = _Endpoint(len(self.buckets) + 1)
+            endpoint.calls += 1
+            endpoint.buckets[bucket] += 1
+            endpoint.latency_sum += elapsed
+            endpoint.request_bytes += sent
+            endpoint.response_bytes += received
+            if status is not None:
+                endpoint.statuses[status] = endpoint.statuses.get(status, 0) + 1
+            if error is not None:
+                endpoint.errors[error] = endpoint.errors.get(error, 0) + 1
+
+    def snapshot(self) -> List[Dict]:
+        """ Returns a copy of the metrics as a list of dictionaries, one per instance, method, and endpoint. """
+        bounds = [*self.buckets, float("inf")]
+        with self._lock:
+            return [{
+                "instance": instance,
+                "method": method,
+                "endpoint": path,
+                "calls": endpoint.calls,
+                "statuses": dict(endpoint.statuses),
+                "errors": dict(endpoint.errors),
+                "latency": {"sum": endpoint.latency_sum, "buckets": dict(zip(bounds, endpoint.buckets))},
+                "request_bytes": endpoint.request_bytes,
+                "response_bytes": endpoint.response_bytes
+            } for (instance, method, path), endpoint in self._endpoints.items()]
+
+    def prometheus(self, prefix: str = "arrapi") -> str:
+        """ Returns the metrics in the Prometheus text exposition format.
+
+            Parameters:
+                prefix (str): Prefix of every metric name.
+        """
+        requests, errors, histogram, sent, received = [], [], [], [], []
+        for item in self.snapshot():
+            labels = _labels(instance=item["instance"], method=item["method"], endpoint=item["endpoint"])
+            for status, count in sorted(item["statuses"].items()):
+                requests.append(f'{prefix}_requests_total{{{labels},status="{status}"}} {count}')
+            for error, count in sorted(item["errors"].items()):
+                errors.append(f'{prefix}_request_errors_total{{{labels},error="{_escape(error)}"}} {count}')
+            total = 0
+            for bound, count in item["latency"]["buckets"].items():
+                total += count
+                histogram.append(f'{prefix}_request_duration_seconds_bucket{{{labels},le="{"+Inf" if bound == float("inf") else bound}"}} {total}')
+            histogram.append(f"{prefix}_request_duration_seconds_sum{{{labels}}} {item['latency']['sum']}")
+            histogram.append(f"{prefix}_request_duration_seconds_count{{{labels}}} {item['calls']}")
+            sent.append(f"{prefix}_request_bytes_total{{{labels}}} {item['request_bytes']}")
+            received.append(f"{prefix}_response_bytes_total{{{labels}}} {item['response_bytes']}")
+        lines = []
+        for name, kind, help_text, samples in [
+            ("requests_total", "counter", "Responses received by status code.", requests),
+            ("request_errors_total", "counter", "Requests that failed without a response by exception.", errors),
+            ("request_duration_seconds", "histogram", "Seconds from sending a request to receiving its response.", histogram),
+            ("request_bytes_total", "counter", "Bytes sent in request bodies.", sent),
+            ("response_bytes_total", "counter", "Bytes received in response bodies.", received)
+        ]:
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} {kind}")
+            lines.extend(samples)
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """ Clears all metrics. """
+        with self._lock:
+            self._endpoints.clear()
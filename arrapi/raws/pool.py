@@ -0,0 +1,123 @@
+import threading
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from .state import TransientState
+
+
+class ConnectionStats(TransientState):
+    """ Counts requests sent and connections opened to an Arr instance.
+
+        Only requests sent through a session created by ArrAPI are counted.
+
+        Attributes:
+            requests (int): Number of HTTP requests sent.
+            new_connections (int): Number of TCP connections opened.
+            retries (int): Number of requests retried by the :class:`~arrapi.raws.retry.RetryPolicy`.
+            coalesced (int): Number of GET requests that shared an identical request already in flight instead of being sent.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.new_connections = 0
+        self.retries = 0
+        self.coalesced = 0
+
+    def __repr__(self):
+        return f"[ConnectionStats: {self.requests} requests, {self.new_connections} new, {self.reused_connections} reused, {self.retries} retries, {self.coalesced} coalesced]"
+
+    @property
+    def reused_connections(self) -> int:
+        """ Number of requests sent over an already open connection. """
+        return max(self.requests - self.new_connections, 0)
+
+    def _request_sent(self):
+        with self._lock:
+            self.requests += 1
+
+    def _connection_opened(self):
+        with self._lock:
+            self.new_connections += 1
+
+    def _retried(self):
+        with self._lock:
+            self.retries += 1
+
+    def _coalesced(self):
+        with self._lock:
+            self.coalesced += 1
+
+    def reset(self) -> None:
+        """ Resets all counters to 0. """
+        with self._lock:
+            self.requests = 0
+            self.new_connections = 0
+            self.retries = 0
+            self.coalesced = 0
+
+
+class _CountingConnectionMixin:
+    _stats = None
+
+    def connect(self):
+        if self._stats is not None:
+            self._stats._connection_opened()
+        super().connect()
+
+
+class _CountingHTTPConnection(_CountingConnectionMixin, HTTPConnection):
+    pass
+
+
+class _CountingHTTPSConnection(_CountingConnectionMixin, HTTPSConnection):
+    pass
+
+
+class _CountingPoolMixin:
+    def __init__(self, *args, stats=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._stats = stats
+
+    def _new_conn(self):
+        conn = super()._new_conn()
+        conn._stats = self._stats
+        return conn
+
+
+class _CountingHTTPConnectionPool(_CountingPoolMixin, HTTPConnectionPool):
+    ConnectionCls = _CountingHTTPConnection
+
+
+class _CountingHTTPSConnectionPool(_CountingPoolMixin, HTTPSConnectionPool):
+    ConnectionCls = _CountingHTTPSConnection
+
+
+class PoolAdapter(HTTPAdapter):
+    """ :class:`requests.adapters.HTTPAdapter` that records its requests and new connections in a :class:`ConnectionStats`.
+
+        Parameters:
+            stats (ConnectionStats): Stats object to record to.
+            pool_connections (int): Number of host connection pools to keep.
+            pool_maxsize (int): Number of connections to keep open per host.
+            pool_block (bool): Block when all ``pool_maxsize`` connections are in use instead of opening extra connections that are thrown away after use.
+    """
+
+    __attrs__ = HTTPAdapter.__attrs__ + ["stats"]
+
+    def __init__(self, stats: ConnectionStats, pool_connections: int = 10, pool_maxsize: int = 10, pool_block: bool = False):
+        self.stats = stats
+        super().__init__(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": lambda host, port, **kw: _CountingHTTPConnectionPool(host, port, stats=self.stats, **kw),
+            "https": lambda host, port, **kw: _CountingHTTPSConnectionPool(host, port, stats=self.stats, **kw)
+        }
+
+    def send(self, request, **kwargs):
+        self.stats._request_sent()
+        return super().send(request, **kwargs)
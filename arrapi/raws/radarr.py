@@ -1,11 +1,14 @@
 from requests import Session
-from typing import Optional
-from .base import BaseRawAPI
+from typing import Optional, TYPE_CHECKING
+from .base import BaseRawAPI, AsyncBaseRawAPI
+
+if TYPE_CHECKING:
+    from aiohttp import ClientSession
 
 
 class RadarrRawAPI(BaseRawAPI):
-    def __init__(self, url: str, apikey: str, session: Optional[Session] = None) -> None:
-        super().__init__(url, apikey, session=session)
+    def __init__(self, url: str, apikey: str, session: Optional[Session] = None, **kwargs) -> None:
+        super().__init__(url, apikey, session=session, **kwargs)
 
     def get_movie(self, tmdb_id=None):
         """ GET /movie """
@@ -14,6 +17,10 @@ class RadarrRawAPI(BaseRawAPI):
         else:
             return self._get("movie")
 
+    def iter_movie(self):
+        """ GET /movie yielding each item as it's received """
+        return self._get_stream("movie")
+
     def get_movie_id(self, movie_id):
         """ GET /movie/{id} """
         return self._get(f"movie/{movie_id}")
@@ -47,7 +54,7 @@ class RadarrRawAPI(BaseRawAPI):
             params["addImportExclusion"] = "true"
         if deleteFiles:
             params["deleteFiles"] = "true"
-        self._delete(f"movie/{movie_id}", **params)
+        return self._delete(f"movie/{movie_id}", **params)
 
     def delete_movie_editor(self, json):
         """ DELETE /movie/editor """
@@ -71,3 +78,8 @@ class RadarrRawAPI(BaseRawAPI):
             "tmdbId": tmdb_id,
             "movieYear": year
         })
+
+
+class AsyncRadarrRawAPI(AsyncBaseRawAPI, RadarrRawAPI):
+    def __init__(self, url: str, apikey: str, session: Optional["ClientSession"] = None, **kwargs) -> None:
+        super().__init__(url, apikey, session=session, **kwargs)
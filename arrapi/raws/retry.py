@@ -0,0 +1,80 @@
+import random
+
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import List, Optional
+
+
+class RetryPolicy:
+    """ Controls how failed requests are retried.
+
+        Requests are retried when they fail to connect or the Arr instance responds with one of the ``statuses`` but
+        only for the ``methods`` given. Each request is retried on its own so a retry inside a bulk call only resends
+        that one request.
+
+        The wait before each retry doubles from ``backoff`` up to ``max_backoff`` with full jitter (a random wait between
+        0 and the backoff) unless the response has a ``Retry-After`` header which is used instead.
+
+        Parameters:
+            retries (int): Maximum number of times to retry a request.
+            backoff (float): Seconds to wait before the first retry.
+            max_backoff (float): Maximum seconds to wait before a retry.
+            jitter (bool): Randomize the wait between 0 and the backoff.
+            methods (List[str]): HTTP methods to retry.
+            statuses (List[int]): HTTP status codes to retry.
+            max_retry_after (float): Maximum seconds to wait when using a ``Retry-After`` header.
+    """
+
+    def __init__(self, retries: int = 3, backoff: float = 0.5, max_backoff: float = 30, jitter: bool = True,
+                 methods: List[str] = ("get", "put"), statuses: List[int] = (429, 500, 502, 503, 504),
+                 max_retry_after: float = 120):
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.methods = [m.lower() for m in methods]
+        self.statuses = list(statuses)
+        self.max_retry_after = max_retry_after
+
+    def __repr__(self):
+        return f"[RetryPolicy: {self.retries} retries on {', '.join(self.methods)}]"
+
+    def can_retry(self, method: str, attempt: int) -> bool:
+        """ If a request with the method given can be retried after the number of retries given. """
+        return method.lower() in self.methods and attempt < self.retries
+
+    def retry_status(self, status_code: int) -> bool:
+        """ If a response with the status code given should be retried. """
+        return status_code in self.statuses
+
+    def delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """ Seconds to wait before the retry after the number of retries given.
+
+            Parameters:
+                attempt (int): Number of retries already made.
+                retry_after (Optional[str]): ``Retry-After`` header of the response.
+
+            Returns:
+                float: Seconds to wait.
+        """
+        if retry_after:
+            wait = parse_retry_after(retry_after)
+            if wait is not None:
+                return min(wait, self.max_retry_after)
+        wait = min(self.max_backoff, self.backoff * 2 ** attempt)
+        return random.uniform(0, wait) if self.jitter else wait
+
+
+def parse_retry_after(value: str) -> Optional[float]:
+    """ Parses a ``Retry-After`` header given in seconds or as an HTTP date into seconds to wait. """
+    try:
+        return max(float(value), 0)
+    except ValueError:
+        pass
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    return max((date - datetime.now(timezone.utc)).total_seconds(), 0)
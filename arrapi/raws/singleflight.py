@@ -0,0 +1,105 @@
+import asyncio, threading
+
+from typing import Any, Awaitable, Callable, Hashable, Optional
+
+from arrapi.exceptions import DeadlineExceeded
+from .deadline import current_deadline
+from .state import TransientState
+
+
+class _Call:
+    __slots__ = ("event", "result", "error")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight(TransientState):
+    """ Makes concurrent calls with the same key share one execution of the call.
+
+        Callers arriving while a call with their key is running wait for it and get its result (or exception) instead
+        of running it again. Calls made after it finishes run again. A caller waits no longer than its current
+        :class:`~arrapi.raws.deadline.Deadline`, raising :class:`~arrapi.exceptions.DeadlineExceeded` when it passes
+        while the shared call keeps running.
+
+        Parameters:
+            stats (Optional[:class:`~arrapi.raws.pool.ConnectionStats`]): Stats object to record shared calls to.
+
+        Attributes:
+            hits (int): Number of calls that shared another call instead of running.
+    """
+    _transient = {"_lock": threading.Lock, "_calls": dict, "_tasks": dict}
+
+    def __init__(self, stats=None):
+        self.stats = stats
+        self.hits = 0
+        self._lock = threading.Lock()
+        self._calls = {}
+        self._tasks = {}
+
+    def __repr__(self):
+        return f"[SingleFlight: {self.hits} hits]"
+
+    def _hit(self):
+        self.hits += 1
+        if self.stats is not None:
+            self.stats._coalesced()
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """ Runs ``fn`` unless a call with the same key is already running, in which case its result is returned.
+
+            Parameters:
+                key (Hashable): Key identifying identical calls.
+                fn (Callable[[], Any]): Call to run.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                self._hit()
+        if not leader:
+            deadline = current_deadline()
+            if not call.event.wait(None if deadline is None else deadline.remaining()):
+                raise DeadlineExceeded(f"Deadline of {deadline.seconds}s exceeded")
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+        return call.result
+
+    async def do_async(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """ Awaits ``fn()`` unless a call with the same key is already running, in which case its result is returned.
+            Cancelling one caller doesn't cancel the shared call. Calls are only shared within an event loop.
+
+            Parameters:
+                key (Hashable): Key identifying identical calls.
+                fn (Callable[[], Awaitable[Any]]): Call to run.
+        """
+        key = (asyncio.get_running_loop(), key)
+        task: Optional[asyncio.Future] = self._tasks.get(key)
+        if task is None:
+            task = self._tasks[key] = asyncio.ensure_future(fn())
+            task.add_done_callback(lambda _: self._tasks.pop(key, None))
+        else:
+            self._hit()
+        deadline = current_deadline()
+        if deadline is None:
+            return await asyncio.shield(task)
+        try:
+            return await asyncio.wait_for(asyncio.shield(task), deadline.remaining())
+        except asyncio.TimeoutError:
+            if task.done():
+                raise
+            raise DeadlineExceeded(f"Deadline of {deadline.seconds}s exceeded")
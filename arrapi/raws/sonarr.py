@@ -1,11 +1,14 @@
 from requests import Session
-from typing import Optional
-from .base import BaseRawAPI
+from typing import Optional, TYPE_CHECKING
+from .base import BaseRawAPI, AsyncBaseRawAPI
+
+if TYPE_CHECKING:
+    from aiohttp import ClientSession
 
 
 class SonarrRawAPI(BaseRawAPI):
-    def __init__(self, url: str, apikey: str, session: Optional[Session] = None) -> None:
-        super().__init__(url, apikey, session=session)
+    def __init__(self, url: str, apikey: str, session: Optional[Session] = None, **kwargs) -> None:
+        super().__init__(url, apikey, session=session, **kwargs)
 
     def get_series(self, tvdb_id=None):
         """ GET /series """
@@ -14,6 +17,10 @@ class SonarrRawAPI(BaseRawAPI):
         else:
             return self._get("series")
 
+    def iter_series(self):
+        """ GET /series yielding each item as it's received """
+        return self._get_stream("series")
+
     def get_series_id(self, series_id):
         """ GET /series/{id} """
         return self._get(f"series/{series_id}")
@@ -47,7 +54,7 @@ class SonarrRawAPI(BaseRawAPI):
             params["addImportListExclusion"] = "true"
         if deleteFiles:
             params["deleteFiles"] = "true"
-        self._delete(f"series/{series_id}", **params)
+        return self._delete(f"series/{series_id}", **params)
 
     def delete_series_editor(self, json):
         """ DELETE /series/editor """
@@ -92,4 +99,9 @@ class SonarrRawAPI(BaseRawAPI):
         return self.post_importlistexclusion({
             "title": title,
             "tvdbId": tvdb_id
-        })
\ No newline at end of file
+        })
+
+
+class AsyncSonarrRawAPI(AsyncBaseRawAPI, SonarrRawAPI):
+    def __init__(self, url: str, apikey: str, session: Optional["ClientSession"] = None, **kwargs) -> None:
+        super().__init__(url, apikey, session=session, **kwargs)
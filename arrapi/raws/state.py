@@ -0,0 +1,19 @@
+import threading
+
+
+class TransientState:
+    """ Mixin for objects holding locks or other state that can't be copied or pickled.
+
+        The attributes named in ``_transient`` are left out of the state when the object is deep copied or pickled and
+        recreated by calling their factory when it's restored, so the API objects and every object referencing them
+        (i.e. a :class:`~arrapi.objs.reload.Movie`) can be deep copied and pickled.
+    """
+    _transient = {"_lock": threading.Lock}
+
+    def __getstate__(self):
+        return {k: v for k, v in self.__dict__.items() if k not in self._transient}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        for name, factory in self._transient.items():
+            self.__dict__[name] = factory()
@@ -0,0 +1,243 @@
+import asyncio, base64, json, os, threading, time
+
+from collections import defaultdict, deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Mapping, Optional, Tuple
+from urllib.parse import urlsplit
+
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+
+from arrapi.exceptions import ArrException
+from .state import TransientState
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+
+class Transport:
+    """ Sends the HTTP requests of the raw APIs.
+
+        The raw APIs build the URL, parameters, and encoded body of each request and hand them to their transport along
+        with the session to send them with. Retries, limits, and the circuit breaker run before the transport so a
+        transport only needs to send one request.
+
+        Subclasses implement :meth:`send` for :class:`~arrapi.raws.base.BaseRawAPI` and :meth:`send_async` for
+        :class:`~arrapi.raws.base.AsyncBaseRawAPI`.
+    """
+
+    def send(self, session, method: str, url: str, params: Dict[str, str], body: Optional[bytes],
+             headers: Optional[Dict[str, str]], timeout, stream: bool = False) -> Response:
+        """ Sends a request and returns its :class:`requests.Response`.
+
+            Parameters:
+                session (requests.Session): Session of the raw API.
+                method (str): HTTP method in lowercase.
+                url (str): Full request URL.
+                params (Dict[str, str]): URL parameters including the apikey.
+                body (Optional[bytes]): Encoded JSON body.
+                headers (Optional[Dict[str, str]]): Request headers.
+                timeout (Optional[Union[float, Tuple[float, float]]]): Seconds to wait or a ``(connect, read)`` tuple.
+                stream (bool): Leave the body unread so it can be iterated.
+        """
+        raise NotImplementedError
+
+    async def send_async(self, session, method: str, url: str, params: Dict[str, str], body: Optional[bytes],
+                         headers: Optional[Dict[str, str]], timeout) -> Tuple[int, str, Mapping[str, str], bytes]:
+        """ Sends a request and returns its status, reason, headers, and content.
+
+            Parameters are the same as :meth:`send` with ``session`` being an ``aiohttp.ClientSession``.
+        """
+        raise NotImplementedError
+
+    @asynccontextmanager
+    async def stream_async(self, session, url: str, params: Dict[str, str], timeout) -> AsyncIterator[Tuple[int, str, AsyncIterator[bytes]]]:
+        """ Sends a GET request and yields its status, reason, and an async iterator of the body in chunks.
+
+            Reads the whole body with :meth:`send_async` unless overridden.
+        """
+        status, reason, _, content = await self.send_async(session, "get", url, params, None, None, timeout)
+
+        async def chunks():
+            yield content
+
+        yield status, reason, chunks()
+
+
+def _client_timeout(timeout):
+    if timeout is None:
+        return {}
+    connect, read = timeout if isinstance(timeout, tuple) else (timeout, timeout)
+    return {"timeout": aiohttp.ClientTimeout(sock_connect=connect, sock_read=read)}
+
+
+class HTTPTransport(Transport):
+    """ Default transport sending requests over the network with the session of the raw API. """
+
+    def send(self, session, method, url, params, body, headers, timeout, stream=False):
+        if method == "get":
+            return session.get(url, params=params, timeout=timeout, stream=stream)
+        return session.request(method.upper(), url, data=body, headers=headers, params=params, timeout=timeout)
+
+    async def send_async(self, session, method, url, params, body, headers, timeout):
+        async with session.request(method.upper(), url, data=body, headers=headers, params=params, **_client_timeout(timeout)) as response:
+            return response.status, response.reason, response.headers, await response.read()
+
+    @asynccontextmanager
+    async def stream_async(self, session, url, params, timeout):
+        async with session.get(url, params=params, **_client_timeout(timeout)) as response:
+            yield response.status, response.reason, response.content.iter_chunked(65536)
+
+
+def _key(method, url, params, body):
+    """ Key matching a request to its recordings ignoring the host and apikey. """
+    params = sorted((k, str(v)) for k, v in params.items() if k != "apikey")
+    return method, urlsplit(url).path, json.dumps(params), "" if body is None else body.decode("utf-8")
+
+
+def _encode_content(content: bytes) -> Dict[str, str]:
+    try:
+        return {"content": content.decode("utf-8")}
+    except UnicodeDecodeError:
+        return {"content_base64": base64.b64encode(content).decode("ascii")}
+
+
+def _decode_content(interaction: Dict) -> bytes:
+    if "content_base64" in interaction:
+        return base64.b64decode(interaction["content_base64"])
+    return interaction["content"].encode("utf-8")
+
+
+class RecordingTransport(TransientState, Transport):
+    """ Transport saving every request and response it sends to a cassette file for :class:`ReplayTransport`.
+
+        Each interaction is appended to the file as one line of JSON with the method, path, parameters, body, status,
+        reason, headers, content, and seconds the response took. The apikey and host are never saved. Streamed responses
+        are still streamed and are saved once their body has been read.
+
+        .. code-block:: python
+
+            radarr = RadarrAPI(url, apikey, transport=RecordingTransport("radarr.jsonl"))
+
+        Parameters:
+            path (str): Cassette file to append to.
+            transport (Optional[Transport]): Transport sending the requests. Defaults to :class:`HTTPTransport`.
+    """
+
+    def __init__(self, path: str, transport: Optional[Transport] = None):
+        self.path = path
+        self.transport = HTTPTransport() if transport is None else transport
+        self._lock = threading.Lock()
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+    def __repr__(self):
+        return f"[RecordingTransport: {self.path}]"
+
+    def _record(self, method, url, params, body, status, reason, headers, content, elapsed):
+        method, path, params, body = _key(method, url, params, body)
+        interaction = {"method": method, "path": path, "params": json.loads(params), "body": body, "status": status,
+                       "reason": reason, "headers": dict(headers), **_encode_content(content), "elapsed": round(elapsed, 6)}
+        line = json.dumps(interaction, ensure_ascii=False)
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(f"{line}\n")
+
+    def send(self, session, method, url, params, body, headers, timeout, stream=False):
+        start = time.monotonic()
+        response = self.transport.send(session, method, url, params, body, headers, timeout, stream=stream)
+        if not stream:
+            self._record(method, url, params, body, response.status_code, response.reason, response.headers,
+                         response.content, time.monotonic() - start)
+            return response
+        elapsed = time.monotonic() - start
+        iter_content = response.iter_content
+
+        def recording_iter_content(chunk_size=1, decode_unicode=False):
+            # Streamed responses are recorded once their body has been read, timing only the reads
+            nonlocal elapsed
+            chunks = []
+            read = iter_content(chunk_size, decode_unicode)
+            while True:
+                start = time.monotonic()
+                chunk = next(read, None)
+                elapsed += time.monotonic() - start
+                if chunk is None:
+                    break
+                chunks.append(chunk)
+                yield chunk
+            self._record(method, url, params, body, response.status_code, response.reason, response.headers,
+                         b"".join(chunks), elapsed)
+
+        response.iter_content = recording_iter_content
+        return response
+
+    async def send_async(self, session, method, url, params, body, headers, timeout):
+        start = time.monotonic()
+        result = await self.transport.send_async(session, method, url, params, body, headers, timeout)
+        self._record(method, url, params, body, *result, time.monotonic() - start)
+        return result
+
+
+class ReplayTransport(TransientState, Transport):
+    """ Transport answering requests from a cassette saved by :class:`RecordingTransport` without the network.
+
+        Requests are matched to recordings by method, path, parameters, and body, ignoring the host and apikey. Matching
+        recordings are replayed in the order they were saved and the last one is repeated once they run out.
+
+        .. code-block:: python
+
+            radarr = RadarrAPI("http://replay", "any", transport=ReplayTransport("radarr.jsonl"))
+
+        Parameters:
+            path (str): Cassette file to read.
+            latency (float): Factor of each recorded response time to wait before answering. Answers straight away when ``0``.
+
+        Raises:
+            :class:`~arrapi.exceptions.ArrException`: When a request has no recording.
+    """
+
+    def __init__(self, path: str, latency: float = 0.0):
+        self.path = path
+        self.latency = latency
+        self._recordings = defaultdict(deque)
+        self._lock = threading.Lock()
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    interaction = json.loads(line)
+                    key = _key(interaction["method"], interaction["path"], dict(interaction["params"]),
+                               interaction["body"].encode("utf-8") if interaction["body"] else None)
+                    self._recordings[key].append(interaction)
+
+    def __repr__(self):
+        return f"[ReplayTransport: {self.path}]"
+
+    def _play(self, method, url, params, body):
+        key = _key(method, url, params, body)
+        with self._lock:
+            recordings = self._recordings.get(key)
+            if not recordings:
+                raise ArrException(f"No recorded response for {method.upper()} {key[1]} {key[2]} in {self.path}")
+            return recordings.popleft() if len(recordings) > 1 else recordings[0]
+
+    def send(self, session, method, url, params, body, headers, timeout, stream=False):
+        interaction = self._play(method, url, params, body)
+        if self.latency:
+            time.sleep(interaction["elapsed"] * self.latency)
+        response = Response()
+        response.status_code = interaction["status"]
+        response.reason = interaction["reason"]
+        response.headers = CaseInsensitiveDict(interaction["headers"])
+        response.url = url
+        response._content = _decode_content(interaction)
+        response._content_consumed = True
+        return response
+
+    async def send_async(self, session, method, url, params, body, headers, timeout):
+        interaction = self._play(method, url, params, body)
+        if self.latency:
+            await asyncio.sleep(interaction["elapsed"] * self.latency)
+        return interaction["status"], interaction["reason"], CaseInsensitiveDict(interaction["headers"]), _decode_content(interaction)
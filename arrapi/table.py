@@ -0,0 +1,131 @@
+import array, importlib, importlib.util
+
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+from arrapi.exceptions import Invalid
+from arrapi.objs.base import parse_date
+
+OUTPUTS = ["auto", "array", "numpy", "pandas", "pyarrow"]
+
+MOVIE_COLUMNS = {
+    "id": "int", "tmdbId": "int", "imdbId": "str", "title": "str", "sortTitle": "str", "year": "int",
+    "status": "str", "monitored": "bool", "hasFile": "bool", "isAvailable": "bool", "minimumAvailability": "str",
+    "sizeOnDisk": "int", "runtime": "int", "studio": "str", "certification": "str", "path": "str",
+    "qualityProfileId": "int", "inCinemas": "date", "physicalRelease": "date", "digitalRelease": "date",
+    "added": "date", "rating.votes": "int", "rating.value": "float", "collection.tmdbId": "int",
+    "collection.name": "str"
+}
+
+SERIES_COLUMNS = {
+    "id": "int", "tvdbId": "int", "imdbId": "str", "tvRageId": "int", "tvMazeId": "int", "title": "str",
+    "sortTitle": "str", "year": "int", "status": "str", "ended": "bool", "monitored": "bool", "seasonFolder": "bool",
+    "network": "str", "airTime": "str", "seriesType": "str", "certification": "str", "runtime": "int", "path": "str",
+    "qualityProfileId": "int", "languageProfileId": "int", "firstAired": "date", "previousAiring": "date",
+    "nextAiring": "date", "added": "date", "rating.votes": "int", "rating.value": "float",
+    "statistics.seasonCount": "int", "statistics.episodeCount": "int", "statistics.episodeFileCount": "int",
+    "statistics.totalEpisodeCount": "int", "statistics.sizeOnDisk": "int", "statistics.percentOfEpisodes": "float"
+}
+
+# Missing values like the attributes of the objects: 0 for numbers, False for bools, and None otherwise.
+_defaults = {"int": 0, "float": 0.0, "bool": False}
+_typecodes = {"int": "q", "float": "d", "bool": "b"}
+_epoch = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_microsecond = timedelta(microseconds=1)
+
+
+def table_output(output: str = "auto") -> str:
+    """ Returns the output a table is built as, ``auto`` is numpy when it's installed and array otherwise.
+
+        Parameters:
+            output (str): Output to check. Valid options are auto, array, numpy, pandas, or pyarrow.
+
+        Raises:
+            :class:`~arrapi.exceptions.Invalid`: When the output is invalid or its module isn't installed.
+    """
+    if output not in OUTPUTS:
+        raise Invalid(f"Invalid output: '{output}' Options: {OUTPUTS}")
+    if output == "auto":
+        return "numpy" if importlib.util.find_spec("numpy") else "array"
+    if output != "array" and not importlib.util.find_spec(output):
+        raise Invalid(f"Output '{output}' requires {output} to be installed")
+    return output
+
+
+def _values(items, path, default):
+    keys = path.split(".")
+    if len(keys) == 1:
+        key = keys[0]
+        return [default if (v := item.get(key)) is None else v for item in items]
+    values = []
+    for item in items:
+        for key in keys:
+            item = item.get(key) if isinstance(item, dict) else None
+        values.append(default if item is None else item)
+    return values
+
+
+def _utc(value):
+    if value is None:
+        return None
+    value = parse_date(value)
+    # Values without an offset (i.e. date-only fields) are UTC, astimezone would take them as local time
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value.astimezone(timezone.utc)
+
+
+def build_table(items: List[Dict[str, Any]], types: Dict[str, str], columns: Optional[List[str]] = None,
+                output: str = "auto") -> Any:
+    """ Builds a column for each field of the items given, nested fields are flattened into columns named by their
+        path i.e. ``rating.value``.
+
+        Parameters:
+            items (List[Dict[str, Any]]): Decoded items i.e. the ``/movie`` payload.
+            types (Dict[str, str]): Type of each known column (int, float, bool, str, or date).
+            columns (Optional[List[str]]): Columns to build, every known column when ``None``. Columns that aren't known
+                keep the values as they were decoded.
+            output (str): What to build. Valid options are auto, array, numpy, pandas, or pyarrow.
+
+        Returns:
+            Any: Dictionary of column name to ``array.array`` (numbers and bools) or ``list`` (strings and UTC
+            datetimes) for array, to NumPy arrays for numpy (dates are UTC ``datetime64[us]``), or a pandas
+            ``DataFrame`` or pyarrow ``Table``.
+
+        Raises:
+            :class:`~arrapi.exceptions.Invalid`: When the output is invalid or its module isn't installed.
+    """
+    output = table_output(output)
+    table = {}
+    kinds = {}
+    for column in types if columns is None else columns:
+        kind = kinds[column] = types.get(column, "object")
+        values = _values(items, column, _defaults.get(kind))
+        if kind == "date":
+            values = [_utc(v) for v in values]
+        table[column] = values
+
+    if output == "array":
+        return {c: array.array(_typecodes[kinds[c]], v) if kinds[c] in _typecodes else v for c, v in table.items()}
+    elif output == "pyarrow":
+        pa = importlib.import_module("pyarrow")
+        pa_types = {"int": pa.int64(), "float": pa.float64(), "bool": pa.bool_(), "str": pa.string(),
+                    "date": pa.timestamp("us", tz="UTC")}
+        return pa.table({c: pa.array(v, type=pa_types.get(kinds[c])) for c, v in table.items()})
+
+    np = importlib.import_module("numpy")
+    np_types = {"int": np.int64, "float": np.float64, "bool": np.bool_, "str": object}
+    for column, values in table.items():
+        kind = kinds[column]
+        if kind == "date":
+            # Converting datetime objects in NumPy is several times slower than building the int64 microseconds.
+            nat = np.iinfo(np.int64).min
+            table[column] = np.array([nat if v is None else (v - _epoch) // _microsecond for v in values], dtype=np.int64).view("datetime64[us]")
+        else:
+            table[column] = np.array(values, dtype=np_types.get(kind, object))
+    if output == "numpy":
+        return table
+    pd = importlib.import_module("pandas")
+    frame = pd.DataFrame(table)
+    for column, kind in kinds.items():
+        if kind == "date":
+            frame[column] = frame[column].dt.tz_localize("UTC")
+    return frame
@@ -0,0 +1,43 @@
+""" Nanoseconds per attribute read on a Movie compared to a plain object.
+
+    ``partial Movie`` is built from a list response with ``overview`` missing so it has a lazy field, reading its other
+    fields shouldn't cost more than on a fully loaded Movie.
+
+    Usage: python benchmarks/attribute_access.py [--number 1000000]
+"""
+import argparse, os, random, sys, timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from arrapi import Movie, RadarrAPI
+from synthetic import APIKEY, movie
+
+
+class Plain:
+    __slots__ = ("title", "year", "_data")
+
+    def __init__(self, data):
+        self.title = data["title"]
+        self.year = data["year"]
+        self._data = data
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number", type=int, default=1000000)
+    args = parser.parse_args()
+    radarr = RadarrAPI("http://localhost:7878", APIKEY, version="4.0.0")
+    data = movie(1, random.Random(0))
+    objects = {
+        "plain object": Plain(data),
+        "Movie": Movie(radarr, data=data),
+        "partial Movie": Movie(radarr, data={**data, "overview": None})
+    }
+    for name, obj in objects.items():
+        for attr in ("title", "year", "_data"):
+            seconds = min(timeit.repeat(f"obj.{attr}", globals={"obj": obj}, number=args.number, repeat=5))
+            print(f"{name:<14} .{attr:<6} {seconds / args.number * 1e9:7.1f} ns")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+""" Time building columns for a library compared to building Movies and Series and reading the same fields.
+
+    Usage: python benchmarks/columnar_export.py [--count 50000] [--repeat 3]
+
+    Each run reads the ID, ``monitored``, ``added``, a nested rating and the size on disk of every item, which is what a
+    report over the whole library needs. Outputs whose module isn't installed are skipped.
+"""
+import argparse, gc, os, sys, timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from arrapi import Invalid, Movie, RadarrAPI, Series, SonarrAPI
+from arrapi.table import MOVIE_COLUMNS, SERIES_COLUMNS, build_table, table_output
+from synthetic import APIKEY, library
+
+
+def best(func, repeat):
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=50000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    radarr = RadarrAPI("http://localhost:7878", APIKEY, version="4.0.0")
+    sonarr = SonarrAPI("http://localhost:8989", APIKEY, version="3.0.0")
+    for name, items, build, types, columns, read in [
+        ("Movie", library("radarr", args.count), lambda d: Movie(radarr, data=d), MOVIE_COLUMNS,
+         ["tmdbId", "monitored", "added", "rating.value", "sizeOnDisk"],
+         lambda o: (o.tmdbId, o.monitored, o.added, o.rating_value, o.sizeOnDisk)),
+        ("Series", library("sonarr", args.count), lambda d: Series(sonarr, data=d), SERIES_COLUMNS,
+         ["tvdbId", "monitored", "added", "rating.value", "statistics.sizeOnDisk"],
+         lambda o: (o.tvdbId, o.monitored, o.added, getattr(o, "rating_value", None), o.sizeOnDisk))
+    ]:
+        gc.freeze()
+        objects = best(lambda: [read(build(d)) for d in items], args.repeat)
+        line = f"{name:<7} objects {objects * 1e3:8.1f} ms"
+        for output in ["array", "numpy", "pandas", "pyarrow"]:
+            try:
+                table_output(output)
+            except Invalid:
+                continue
+            elapsed = best(lambda: build_table(items, types, columns=columns, output=output), args.repeat)
+            line += f"  {output} {elapsed * 1e3:8.1f} ms"
+        print(line)
+        gc.unfreeze()
+
+
+if __name__ == "__main__":
+    main()
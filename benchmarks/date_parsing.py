@@ -0,0 +1,66 @@
+""" Time parsing every timestamp in synthetic Radarr and Sonarr libraries.
+
+    Usage: python benchmarks/date_parsing.py [--count 20000] [--repeat 5] [--memo-size 16384]
+
+    ``strptime`` is the parsing ArrAPI used to do (dropping the fractional seconds and the timezone) and
+    ``fromisoformat`` is what ``parse_date`` is from Python 3.11. ``pre-3.11`` is the fallback used before that and
+    ``pre-3.11 memo`` is the fallback memoized like ``parse_date`` is there, starting with an empty memo on every repeat
+    like a single ``all_movies()`` or ``all_series()`` call would. Pass ``--memo-size`` to try other memo sizes.
+"""
+import argparse, functools, os, sys, timeit
+
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from arrapi.objs.base import _parse_isoformat
+from synthetic import library
+
+DATE_KEYS = ("inCinemas", "physicalRelease", "digitalRelease", "added", "firstAired", "previousAiring", "nextAiring")
+
+
+def timestamps(value):
+    if isinstance(value, list):
+        for item in value:
+            yield from timestamps(item)
+    elif isinstance(value, dict):
+        for key, item in value.items():
+            if key in DATE_KEYS and item:
+                yield item
+            else:
+                yield from timestamps(item)
+
+
+def strptime(value):
+    return datetime.strptime(value[:-1].split(".")[0], "%Y-%m-%dT%H:%M:%S")
+
+
+def memoized(parse, values):
+    parse.cache_clear()
+    return [parse(v) for v in values]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--memo-size", type=int, default=16384)
+    args = parser.parse_args()
+    memo = functools.lru_cache(maxsize=args.memo_size)(_parse_isoformat)
+    for kind in ("radarr", "sonarr"):
+        values = list(timestamps(library(kind, args.count)))
+        print(f"{kind}: {len(values)} timestamps, {len(set(values))} distinct")
+        runs = [
+            ("strptime", lambda: [strptime(v) for v in values]),
+            ("pre-3.11", lambda: [_parse_isoformat(v) for v in values]),
+            ("pre-3.11 memo", lambda: memoized(memo, values))
+        ]
+        if sys.version_info >= (3, 11):
+            runs.append(("fromisoformat", lambda: [datetime.fromisoformat(v) for v in values]))
+        for name, run in runs:
+            best = min(timeit.repeat(run, number=1, repeat=args.repeat))
+            print(f"  {name:<14} {best * 1000:8.1f} ms ({best / len(values) * 1e9:6.0f} ns/timestamp)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+""" Memory kept alive by all_movies() and all_series() with and without ``fields``.
+
+    Usage: python benchmarks/field_projection.py [--count 20000]
+
+    Each run decodes the synthetic response, builds the objects the way ``all_movies``/``all_series`` do, and drops
+    everything but the objects, so the bytes reported are what a script holding the list keeps (the objects and the
+    data they reference). The fields kept are the ones a typical sync job needs: ID, TMDb/TVDb ID, path, monitored, and
+    tags.
+"""
+import argparse, gc, json, os, sys, tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from arrapi import Movie, RadarrAPI, Series, SonarrAPI
+from synthetic import APIKEY, library
+
+
+def retained(cls, api, payload, fields):
+    gc.collect()
+    tracemalloc.start()
+    items = json.loads(payload)
+    keys = cls._projection(fields, api._raw.new_codebase)
+    objects = [cls._projected(api, d, keys) for d in items]
+    del items
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=20000)
+    args = parser.parse_args()
+    radarr = RadarrAPI("http://localhost:7878", APIKEY, version="4.0.0")
+    sonarr = SonarrAPI("http://localhost:8989", APIKEY, version="3.0.0")
+    for name, cls, api, kind, fields in [
+        ("Movie", Movie, radarr, "radarr", ["tmdbId", "path", "monitored", "tags"]),
+        ("Series", Series, sonarr, "sonarr", ["tvdbId", "path", "monitored", "tags"])
+    ]:
+        payload = json.dumps(library(kind, args.count))
+        full = retained(cls, api, payload, None)
+        projected = retained(cls, api, payload, fields)
+        print(f"{name:<7} full {full / 2 ** 20:8.1f} MiB  projected {projected / 2 ** 20:8.1f} MiB  "
+              f"({projected / full:.0%}, {(full - projected) / args.count:.0f} bytes saved per object)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+""" Encode and decode time of each installed JSON codec on a synthetic post_movie_import payload.
+
+    Usage: python benchmarks/json_codec.py [--count 5000] [--repeat 5]
+"""
+import argparse, os, sys, timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from arrapi.raws.codec import available_codecs
+from synthetic import library
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    payload = library("radarr", args.count)
+    print(f"{args.count} movies, best of {args.repeat}")
+    for name, codec in available_codecs.items():
+        body = codec.dumps(payload)
+        assert codec.loads(body) == payload
+        encode = min(timeit.repeat(lambda: codec.dumps(payload), number=1, repeat=args.repeat))
+        decode = min(timeit.repeat(lambda: codec.loads(body), number=1, repeat=args.repeat))
+        print(f"{name:<8} encode {encode * 1000:8.1f} ms  decode {decode * 1000:8.1f} ms  {len(body) / 1e6:6.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
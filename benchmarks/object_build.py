@@ -0,0 +1,41 @@
+""" Time building Movies and Series from decoded JSON compared to copying the decoded dictionaries.
+
+    Usage: python benchmarks/object_build.py [--count 50000] [--repeat 3]
+
+    ``build`` creates the objects, ``read`` then reads two fields from each of them (``tmdbId``/``tvdbId`` and
+    ``monitored``) which is the typical script that only filters a library.
+"""
+import argparse, gc, os, sys, timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from arrapi import Movie, RadarrAPI, Series, SonarrAPI
+from synthetic import APIKEY, library
+
+
+def best(func, repeat):
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=50000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    radarr = RadarrAPI("http://localhost:7878", APIKEY, version="4.0.0")
+    sonarr = SonarrAPI("http://localhost:8989", APIKEY, version="3.0.0")
+    for name, items, build, key in [
+        ("Movie", library("radarr", args.count), lambda d: Movie(radarr, data=d), "tmdbId"),
+        ("Series", library("sonarr", args.count), lambda d: Series(sonarr, data=d), "tvdbId")
+    ]:
+        gc.freeze()
+        copy = best(lambda: [dict(d) for d in items], args.repeat)
+        built = best(lambda: [build(d) for d in items], args.repeat)
+        read = best(lambda: [(getattr(o, key), o.monitored) for o in [build(d) for d in items]], args.repeat)
+        print(f"{name:<7} dict copy {copy / args.count * 1e6:6.2f} us  build {built / args.count * 1e6:6.2f} us  "
+              f"build + read {read / args.count * 1e6:6.2f} us per object")
+        gc.unfreeze()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+""" Bytes allocated per Movie and per Series (with its Seasons) built from a synthetic library.
+
+    Usage: python benchmarks/object_memory.py [--count 5000]
+
+    The decoded JSON the objects are built from is allocated before measuring so only the objects themselves (with
+    their nested Images, Tags, Seasons, and parsed values) are counted. Fields are parsed when first read so objects
+    are measured as built and again after every field has been read, against the objects that parsed every field into
+    a slot when built. The instance is the object itself plus the dictionary of its parsed values.
+"""
+import argparse, gc, os, sys, tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from arrapi import Movie, RadarrAPI, Series, SonarrAPI
+from synthetic import APIKEY, library
+
+# Bytes per object when every field was parsed into a slot as the object was built (3000 of each).
+EAGER_SLOTS = {"Movie": 2354, "Series": 3235}
+
+
+def read_all(obj):
+    obj._partial = False  # there's no server to reload the fields the synthetic data leaves out from
+    for name in dir(obj):
+        if not name.startswith("_"):
+            getattr(obj, name, None)
+    return obj
+
+
+def measure(build, items):
+    gc.collect()
+    tracemalloc.start()
+    objects = [build(item) for item in items]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return size / len(items)
+
+
+def instance_size(obj):
+    return sys.getsizeof(obj) + (sys.getsizeof(obj._parsed) if obj._parsed is not None else 0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=5000)
+    args = parser.parse_args()
+    radarr = RadarrAPI("http://localhost:7878", APIKEY, version="4.0.0")
+    sonarr = SonarrAPI("http://localhost:8989", APIKEY, version="3.0.0")
+    movies = library("radarr", args.count)
+    series = library("sonarr", args.count)
+    seasons = sum(len(s["seasons"]) for s in series) / len(series)
+    print(f"{args.count} objects each")
+    for cls, arr, items in [(Movie, radarr, movies), (Series, sonarr, series)]:
+        name = cls.__name__
+        built = measure(lambda d: cls(arr, data=d), items)
+        read = measure(lambda d: read_all(cls(arr, data=d)), items)
+        instance = instance_size(read_all(cls(arr, data=items[0])))
+        print(f"{name:<6} {built:8.0f} bytes as built {read:8.0f} bytes read ({read / EAGER_SLOTS[name] - 1:+.0%} against "
+              f"{EAGER_SLOTS[name]} with eager slots) {instance:6d} bytes instance")
+    print(f"Series have {seasons:.1f} seasons each")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+""" Time RadarrAPI.all_movies() replayed from a cassette without a server, building Movies and as raw results.
+
+    Usage: python benchmarks/replay.py [--cassette radarr.jsonl] [--count 5000] [--repeat 5] [--latency 0]
+
+    Without ``--cassette`` a synthetic library is recorded to a temporary cassette first. A cassette recorded from a
+    real instance with :class:`arrapi.RecordingTransport` can be passed instead to benchmark against its responses.
+"""
+import argparse, os, sys, tempfile, timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from arrapi import RadarrAPI, RecordingTransport, ReplayTransport
+from synthetic import APIKEY, LibraryServer
+
+
+def record(path, count):
+    with LibraryServer("radarr", count) as server:
+        RadarrAPI(server.url, APIKEY, transport=RecordingTransport(path)).all_movies()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cassette")
+    parser.add_argument("--count", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--latency", type=float, default=0.0, help="factor of the recorded response times to wait")
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as temp:
+        cassette = args.cassette
+        if cassette is None:
+            cassette = os.path.join(temp, "radarr.jsonl")
+            record(cassette, args.count)
+        radarr = RadarrAPI("http://replay", APIKEY, transport=ReplayTransport(cassette, latency=args.latency))
+        movies = len(radarr.all_movies())
+        for label, call in [("objects", radarr.all_movies), ("raw", lambda: radarr.all_movies(raw=True))]:
+            best = min(timeit.repeat(call, number=1, repeat=args.repeat))
+            print(f"all_movies {movies} movies replayed as {label}, best of {args.repeat}: {best * 1000:8.1f} ms "
+                  f"({best / max(movies, 1) * 1e6:6.1f} us/movie)")
+
+
+if __name__ == "__main__":
+    main()
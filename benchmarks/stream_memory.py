@@ -0,0 +1,47 @@
+""" Peak RSS of RadarrAPI.all_movies() vs RadarrAPI.iter_movies() on a synthetic library.
+
+    Usage: python benchmarks/stream_memory.py [--count 50000]
+
+    Each mode runs in a fresh subprocess so the peak RSS of one doesn't hide the other.
+"""
+import argparse, os, resource, subprocess, sys, time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from synthetic import APIKEY, LibraryServer
+
+
+def peak_rss_mb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def child(mode, url):
+    from arrapi import RadarrAPI
+    radarr = RadarrAPI(url, APIKEY)
+    baseline = peak_rss_mb()
+    start = time.perf_counter()
+    if mode == "all_movies":
+        count = 0
+        for movie in radarr.all_movies():
+            count += movie.id is not None
+    else:
+        count = sum(movie.id is not None for movie in radarr.iter_movies())
+    elapsed = time.perf_counter() - start
+    print(f"{mode:<12} {count:>7} movies  {elapsed:6.2f}s  peak RSS {peak_rss_mb() - baseline:8.1f} MB above baseline")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=50000)
+    parser.add_argument("--child", nargs=2, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        return child(*args.child)
+    with LibraryServer("radarr", args.count) as server:
+        print(f"payload: {len(server.payload) / 1e6:.1f} MB")
+        for mode in ("all_movies", "iter_movies"):
+            subprocess.run([sys.executable, __file__, "--child", mode, server.url], check=True)
+
+
+if __name__ == "__main__":
+    main()
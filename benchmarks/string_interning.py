@@ -0,0 +1,66 @@
+""" Memory and build time saved by interning low-cardinality strings in a synthetic library decoded from JSON.
+
+    Usage: python benchmarks/string_interning.py [--count 50000]
+
+    The library is encoded and decoded again so every string value is its own object like in a real response. The
+    memory counted is the decoded payload plus the objects built from it after reading every field (so the Images are
+    built too), with interning on and turned off.
+"""
+import argparse, gc, json, os, sys, time, tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from arrapi import Movie, RadarrAPI, Series, SonarrAPI
+from arrapi.objs.simple import Image
+from synthetic import APIKEY, library
+
+
+def read_all(obj):
+    obj._partial = False  # there's no server to reload the fields the synthetic data leaves out from
+    for name in dir(obj):
+        if not name.startswith("_"):
+            getattr(obj, name, None)
+    return obj
+
+
+def measure(payload, build):
+    items = json.loads(payload)
+    gc.collect()
+    start = time.perf_counter()
+    objects = [build(item) for item in items]
+    elapsed = time.perf_counter() - start
+    del objects, items
+    gc.collect()
+    tracemalloc.start()
+    objects = [read_all(build(item)) for item in json.loads(payload)]
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return size, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=50000)
+    args = parser.parse_args()
+    radarr = RadarrAPI("http://localhost:7878", APIKEY, version="4.0.0")
+    sonarr = SonarrAPI("http://localhost:8989", APIKEY, version="3.0.0")
+    for cls, build, kind in [
+        (Movie, lambda d: Movie(radarr, data=d), "radarr"),
+        (Series, lambda d: Series(sonarr, data=d), "sonarr")
+    ]:
+        payload = json.dumps(library(kind, args.count))
+        interned = cls._interned, Image._interned
+        on, on_time = measure(payload, build)
+        cls._interned, Image._interned = (), ()
+        off, off_time = measure(payload, build)
+        cls._interned, Image._interned = interned
+        print(f"{args.count} {cls.__name__} objects ({', '.join(cls._interned)}, Image.coverType)")
+        print(f"  not interned {off / 2 ** 20:8.1f} MiB  build {off_time * 1000:7.1f} ms")
+        print(f"  interned     {on / 2 ** 20:8.1f} MiB  build {on_time * 1000:7.1f} ms")
+        print(f"  saved        {(off - on) / 2 ** 20:8.1f} MiB ({(off - on) / off * 100:.1f}%, {(off - on) / args.count:.0f} bytes per object)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+""" Synthetic Radarr and Sonarr libraries and a local server serving them for the benchmarks. """
+import json, random, threading
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+APIKEY = "0123456789abcdef"
+STUDIOS = ["Warner Bros. Pictures", "Universal Pictures", "Paramount Pictures", "Columbia Pictures", "A24", "Pixar"]
+NETWORKS = ["HBO", "NBC", "ABC", "Netflix", "BBC One", "AMC"]
+GENRES = ["Action", "Adventure", "Comedy", "Drama", "Horror", "Science Fiction", "Thriller", "Animation"]
+CERTIFICATIONS = ["G", "PG", "PG-13", "R", "NC-17"]
+
+
+def _images(rng):
+    return [{"coverType": t, "url": f"/MediaCover/{rng.randint(1, 99999)}/{t}.jpg",
+             "remoteUrl": f"https://image.tmdb.org/t/p/original/{rng.getrandbits(64):x}.jpg"}
+            for t in ("poster", "fanart", "banner")]
+
+
+def _timestamp(rng, fraction=False, midnight=False):
+    """ Returns a timestamp the way Arr instances send them, release and air dates are at a fixed time of day. """
+    date = f"20{rng.randint(0, 23):02d}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+    if midnight:
+        return f"{date}T00:00:00Z"
+    time = f"{rng.randint(0, 23):02d}:{rng.randint(0, 59):02d}:{rng.randint(0, 59):02d}"
+    return f"{date}T{time}.{rng.randint(0, 9999999):07d}Z" if fraction else f"{date}T{time}Z"
+
+
+def movie(i, rng):
+    """ Returns a Radarr v3 movie resource. """
+    return {
+        "id": i, "title": f"Movie {i}", "originalTitle": f"Movie {i}", "sortTitle": f"movie {i}",
+        "sizeOnDisk": rng.randint(0, 60_000_000_000), "status": rng.choice(["announced", "inCinemas", "released"]),
+        "overview": " ".join(rng.choice(GENRES).lower() for _ in range(60)),
+        "inCinemas": _timestamp(rng, midnight=True), "physicalRelease": _timestamp(rng, midnight=True),
+        "digitalRelease": _timestamp(rng, midnight=True),
+        "images": _images(rng), "website": "", "year": rng.randint(1950, 2023), "hasFile": rng.random() > 0.2,
+        "youTubeTrailerId": f"{rng.getrandbits(40):x}", "studio": rng.choice(STUDIOS),
+        "path": f"/movies/Movie {i}", "qualityProfileId": rng.randint(1, 4), "monitored": rng.random() > 0.1,
+        "minimumAvailability": rng.choice(["announced", "inCinemas", "released"]), "isAvailable": True,
+        "folderName": f"/movies/Movie {i}", "runtime": rng.randint(80, 180), "cleanTitle": f"movie{i}",
+        "imdbId": f"tt{i:07d}", "tmdbId": i, "titleSlug": str(i), "certification": rng.choice(CERTIFICATIONS),
+        "genres": rng.sample(GENRES, 3), "tags": rng.sample(range(1, 20), 2),
+        "added": _timestamp(rng), "ratings": {"votes": rng.randint(0, 30000), "value": round(rng.random() * 10, 1)},
+        "collection": {"name": f"Collection {i // 3}", "tmdbId": 100000 + i // 3, "images": []},
+        "popularity": rng.random() * 100, "alternateTitles": [],
+    }
+
+
+def series(i, rng):
+    """ Returns a Sonarr v3 series resource. """
+    return {
+        "id": i, "title": f"Series {i}", "sortTitle": f"series {i}", "status": rng.choice(["continuing", "ended"]),
+        "ended": rng.random() > 0.5, "overview": " ".join(rng.choice(GENRES).lower() for _ in range(60)),
+        "network": rng.choice(NETWORKS), "airTime": "21:00", "images": _images(rng),
+        "seasons": [{"seasonNumber": n, "monitored": True, "statistics": {"episodeFileCount": 10, "episodeCount": 10,
+                     "totalEpisodeCount": 10, "sizeOnDisk": rng.randint(0, 20_000_000_000), "percentOfEpisodes": 100.0,
+                     "previousAiring": _timestamp(rng, midnight=True).replace("T00", "T01")}}
+                    for n in range(1, rng.randint(2, 6))],
+        "year": rng.randint(1990, 2023), "path": f"/tv/Series {i}", "qualityProfileId": 1, "languageProfileId": 1,
+        "seasonFolder": True, "monitored": True, "useSceneNumbering": False, "runtime": 45, "tvdbId": i,
+        "tvRageId": 0, "tvMazeId": i, "firstAired": _timestamp(rng, midnight=True),
+        "previousAiring": _timestamp(rng, midnight=True).replace("T00", "T01"), "seriesType": "standard",
+        "cleanTitle": f"series{i}", "imdbId": f"tt{i:07d}", "titleSlug": f"series-{i}", "certification": "TV-14",
+        "genres": rng.sample(GENRES, 3), "tags": rng.sample(range(1, 20), 2), "added": _timestamp(rng, fraction=True),
+        "ratings": {"votes": rng.randint(0, 30000), "value": round(rng.random() * 10, 1)},
+        "statistics": {"seasonCount": 3, "episodeFileCount": 30, "episodeCount": 30, "totalEpisodeCount": 30,
+                       "sizeOnDisk": rng.randint(0, 60_000_000_000), "percentOfEpisodes": 100.0},
+    }
+
+
+def library(kind="radarr", count=50000, seed=0):
+    """ Returns a list of ``count`` movies or series. """
+    rng = random.Random(seed)
+    build = movie if kind == "radarr" else series
+    return [build(i, rng) for i in range(1, count + 1)]
+
+
+class LibraryServer:
+    """ Serves a synthetic library as ``/api/v3/movie`` or ``/api/v3/series`` from a pre-encoded payload. """
+
+    def __init__(self, kind="radarr", count=50000, version="4.0.0"):
+        self.kind = kind
+        self.payload = json.dumps(library(kind, count)).encode()
+        self.status = json.dumps({"version": version}).encode()
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self.server.daemon_threads = True
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _handler(self):
+        library_server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                path = self.path.split("?")[0].split("/api/v3/", 1)[-1]
+                content = library_server.status if path == "system/status" else library_server.payload
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                for i in range(0, len(content), 1 << 20):
+                    self.wfile.write(content[i:i + (1 << 20)])
+
+        return Handler
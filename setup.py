@@ -29,6 +29,10 @@ setup(
     install_requires=[
         "requests"
     ],
+    extras_require={
+        "async": ["aiohttp"],
+        "fast": ["orjson"]
+    },
     project_urls={
         "Documentation": "https://arrapi.kometa.wiki",
         "Funding": "https://github.com/sponsors/meisnate12",
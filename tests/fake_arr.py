@@ -0,0 +1,179 @@
+import json, re, threading, time
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+
+APIKEY = "0123456789abcdef"
+
+
+class FakeArr:
+    """ Minimal in memory stand-in for a Radarr or Sonarr v3 server used by the offline tests. """
+
+    def __init__(self, kind="radarr", version="4.0.0"):
+        self.kind = kind
+        self.version = version
+        self.lock = threading.Lock()
+        self.requests = []
+        self.failures = []
+        self.delay = 0
+        self.tags = {}
+        self.items = {}
+        self.next_id = 1
+        self.quality_profiles = [{"id": 1, "name": "HD-1080p"}, {"id": 2, "name": "Any"}]
+        self.language_profiles = [{"id": 1, "name": "English"}]
+        self.root_folders = [{"id": 1, "path": "/media", "freeSpace": 100}]
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self.server.daemon_threads = True
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def count(self, method, path):
+        """ Number of requests received for the method and path (without the ``/api/v3/`` prefix). """
+        return sum(1 for m, p in self.requests if m == method and p == path)
+
+    def fail(self, method, path, status=503, times=1, headers=None):
+        """ Responds to the next ``times`` requests for the method and path with the status and headers given. """
+        self.failures.extend([(method, path, status, headers or {})] * times)
+
+    def lookup(self, term):
+        source, _, value = term.partition(":")
+        if self.kind == "radarr":
+            tmdb_id = int(value[2:]) if source == "imdb" else int(value)
+            for item in self.items.values():
+                if item["tmdbId"] == tmdb_id:
+                    return [item]
+            if tmdb_id >= 900000:
+                return []
+            return [{"title": f"Movie {tmdb_id}", "tmdbId": tmdb_id, "imdbId": f"tt{tmdb_id:07d}", "year": 2000,
+                     "status": "released", "added": "0001-01-01T00:00:00Z", "tags": [], "images": []}]
+        tvdb_id = int(value)
+        for item in self.items.values():
+            if item["tvdbId"] == tvdb_id:
+                return [item]
+        if tvdb_id >= 900000:
+            return []
+        return [{"title": f"Series {tvdb_id}", "tvdbId": tvdb_id, "year": 2000, "status": "continuing",
+                 "tags": [], "images": [], "seasons": [{"seasonNumber": 1, "monitored": True}]}]
+
+    def add(self, data):
+        data = dict(data)
+        data["id"] = self.next_id
+        self.next_id += 1
+        self.items[data["id"]] = data
+        return data
+
+    def route(self, method, path, query, body):
+        """ Returns the status and JSON response for a request. """
+        item_path = "movie" if self.kind == "radarr" else "series"
+        ids_key = "movieIds" if self.kind == "radarr" else "seriesIds"
+        match = re.fullmatch(r"([a-zA-Z/]+?)(?:/(\d+))?", path)
+        if not match:
+            return 404, {"message": "NotFound"}
+        base, _id = match.group(1), int(match.group(2)) if match.group(2) else None
+        if base == "system/status":
+            return 200, {"version": self.version}
+        elif base == "qualityProfile":
+            return 200, self.quality_profiles if _id is None else self.quality_profiles[_id - 1]
+        elif base == "languageProfile":
+            return 200, self.language_profiles if _id is None else self.language_profiles[_id - 1]
+        elif base == "rootFolder":
+            return 200, self.root_folders
+        elif base == "seasonPass":
+            for series in body["series"]:
+                self.items[series["id"]]["monitored"] = series["monitored"]
+            return 202, {}
+        elif base == "tag":
+            if method == "GET" and _id is None:
+                return 200, list(self.tags.values())
+            elif method == "POST":
+                tag = {"id": len(self.tags) + 1, "label": body["label"]}
+                self.tags[tag["id"]] = tag
+                return 201, tag
+            elif _id not in self.tags:
+                return 404, {"message": "NotFound"}
+            elif method == "PUT":
+                self.tags[_id] = {"id": _id, "label": body["label"]}
+            elif method == "DELETE":
+                self.tags.pop(_id)
+                return 200, {}
+            return 200, self.tags[_id]
+        elif base == f"{item_path}/lookup":
+            return 200, self.lookup(query["term"][0])
+        elif base == f"{item_path}/import":
+            return 201, [self.add(d) for d in body]
+        elif base == f"{item_path}/editor":
+            if method == "DELETE":
+                for i in body[ids_key]:
+                    self.items.pop(i, None)
+                return 200, {}
+            edited = []
+            for i in body[ids_key]:
+                self.items[i].update({k: v for k, v in body.items() if k not in [ids_key, "applyTags", "moveFiles"]})
+                edited.append(self.items[i])
+            return 202, edited
+        elif base == item_path:
+            if method == "GET" and _id is None:
+                return 200, list(self.items.values())
+            elif method == "POST":
+                return 201, self.add(body)
+            elif _id not in self.items:
+                return 404, {"message": "NotFound"}
+            elif method == "PUT":
+                self.items[_id] = body
+            elif method == "DELETE":
+                self.items.pop(_id)
+                return 200, {}
+            return 200, self.items[_id]
+        return 404, {"message": "NotFound"}
+
+    def _handler(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def _respond(self):
+                url = urlsplit(self.path)
+                query = parse_qs(url.query)
+                path = url.path.split("/api/v3/", 1)[-1]
+                length = int(self.headers.get("Content-Length", 0))
+                body = json.loads(self.rfile.read(length)) if length else None
+                headers = {}
+                if fake.delay:
+                    time.sleep(fake.delay)
+                with fake.lock:
+                    fake.requests.append((self.command, path))
+                    failure = next((f for f in fake.failures if f[:2] == (self.command, path)), None)
+                    if failure:
+                        fake.failures.remove(failure)
+                        status, response, headers = failure[2], {"message": "Failure"}, failure[3]
+                    elif query.get("apikey", [None])[0] != APIKEY:
+                        status, response = 401, {"message": "Unauthorized"}
+                    else:
+                        status, response = fake.route(self.command, path, query, body)
+                content = json.dumps(response).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(content)))
+                for key, value in headers.items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(content)
+
+            do_GET = do_POST = do_PUT = do_DELETE = _respond
+
+        return Handler
@@ -0,0 +1,207 @@
+import asyncio, unittest
+
+from arrapi import AsyncRadarrAPI, AsyncSonarrAPI, Movie, NotFound, Exists, Unauthorized, RetryPolicy, CircuitBreaker, CircuitOpen, ConcurrencyLimiter, ArrException, Deadline, DeadlineExceeded, Metrics
+from arrapi.raws.deadline import current_deadline
+from fake_arr import FakeArr, APIKEY
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+
+@unittest.skipIf(aiohttp is None, "aiohttp is not installed")
+class AsyncRadarrTests(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.server = FakeArr("radarr").__enter__()
+
+    def tearDown(self):
+        self.server.__exit__(None, None, None)
+
+    async def test_connect(self):
+        async with AsyncRadarrAPI(self.server.url, APIKEY) as radarr:
+            self.assertTrue(radarr._raw.v4)
+            status = await radarr.system_status()
+            self.assertEqual(status.version, "4.0.0")
+        with self.assertRaises(Unauthorized):
+            async with AsyncRadarrAPI(self.server.url, "bad"):
+                pass
+
+    async def test_retry(self):
+        async with AsyncRadarrAPI(self.server.url, APIKEY, retry=RetryPolicy(backoff=0.01)) as radarr:
+            self.server.fail("GET", "movie", status=503, times=2)
+            self.assertEqual(await radarr.all_movies(), [])
+            self.assertEqual(radarr.connection_stats.retries, 2)
+
+    async def test_circuit_breaker(self):
+        async with AsyncRadarrAPI(self.server.url, APIKEY, breaker=CircuitBreaker(failure_threshold=1, cool_down=0.1)) as radarr:
+            self.server.fail("GET", "movie", status=503)
+            with self.assertRaises(ArrException):
+                await radarr.all_movies()
+            with self.assertRaises(CircuitOpen):
+                await radarr.all_movies()
+            await asyncio.sleep(0.15)
+            self.assertEqual(await radarr.all_movies(), [])
+            self.assertEqual(radarr.circuit_state, "closed")
+
+    async def test_concurrency_limit(self):
+        limiter = ConcurrencyLimiter(limit=1, max_limit=1)
+        order = []
+
+        async def send(i):
+            await limiter.acquire_async()
+            order.append(i)
+            await asyncio.sleep(0)
+            limiter.release(0.01)
+
+        await limiter.acquire_async()
+        tasks = [asyncio.create_task(send(i)) for i in range(5)]
+        await asyncio.sleep(0)
+        tasks[2].cancel()
+        self.assertFalse(limiter.try_acquire())
+        limiter.release(0.01)
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self.assertEqual(order, [0, 1, 3, 4])
+        self.assertEqual(limiter.in_flight, 0)
+        async with AsyncRadarrAPI(self.server.url, APIKEY, concurrency_limit=ConcurrencyLimiter(limit=2, max_limit=2)) as radarr:
+            await asyncio.gather(*[radarr.all_movies() for _ in range(6)])
+            self.assertEqual(radarr._raw.concurrency_limit.in_flight, 0)
+
+    async def test_shared_deadline(self):
+        deadline = Deadline(5)
+
+        async def enter():
+            with deadline:
+                await asyncio.sleep(0)
+                self.assertIs(current_deadline(), deadline)
+
+        await asyncio.gather(*[enter() for _ in range(3)])
+        self.assertIsNone(current_deadline())
+
+    async def test_connect_once(self):
+        radarr = AsyncRadarrAPI(self.server.url, APIKEY)
+        try:
+            await asyncio.gather(radarr.all_tags(), radarr.all_movies(), radarr.connect())
+            self.assertTrue(radarr._raw.v4)
+            self.assertEqual(self.server.count("GET", "system/status"), 1)
+        finally:
+            await radarr.close()
+        async with AsyncRadarrAPI(self.server.url, APIKEY, version="4.0.0"):
+            self.assertEqual(self.server.count("GET", "system/status"), 1)
+
+    async def test_coalesce(self):
+        async with AsyncRadarrAPI(self.server.url, APIKEY) as radarr:
+            results = await asyncio.gather(*[radarr.all_tags() for _ in range(5)])
+            self.assertEqual(self.server.count("GET", "tag"), 1)
+            self.assertEqual(radarr.connection_stats.coalesced, 4)
+            self.assertEqual(results, [[]] * 5)
+            self.server.delay = 0.2
+            leader = asyncio.create_task(radarr.all_tags())
+            await asyncio.sleep(0)
+            with self.assertRaises(DeadlineExceeded):
+                with Deadline(0.05):
+                    await radarr.all_tags()
+            self.assertEqual(await leader, [])
+
+    async def test_prefetch(self):
+        async with AsyncRadarrAPI(self.server.url, APIKEY) as radarr:
+            tag = await radarr.create_tag("prefetch")
+            self.server.add({"title": "Prefetch", "tmdbId": 20, "tags": [tag.id], "qualityProfileId": 2})
+            movie = (await radarr.all_movies(prefetch=["tags", "qualityProfile"]))[0]
+            self.assertEqual((movie.tags[0].label, movie.qualityProfile.name), ("prefetch", "Any"))
+            self.assertEqual(self.server.count("GET", f"tag/{tag.id}") + self.server.count("GET", "qualityProfile/2"), 0)
+
+    async def test_projection(self):
+        async with AsyncRadarrAPI(self.server.url, APIKEY) as radarr:
+            self.server.add({"title": "Projected", "tmdbId": 30, "monitored": True, "overview": "x" * 500})
+            movie = (await radarr.all_movies(fields=["tmdbId", "monitored"]))[0]
+            self.assertEqual((movie.tmdbId, movie.monitored), (30, True))
+            with self.assertRaises(AttributeError):
+                movie.overview
+            await movie.reload()
+            self.assertEqual(movie.overview, "x" * 500)
+
+    async def test_raw_results(self):
+        async with AsyncRadarrAPI(self.server.url, APIKEY) as radarr:
+            self.server.add({"title": "Raw", "tmdbId": 40, "imdbId": "tt0000040", "monitored": True, "tags": []})
+            radarr.raw_results = True
+            movies = await radarr.all_movies()
+            self.assertEqual([m["tmdbId"] async for m in radarr.iter_movies()], [40])
+            lookup = await radarr.search_movies("tmdb:50")
+            added, existing, _, _ = await radarr.add_multiple_movies(lookup + movies, "/media", "HD-1080p")
+            self.assertEqual(([m.tmdbId for m in added], [m.tmdbId for m in existing]), ([50], [40]))
+            edited, _ = await radarr.edit_multiple_movies(movies, monitored=False)
+            self.assertEqual([m.monitored for m in edited], [False])
+
+    async def test_iter_movies(self):
+        limiter = ConcurrencyLimiter(limit=1, max_limit=1)
+        async with AsyncRadarrAPI(self.server.url, APIKEY, concurrency_limit=limiter, metrics=Metrics()) as radarr:
+            for i in range(1, 51):
+                self.server.add({"title": f"Movie {i}", "tmdbId": i})
+            self.assertEqual([m.tmdbId async for m in radarr.iter_movies()], list(range(1, 51)))
+            self.assertEqual(limiter.in_flight, 0)
+            endpoint = next(m for m in radarr.metrics.snapshot() if m["endpoint"] == "movie")
+            self.assertEqual((endpoint["calls"], endpoint["statuses"]), (1, {200: 1}))
+            self.assertGreater(endpoint["response_bytes"], 0)
+            with self.assertRaises(DeadlineExceeded):
+                with Deadline(0):
+                    [m async for m in radarr.iter_movies()]
+            self.assertEqual(self.server.count("GET", "movie"), 1)
+
+    async def test_single_add_edit_delete(self):
+        async with AsyncRadarrAPI(self.server.url, APIKEY) as radarr:
+            movie = await radarr.get_movie(tmdb_id=11)
+            self.assertIsInstance(movie, Movie)
+            self.assertEqual(movie.title, "Movie 11")
+            self.assertIsNone(movie.id)
+            await movie.add("/media", "HD-1080p", tags=["arrapi"])
+            self.assertIsNotNone(movie.id)
+            with self.assertRaises(Exists):
+                await movie.add("/media", "HD-1080p")
+            await movie.edit(quality_profile="Any")
+            self.assertEqual(movie.qualityProfileId, 2)
+            tag = movie.tags[0]
+            self.assertIsNone(tag.label)
+            await tag.reload()
+            self.assertEqual(tag.label, "arrapi")
+            await movie.delete()
+            self.assertIsNone(movie.id)
+            with self.assertRaises(NotFound):
+                await movie.delete()
+
+    async def test_multiple_add_edit_delete(self):
+        async with AsyncRadarrAPI(self.server.url, APIKEY) as radarr:
+            ids = [1, 2, "tt0000003", 2, 999999, (4, "/media/Movie 4")]
+            added, existing, invalid, excluded = await radarr.add_multiple_movies(ids, "/media", "HD-1080p",
+                                                                                  max_lookups=2)
+            self.assertEqual([m.tmdbId for m in added], [1, 2, 3, 4])
+            self.assertEqual(invalid, [999999])
+            self.assertEqual(excluded, [2])
+            self.assertEqual(self.server.count("GET", "movie/lookup"), 5)
+            edited, missing = await radarr.edit_multiple_movies([1, 2, 3, 5], tags=["bulk"], per_request=2)
+            self.assertEqual(len(edited), 3)
+            self.assertEqual(missing, [5])
+            self.assertEqual(await radarr.delete_multiple_movies([1, 2, 3, 4]), [])
+            self.assertEqual(await radarr.all_movies(), [])
+
+
+@unittest.skipIf(aiohttp is None, "aiohttp is not installed")
+class AsyncSonarrTests(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.server = FakeArr("sonarr").__enter__()
+
+    def tearDown(self):
+        self.server.__exit__(None, None, None)
+
+    async def test_add_edit_delete(self):
+        async with AsyncSonarrAPI(self.server.url, APIKEY) as sonarr:
+            added, _, invalid, _ = await sonarr.add_multiple_series([83268, 283468, 999999], "/media", "HD-1080p")
+            self.assertEqual([s.tvdbId for s in added], [83268, 283468])
+            self.assertEqual(invalid, [999999])
+            series = await sonarr.get_series(tvdb_id=83268)
+            self.assertEqual(series.seasons[0].seasonNumber, 1)
+            await series.edit(monitored=False, series_type="anime")
+            self.assertFalse(series.monitored)
+            self.assertEqual(await sonarr.delete_multiple_series([83268, 283468]), [])
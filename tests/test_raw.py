@@ -0,0 +1,577 @@
+import asyncio, copy, os, pickle, tempfile, threading, time, unittest
+from datetime import datetime, timedelta, timezone
+
+from arrapi import ArrException, Invalid, LazyLoadWarning, Metrics, Movie, NotFound, RadarrAPI, RetryPolicy, RateLimiter, ConcurrencyLimiter, CapabilityCache, CircuitBreaker, CircuitOpen, Deadline, DeadlineExceeded, RecordingTransport, ReplayTransport, TooManyLazyLoads, Unauthorized
+from arrapi.objs.base import _parse_isoformat, parse_date
+from arrapi.objs.simple import Image
+from arrapi.raws.codec import available_codecs, get_codec
+from arrapi.raws.singleflight import SingleFlight
+from fake_arr import FakeArr, APIKEY
+
+
+class RawTests(unittest.TestCase):
+
+    def setUp(self):
+        self.server = FakeArr("radarr").__enter__()
+
+    def tearDown(self):
+        self.server.__exit__(None, None, None)
+
+    def test_connection_reuse(self):
+        radarr = RadarrAPI(self.server.url, APIKEY, pool_maxsize=2, timeout=(5, 30))
+        for _ in range(4):
+            radarr.all_movies()
+        self.assertEqual(radarr.connection_stats.requests, 5)
+        self.assertEqual(radarr.connection_stats.new_connections, 1)
+        self.assertEqual(radarr.connection_stats.reused_connections, 4)
+
+    def test_no_keep_alive(self):
+        radarr = RadarrAPI(self.server.url, APIKEY, keep_alive=False)
+        for _ in range(4):
+            radarr.all_movies()
+        self.assertEqual(radarr.connection_stats.new_connections, 5)
+        self.assertEqual(radarr.connection_stats.reused_connections, 0)
+
+    def test_retry(self):
+        radarr = RadarrAPI(self.server.url, APIKEY, retry=RetryPolicy(retries=2, backoff=0.01, jitter=False))
+        self.server.fail("GET", "movie", status=503, times=2)
+        self.assertEqual(radarr.all_movies(), [])
+        self.assertEqual(radarr.connection_stats.retries, 2)
+        self.server.fail("GET", "movie", status=503, times=3)
+        with self.assertRaises(ArrException):
+            radarr.all_movies()
+        self.assertEqual(radarr.connection_stats.retries, 4)
+
+    def test_retry_after(self):
+        radarr = RadarrAPI(self.server.url, APIKEY, retry=RetryPolicy(backoff=5, max_retry_after=0.5))
+        self.server.fail("GET", "movie", status=429, headers={"Retry-After": "60"})
+        start = time.monotonic()
+        radarr.all_movies()
+        self.assertLess(time.monotonic() - start, 2)
+        self.assertEqual(radarr.connection_stats.retries, 1)
+
+    def test_retry_idempotent_only(self):
+        radarr = RadarrAPI(self.server.url, APIKEY, retry=RetryPolicy(backoff=0.01))
+        self.server.fail("POST", "tag", status=503)
+        with self.assertRaises(ArrException):
+            radarr.create_tag("new")
+        self.assertEqual(radarr.connection_stats.retries, 0)
+
+    def test_retry_in_batch(self):
+        radarr = RadarrAPI(self.server.url, APIKEY, retry=RetryPolicy(backoff=0.01))
+        self.server.fail("GET", "movie/lookup", status=502)
+        added, _, _, _ = radarr.add_multiple_movies([11, 12, 13], "/media", "HD-1080p")
+        self.assertEqual(len(added), 3)
+        self.assertEqual(self.server.count("GET", "movie/lookup"), 4)
+
+    def test_rate_limit(self):
+        limiter = RateLimiter(20, burst=1)
+        radarr = RadarrAPI(self.server.url, APIKEY, rate_limit=limiter)
+        start = time.monotonic()
+        for _ in range(5):
+            radarr.all_movies()
+        self.assertGreaterEqual(time.monotonic() - start, 0.2)
+        self.assertGreaterEqual(limiter.throttled, 5)
+
+    def test_concurrency_limit(self):
+        limiter = ConcurrencyLimiter.for_url(self.server.url, limit=8, max_limit=10)
+        self.assertIs(limiter, ConcurrencyLimiter.for_url(f"{self.server.url}/"))
+        radarr = RadarrAPI(self.server.url, APIKEY, concurrency_limit=limiter)
+        other = RadarrAPI(self.server.url, APIKEY, concurrency_limit=ConcurrencyLimiter.for_url(self.server.url))
+        self.assertIs(radarr._raw.concurrency_limit, other._raw.concurrency_limit)
+        self.server.fail("GET", "movie", status=503)
+        with self.assertRaises(ArrException):
+            radarr.all_movies()
+        self.assertEqual(limiter.limit, 4)
+        for _ in range(10):
+            other.all_movies()
+        self.assertEqual(limiter.limit, 6)
+        self.assertEqual(limiter.in_flight, 0)
+
+    def test_debug_logging(self):
+        radarr = RadarrAPI(self.server.url, APIKEY, log_body=20)
+        for i in range(5):
+            self.server.add({"title": f"Movie {i}", "tmdbId": i})
+        with self.assertLogs("arrapi.raws.base", "DEBUG") as logs:
+            radarr.all_movies()
+        record = next(r for r in logs.records if hasattr(r, "status"))
+        self.assertEqual((record.method, record.path, record.status), ("GET", "movie", 200))
+        self.assertGreater(record.bytes, 100)
+        self.assertIn(f"... [{record.bytes} total]", logs.output[-1])
+        radarr._raw.log_body = 0
+        with self.assertLogs("arrapi.raws.base", "DEBUG") as logs:
+            radarr.all_movies()
+        self.assertEqual(len(logs.records), 1)
+
+    def test_iter_movies(self):
+        radarr = RadarrAPI(self.server.url, APIKEY)
+        for i in range(1, 201):
+            self.server.add({"title": f"Movie {i}", "tmdbId": i, "overview": "x" * 500})
+        movies = list(radarr.iter_movies())
+        self.assertEqual([m.tmdbId for m in movies], list(range(1, 201)))
+        self.assertEqual(movies[-1].title, "Movie 200")
+        self.assertEqual([m.id for m in movies], [m.id for m in radarr.all_movies()])
+
+    def test_codec(self):
+        self.assertEqual(get_codec("json").dumps({"a": [1, "é"]}), '{"a":[1,"é"]}'.encode())
+        with self.assertRaises(ValueError):
+            get_codec("unknown")
+        for name in available_codecs:
+            with self.subTest(codec=name):
+                radarr = RadarrAPI(self.server.url, APIKEY, codec=name)
+                self.assertEqual(radarr._raw.codec.name, name)
+                tag = radarr.create_tag(f"tag-{name}")
+                added, _, _, _ = radarr.add_multiple_movies([100 + len(tag.label)], "/media", "HD-1080p", tags=[tag])
+                self.assertEqual(added[0].tags, [tag])
+
+    def test_coalesce(self):
+        radarr = RadarrAPI(self.server.url, APIKEY)
+        radarr.create_tag("shared")
+        self.server.delay = 0.2
+        barrier = threading.Barrier(8)
+        results = []
+
+        def get_tags():
+            barrier.wait()
+            results.append(radarr._raw.get_tag())
+
+        threads = [threading.Thread(target=get_tags) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        sent = self.server.count("GET", "tag")
+        self.assertLess(sent, 8)
+        self.assertEqual(radarr.connection_stats.coalesced, 8 - sent)
+        self.assertEqual(results[0], [{"id": 1, "label": "shared"}])
+        self.assertTrue(all(r == results[0] and r is not results[0] for r in results[1:]))
+
+    def test_singleflight(self):
+        flight = SingleFlight()
+        started, finish = threading.Event(), threading.Event()
+        results = []
+
+        def slow():
+            started.set()
+            finish.wait(5)
+            return threading.get_ident()
+
+        leader = threading.Thread(target=lambda: results.append(flight.do("key", slow)))
+        leader.start()
+        started.wait(5)
+        with self.assertRaises(DeadlineExceeded):
+            with Deadline(0.05):
+                flight.do("key", slow)
+        finish.set()
+        leader.join()
+        self.assertEqual(results, [leader.ident])
+
+        barrier = threading.Barrier(2)
+
+        async def shared():
+            await asyncio.sleep(0.1)
+            return threading.get_ident()
+
+        def run_loop():
+            barrier.wait()
+            results.append(asyncio.run(flight.do_async("key", shared)))
+
+        threads = [threading.Thread(target=run_loop) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(sorted(results[1:]), sorted(thread.ident for thread in threads))
+        self.assertEqual(flight._tasks, {})
+
+    def test_lazy_connect(self):
+        radarr = RadarrAPI(self.server.url, "bad", lazy=True)
+        self.assertEqual(self.server.requests, [])
+        with self.assertRaises(Unauthorized):
+            radarr.all_movies()
+        radarr = RadarrAPI(self.server.url, APIKEY, lazy=True)
+        self.assertTrue(radarr._raw.v4)
+        radarr.all_movies()
+        self.assertEqual(self.server.count("GET", "system/status"), 2)
+
+    def test_known_version(self):
+        radarr = RadarrAPI(self.server.url, APIKEY, version="3.2.2")
+        self.assertTrue(radarr._raw.v3)
+        self.assertFalse(radarr._raw.v4)
+        radarr.all_movies()
+        self.assertEqual(self.server.count("GET", "system/status"), 0)
+
+    def test_capability_cache(self):
+        with tempfile.TemporaryDirectory() as temp:
+            cache = CapabilityCache(os.path.join(temp, "arrapi", "capabilities.json"))
+            RadarrAPI(self.server.url, APIKEY, cache=cache)
+            self.assertEqual(cache.get(self.server.url), "4.0.0")
+            radarr = RadarrAPI(self.server.url, APIKEY, cache=cache)
+            self.assertTrue(radarr._raw.v4)
+            self.assertEqual(self.server.count("GET", "system/status"), 1)
+            RadarrAPI(self.server.url, APIKEY, cache=CapabilityCache(cache.path, ttl=0))
+            self.assertEqual(self.server.count("GET", "system/status"), 2)
+            cache.clear(self.server.url)
+            self.assertIsNone(cache.get(self.server.url))
+
+    def test_default_timeout(self):
+        radarr = RadarrAPI(self.server.url, APIKEY)
+        self.assertEqual(radarr._raw.timeout, (10, 120))
+        with Deadline(5):
+            self.assertLessEqual(radarr._raw._request_timeout()[1], 5)
+
+    def test_deadline(self):
+        radarr = RadarrAPI(self.server.url, APIKEY)
+        self.server.delay = 0.15
+        deadline = Deadline(0.5)
+        added, _, _, _ = radarr.add_multiple_movies(list(range(1, 11)), "/media", "HD-1080p", per_request=1, deadline=deadline)
+        self.assertLess(len(added), 10)
+        self.assertEqual(len(added) + len(deadline.skipped), 10)
+        self.assertEqual(sorted(m.tmdbId for m in added) + sorted(deadline.skipped), list(range(1, 11)))
+        with self.assertRaises(DeadlineExceeded):
+            with Deadline(0):
+                radarr.all_movies()
+
+    def test_circuit_breaker(self):
+        radarr = RadarrAPI(self.server.url, APIKEY, breaker=CircuitBreaker(failure_threshold=2, cool_down=0.2))
+        self.assertEqual(radarr.circuit_state, "closed")
+        self.server.fail("GET", "movie", status=503, times=2)
+        for _ in range(2):
+            with self.assertRaises(ArrException):
+                radarr.all_movies()
+        self.assertEqual(radarr.circuit_state, "open")
+        with self.assertRaises(CircuitOpen):
+            radarr.all_movies()
+        self.assertEqual(self.server.count("GET", "movie"), 2)
+        time.sleep(0.25)
+        self.assertEqual(radarr.circuit_state, "half-open")
+        self.assertEqual(radarr.all_movies(), [])
+        self.assertEqual(radarr.circuit_state, "closed")
+        self.assertEqual(self.server.count("GET", "system/status"), 2)
+
+        self.server.fail("GET", "movie", status=503, times=2)
+        for _ in range(2):
+            with self.assertRaises(ArrException):
+                radarr.all_movies()
+        time.sleep(0.25)
+        self.server.fail("GET", "system/status", status=503)
+        with self.assertRaises(CircuitOpen):
+            radarr.all_movies()
+        self.assertEqual(radarr.circuit_state, "open")
+        self.assertEqual(radarr.circuit_breaker.trips, 3)
+        self.assertEqual(self.server.count("GET", "movie"), 5)
+
+    def test_record_replay(self):
+        with tempfile.TemporaryDirectory() as temp:
+            cassette = os.path.join(temp, "radarr.jsonl")
+            radarr = RadarrAPI(self.server.url, APIKEY, transport=RecordingTransport(cassette))
+            radarr.create_tag("recorded")
+            self.server.delay = 0.05
+            added, _, _, _ = radarr.add_multiple_movies([1, 2], "/media", "HD-1080p", tags=["recorded"])
+            movies = radarr.all_movies()
+            streamed = radarr.iter_movies()
+            next(streamed)
+            with open(cassette) as f:
+                self.assertEqual(f.read().count('"path": "/api/v3/movie", '), 1)
+            self.assertEqual(len(list(streamed)), len(movies) - 1)
+            with open(cassette) as f:
+                self.assertEqual(f.read().count('"path": "/api/v3/movie", '), 2)
+            with self.assertRaises(Unauthorized):
+                RadarrAPI(self.server.url, "bad", transport=RecordingTransport(cassette))
+            with open(cassette) as f:
+                self.assertNotIn(APIKEY, f.read())
+            self.server.__exit__(None, None, None)
+
+            replay = RadarrAPI("http://replay", "other", transport=ReplayTransport(cassette))
+            replay.create_tag("recorded")
+            replayed, _, _, _ = replay.add_multiple_movies([1, 2], "/media", "HD-1080p", tags=["recorded"])
+            self.assertEqual([m.id for m in replayed], [m.id for m in added])
+            self.assertEqual([m.title for m in replay.iter_movies()], [m.title for m in movies])
+            with self.assertRaises(ArrException):
+                replay.get_movie(999)
+
+            slow = RadarrAPI("http://replay", "other", transport=ReplayTransport(cassette, latency=1.0))
+            start = time.monotonic()
+            slow.all_movies()
+            self.assertGreaterEqual(time.monotonic() - start, 0.05)
+
+    def test_metrics(self):
+        metrics = Metrics()
+        radarr = RadarrAPI(self.server.url, APIKEY, metrics=metrics)
+        radarr.add_multiple_movies([1, 2], "/media", "HD-1080p")
+        for movie in radarr.all_movies():
+            radarr.get_movie(movie.id)
+        with self.assertRaises(NotFound):
+            radarr.get_movie(999)
+        endpoints = {(m["method"], m["endpoint"]): m for m in metrics.snapshot()}
+        self.assertEqual(endpoints[("GET", "movie/{id}")]["calls"], 3)
+        self.assertEqual(endpoints[("GET", "movie/{id}")]["statuses"], {200: 2, 404: 1})
+        self.assertGreater(endpoints[("POST", "movie/import")]["request_bytes"], 0)
+        self.assertGreater(endpoints[("GET", "movie")]["response_bytes"], 0)
+        self.assertEqual(sum(endpoints[("GET", "movie")]["latency"]["buckets"].values()), 1)
+        text = radarr.metrics.prometheus()
+        self.assertIn(f'arrapi_requests_total{{instance="{self.server.url}",method="GET",endpoint="movie/{{id}}",status="404"}} 1', text)
+        self.assertIn('le="+Inf"} 3', text)
+        self.assertIsNone(RadarrAPI(self.server.url, APIKEY, metrics=False).metrics)
+
+        down = RadarrAPI("http://127.0.0.1:9", APIKEY, lazy=True, metrics=metrics, timeout=1)
+        with self.assertRaises(ArrException):
+            down.all_movies()
+        self.assertEqual(metrics.snapshot()[-1]["errors"], {"ConnectionError": 1})
+
+    def test_profile(self):
+        radarr = RadarrAPI(self.server.url, APIKEY)
+        for i in range(1, 51):
+            self.server.add({"title": f"Movie {i}", "tmdbId": i})
+        radarr.all_movies()
+        with radarr.profile() as profile:
+            radarr.all_movies()
+            radarr.get_movie(1)
+            self.assertEqual(len(list(radarr.iter_movies())), 50)
+        radarr.all_tags()
+        stats = {s["method"]: s for s in profile.stats()}
+        self.assertEqual(set(stats), {"RadarrAPI.all_movies", "RadarrAPI.get_movie", "RadarrAPI.iter_movies"})
+        for method in stats.values():
+            self.assertEqual(method["calls"], 1)
+            for phase in ("network", "decode", "build"):
+                self.assertGreater(method[phase], 0)
+            self.assertAlmostEqual(method["network"] + method["decode"] + method["build"] + method["other"], method["total"])
+        self.assertIn("RadarrAPI.all_movies", profile.report())
+
+    def test_slots(self):
+        radarr = RadarrAPI(self.server.url, APIKEY)
+        self.server.add({"title": "Slotted", "tmdbId": 5, "originalTitle": "Original", "images": [{"coverType": "poster"}]})
+        movie = radarr.all_movies()[0]
+        self.assertFalse(hasattr(movie, "__dict__"))
+        self.assertIsNone(movie._parsed)
+        self.assertFalse(hasattr(movie.images[0], "__dict__"))
+        self.assertIs(movie._parsed["images"], movie.images)
+        self.assertEqual(movie.originalTitle, "Original")
+        self.assertFalse(hasattr(movie, "profileId"))
+        with self.assertRaises(AttributeError):
+            movie.title = "Edited"
+        for copied in (copy.copy(movie), copy.deepcopy(movie), pickle.loads(pickle.dumps(movie))):
+            self.assertEqual((copied.id, copied.title, copied.images), (movie.id, movie.title, movie.images))
+            self.assertEqual(copied.originalTitle, "Original")
+            self.assertFalse(hasattr(copied.images[0], "__dict__"))
+            with self.assertRaises(AttributeError):
+                copied.title = "Edited"
+        v2 = RadarrAPI(self.server.url, APIKEY, version="0.2.0")
+        self.assertEqual(Movie(v2, data={"title": "Old", "profileId": 2}).profileId, 2)
+        self.assertIsInstance(movie.images[0], Image)
+
+    def test_pickle(self):
+        radarr = RadarrAPI(self.server.url, APIKEY, rate_limit=RateLimiter(100), concurrency_limit=ConcurrencyLimiter(2),
+                           breaker=CircuitBreaker(), metrics=Metrics())
+        tag = radarr.create_tag("pickled")
+        self.server.add({"title": "Pickled", "tmdbId": 6, "tags": [tag.id], "images": [{"coverType": "poster"}]})
+        movies = radarr.all_movies()
+        for copied in (copy.deepcopy(radarr), pickle.loads(pickle.dumps(radarr))):
+            self.assertIsNot(copied._raw.session, radarr._raw.session)
+            self.assertEqual(copied.all_movies(), movies)
+        movie = movies[0]
+        copies = [copy.deepcopy(movie), pickle.loads(pickle.dumps(movie))]
+        self.assertEqual(self.server.count("GET", f"tag/{tag.id}"), 0)
+        for copied in copies:
+            self.assertEqual((copied.id, copied.title, copied.tmdbId), (movie.id, movie.title, movie.tmdbId))
+            self.assertIsNot(copied._arr, radarr)
+            self.assertEqual(copied.tags[0].label, "pickled")
+            self.assertEqual(copied.images[0].coverType, "poster")
+            copied.reload()
+            self.assertEqual(copied.title, "Pickled")
+
+    def test_lazy_parsing(self):
+        radarr = RadarrAPI(self.server.url, APIKEY)
+        self.server.add({"title": "Parsed", "tmdbId": 7, "added": "2021-05-01T12:34:56Z", "tags": [1], "images": []})
+        movie = radarr.all_movies()[0]
+        self.assertEqual(str(movie), "[1:Parsed]")
+        self.assertIsNone(movie._parsed)
+        self.assertEqual(movie.added, datetime(2021, 5, 1, 12, 34, 56, tzinfo=timezone.utc))
+        self.assertIs(movie.tags, movie.tags)
+        self.assertEqual(movie.tagsIds, [1])
+        self.assertEqual(movie.tmdbId, 7)
+        with self.assertRaises(AttributeError):
+            movie.added = None
+
+    def test_parse_date(self):
+        self.assertEqual(parse_date("2021-05-01T12:34:56Z"), datetime(2021, 5, 1, 12, 34, 56, tzinfo=timezone.utc))
+        self.assertEqual(parse_date("2021-05-01T12:34:56.1234567Z"),
+                         datetime(2021, 5, 1, 12, 34, 56, 123456, tzinfo=timezone.utc))
+        self.assertEqual(parse_date("2021-05-01T12:34:56.5+02:00"),
+                         datetime(2021, 5, 1, 12, 34, 56, 500000, tzinfo=timezone(timedelta(hours=2))))
+        self.assertEqual(parse_date("2021-05-01T12:34:56"), datetime(2021, 5, 1, 12, 34, 56))
+        for value in ("2021-05-01T12:34:56Z", "2021-05-01T12:34:56.1234567Z", "2021-05-01T12:34:56.5+02:00"):
+            self.assertEqual(_parse_isoformat(value), parse_date(value))
+        with self.assertRaises(ValueError):
+            parse_date("yesterday")
+
+    def test_interning(self):
+        radarr = RadarrAPI(self.server.url, APIKEY)
+        for tmdb_id in (8, 9):
+            self.server.add({"title": f"Interned {tmdb_id}", "tmdbId": tmdb_id, "status": "released",
+                             "genres": ["Drama"], "images": [{"coverType": "poster"}]})
+        first, second = radarr.all_movies()
+        self.assertIs(first.status, second.status)
+        self.assertIs(first.genres[0], second.genres[0])
+        self.assertIs(first.images[0].coverType, second.images[0].coverType)
+        self.assertEqual(first.status, "released")
+
+    def test_identity_map(self):
+        radarr = RadarrAPI(self.server.url, APIKEY)
+        tag = radarr.create_tag("shared")
+        for tmdb_id in (10, 11):
+            self.server.add({"title": f"Tagged {tmdb_id}", "tmdbId": tmdb_id, "tags": [tag.id], "qualityProfileId": 1})
+        first, second = radarr.all_movies()
+        self.assertIs(first.tags[0], second.tags[0])
+        self.assertIs(first.qualityProfile, second.qualityProfile)
+        self.assertEqual([t.label for t in first.tags + second.tags], ["shared", "shared"])
+        self.assertEqual(self.server.count("GET", f"tag/{tag.id}"), 1)
+        radarr.edit_tag(tag.id, "renamed")
+        third = radarr.all_movies()[0]
+        self.assertIsNot(third.tags[0], first.tags[0])
+        self.assertEqual(third.tags[0].label, "renamed")
+        radarr.delete_tag(tag.id)
+        self.assertNotIn((type(tag), tag.id), radarr._references)
+
+    def test_prefetch(self):
+        radarr = RadarrAPI(self.server.url, APIKEY)
+        tags = [radarr.create_tag(f"prefetch{i}") for i in range(3)]
+        for i, tag in enumerate(tags):
+            self.server.add({"title": f"Prefetch {i}", "tmdbId": 20 + i, "tags": [tag.id], "qualityProfileId": i % 2 + 1})
+        movies = radarr.all_movies(prefetch=["tags", "qualityProfile"])
+        self.assertEqual([m.tags[0].label for m in movies], ["prefetch0", "prefetch1", "prefetch2"])
+        self.assertEqual([m.qualityProfile.name for m in movies], ["HD-1080p", "Any", "HD-1080p"])
+        self.assertEqual(sum(self.server.count("GET", f"tag/{t.id}") for t in tags), 0)
+        self.assertEqual(self.server.count("GET", "qualityProfile/1"), 0)
+        self.assertEqual(self.server.count("GET", "tag"), 1)
+        self.assertIs(radarr.resolve(movies, "tags"), movies)
+        self.assertEqual(self.server.count("GET", "tag"), 2)
+        with self.assertRaises(Invalid):
+            radarr.all_movies(prefetch=["languageProfile"])
+        self.assertEqual(self.server.count("GET", "movie"), 1)
+
+    def test_projection(self):
+        radarr = RadarrAPI(self.server.url, APIKEY)
+        tag = radarr.create_tag("projected")
+        for i in range(3):
+            self.server.add({"title": f"Projected {i}", "tmdbId": 30 + i, "path": f"/media/{i}", "monitored": True,
+                             "tags": [tag.id], "qualityProfileId": 2, "overview": "x" * 500, "images": []})
+        movies = radarr.all_movies(fields=["tmdbId", "path", "monitored", "tags", "qualityProfile"])
+        self.assertEqual(set(movies[0]._data), {"id", "title", "tmdbId", "path", "monitored", "tags", "qualityProfileId"})
+        self.assertEqual([m.tmdbId for m in movies], [30, 31, 32])
+        self.assertEqual((movies[0].path, movies[0].monitored, movies[0].tags, movies[0].qualityProfileId), ("/media/0", True, [tag], 2))
+        self.assertEqual(str(movies[0]), f"[{movies[0].id}:Projected 0]")
+        self.assertEqual(sum(self.server.count("GET", f"movie/{m.id}") for m in movies), 0)
+        self.assertEqual(movies[0].overview, "x" * 500)
+        self.assertEqual(self.server.count("GET", f"movie/{movies[0].id}"), 1)
+        self.assertIsNone(movies[0]._fields)
+        movies[1].edit(monitored=False)
+        self.assertEqual(self.server.count("GET", f"movie/{movies[1].id}"), 1)
+        self.assertEqual(self.server.items[movies[1].id]["overview"], "x" * 500)
+        self.assertFalse(movies[1].monitored)
+
+    def test_raw_results(self):
+        radarr = RadarrAPI(self.server.url, APIKEY)
+        for i in range(3):
+            self.server.add({"title": f"Raw {i}", "tmdbId": 40 + i, "imdbId": f"tt{40 + i:07d}", "monitored": True, "tags": [], "overview": "x"})
+        self.assertIsInstance(radarr.all_movies()[0], Movie)
+        movies = radarr.all_movies(raw=True)
+        self.assertEqual(movies, list(self.server.items.values()))
+        self.assertEqual(radarr.all_movies(fields=["tmdbId"], raw=True)[0], {"id": 1, "title": "Raw 0", "tmdbId": 40})
+        with self.assertRaises(Invalid):
+            radarr.all_movies(prefetch=["tags"], raw=True)
+        radarr.raw_results = True
+        self.assertEqual([m["tmdbId"] for m in radarr.iter_movies()], [40, 41, 42])
+        self.assertIsInstance(radarr.all_movies(raw=False)[0], Movie)
+        tag = radarr.create_tag("raw")
+        self.assertEqual(radarr.all_tags(), [{"id": tag.id, "label": "raw"}])
+        profile = radarr.quality_profile()[1]
+        edited, invalid = radarr.edit_multiple_movies(movies[:2], monitored=False, tags=radarr.all_tags())
+        self.assertEqual((len(edited), invalid), (2, []))
+        self.assertEqual([m["monitored"] for m in radarr.all_movies()], [False, False, True])
+        lookup = radarr.search_movies("tmdb:50")
+        self.assertEqual(lookup[0]["title"], "Movie 50")
+        added, existing, _, _ = radarr.add_multiple_movies(lookup + movies[2:], radarr.root_folder()[0], profile)
+        self.assertEqual(([m.tmdbId for m in added], [m.tmdbId for m in existing]), ([50], [42]))
+        self.assertEqual(self.server.items[added[0].id]["qualityProfileId"], 2)
+        self.assertEqual(radarr.delete_multiple_movies(movies), [])
+        self.assertEqual([m["tmdbId"] for m in radarr.all_movies()], [50])
+
+    def test_movies_table(self):
+        tz = os.environ.get("TZ")
+        os.environ["TZ"] = "America/New_York"
+        time.tzset()
+        self.addCleanup(time.tzset)
+        if tz is None:
+            self.addCleanup(os.environ.pop, "TZ")
+        else:
+            self.addCleanup(os.environ.__setitem__, "TZ", tz)
+        radarr = RadarrAPI(self.server.url, APIKEY)
+        self.server.add({"title": "Table 1", "tmdbId": 1, "hasFile": True, "rating": {"votes": 10, "value": 7.5},
+                         "collection": {"tmdbId": 99, "name": "Tables"}, "added": "2021-03-04T05:06:07.1234567Z",
+                         "inCinemas": "2021-03-01"})
+        self.server.add({"title": "Table 2", "tmdbId": 2})
+        columns = ["id", "title", "hasFile", "rating.value", "collection.tmdbId", "added", "inCinemas", "custom.field"]
+        table = radarr.movies_table(columns=columns, output="array")
+        self.assertEqual(list(table), columns)
+        self.assertEqual(table["collection.tmdbId"].tolist(), [99, 0])
+        self.assertEqual(table["rating.value"].tolist(), [7.5, 0.0])
+        self.assertEqual(table["hasFile"].tolist(), [1, 0])
+        self.assertEqual(table["title"], ["Table 1", "Table 2"])
+        self.assertEqual(table["added"], [datetime(2021, 3, 4, 5, 6, 7, 123456, tzinfo=timezone.utc), None])
+        self.assertEqual(table["inCinemas"], [datetime(2021, 3, 1, tzinfo=timezone.utc), None])
+        self.assertEqual(table["custom.field"], [None, None])
+        with self.assertRaises(Invalid):
+            radarr.movies_table(output="csv")
+        self.assertEqual(self.server.count("GET", "movie"), 1)
+        for output in ["numpy", "pandas", "pyarrow"]:
+            with self.subTest(output=output):
+                try:
+                    table = radarr.movies_table(columns=columns, output=output)
+                except Invalid:
+                    continue
+                if output == "pyarrow":
+                    table = table.to_pydict()
+                self.assertEqual(list(table["collection.tmdbId"]), [99, 0])
+                self.assertEqual(list(table["rating.value"]), [7.5, 0.0])
+                self.assertEqual(list(table["hasFile"]), [True, False])
+                self.assertEqual(str(table["added"][0])[:26], "2021-03-04 05:06:07.123456" if output != "numpy" else "2021-03-04T05:06:07.123456")
+                self.assertEqual(str(table["inCinemas"][0])[:19], "2021-03-01 00:00:00" if output != "numpy" else "2021-03-01T00:00:00")
+
+    def test_lazy_loads(self):
+        radarr = RadarrAPI(self.server.url, APIKEY)
+        tags = [radarr.create_tag(f"lazy{i}") for i in range(3)]
+        for i, tag in enumerate(tags):
+            self.server.add({"title": f"Lazy {i}", "tmdbId": 30 + i, "tags": [tag.id]})
+        movies = radarr.all_movies()
+        with radarr.lazy_loads() as lazy_loads:
+            labels = [movie.tags[0].label for movie in movies]
+        self.assertEqual(labels, ["lazy0", "lazy1", "lazy2"])
+        self.assertEqual(lazy_loads.total, 3)
+        stats = lazy_loads.stats()
+        self.assertEqual(len(stats), 1)
+        self.assertEqual((stats[0]["class"], stats[0]["attribute"], stats[0]["count"]), ("Tag", "label", 3))
+        self.assertIn("test_raw.py", stats[0]["site"])
+        self.assertIn("Tag.label", lazy_loads.report())
+        movies = RadarrAPI(self.server.url, APIKEY).all_movies()
+        with self.assertWarns(LazyLoadWarning), radarr.lazy_loads(threshold=1):
+            [movie.tags[0].label for movie in movies]
+        movies = RadarrAPI(self.server.url, APIKEY).all_movies()
+        with radarr.lazy_loads(threshold=1, action="raise"):
+            self.assertEqual(movies[0].tags[0].label, "lazy0")
+            with self.assertRaises(TooManyLazyLoads):
+                movies[1].tags[0].label
+        self.assertEqual(self.server.count("GET", f"tag/{tags[1].id}"), 2)
+
+    def test_lazy_fields(self):
+        radarr = RadarrAPI(self.server.url, APIKEY)
+        self.server.add({"title": "Lazy", "tmdbId": 6, "overview": None, "images": []})
+        movie = radarr.all_movies()[0]
+        for copied in (copy.deepcopy(movie), pickle.loads(pickle.dumps(movie))):
+            self.assertIsNone(copied._parsed)
+        self.assertEqual(movie.title, "Lazy")
+        self.assertEqual(self.server.count("GET", "movie/1"), 0)
+        self.assertIsNone(movie.overview)
+        self.assertIsNone(movie.overview)
+        self.assertEqual(self.server.count("GET", "movie/1"), 1)
+        self.assertEqual(movie, radarr.get_movie(movie_id=1))